@@ -0,0 +1,81 @@
+# review_queue.py
+# Measures fetching the due review queue of a user who has thousands of
+# scheduled tasks, among other users' schedules.
+# Usage: python benchmarks/review_queue.py [items per user] [users]
+
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from database.db import DatabaseConnection  # noqa: E402
+from database.init_db import initialize_tables  # noqa: E402
+from controllers.review_scheduler import ReviewScheduler, SECONDS_PER_DAY  # noqa: E402
+
+RUNS = 50
+
+
+def populate(db_path, items, users):
+    """Add `items` quiz tasks scheduled for each user, due within +/- 30 days."""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.executemany(
+        "INSERT INTO tasks (lesson_id, name, task_type) VALUES (1, ?, 'quiz')",
+        [(f"Quiz {n}",) for n in range(items)]
+    )
+    cursor.execute("SELECT id FROM tasks WHERE task_type = 'quiz'")
+    task_ids = [row[0] for row in cursor.fetchall()]
+
+    now = time.time()
+    rng = random.Random(0)
+    cursor.executemany(
+        "INSERT OR IGNORE INTO review_schedule (user_id, task_id, interval_days, repetitions, due_at) "
+        "VALUES (?, ?, 1, 1, ?)",
+        [
+            (user_id, task_id, now + rng.uniform(-30, 30) * SECONDS_PER_DAY)
+            for user_id in range(1, users + 1)
+            for task_id in task_ids
+        ]
+    )
+    conn.commit()
+    conn.close()
+
+
+def median_ms(function):
+    """Median time of RUNS calls to `function`, in milliseconds."""
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    """Print the median time to count and fetch the due reviews."""
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "benchmark.db")
+        initialize_tables(db_path)
+        populate(db_path, items, users)
+
+        db = DatabaseConnection()
+        db.db_path = db_path
+        scheduler = ReviewScheduler(db)
+
+        print(f"Scheduled tasks: {items} per user, {users} users")
+        print(f"  Due reviews:          {scheduler.count_due_reviews()}")
+        print(f"  count_due_reviews():  {median_ms(scheduler.count_due_reviews):6.2f} ms")
+        print(f"  get_due_reviews(20):  {median_ms(scheduler.get_due_reviews):6.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
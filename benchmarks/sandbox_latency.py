@@ -0,0 +1,72 @@
+# sandbox_latency.py
+# Compares exercise execution latency with a new sandbox process per run
+# (cold) and with pre-started pool workers (warm), for the exercises
+# seeded by database/init_db.py.
+# Usage: python benchmarks/sandbox_latency.py [runs]
+
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from database.init_db import initialize_tables  # noqa: E402
+from utils.sandbox import SandboxPool, run_code  # noqa: E402
+
+# Time given to the pool to start a replacement worker between two runs,
+# as happens between two submissions in the application
+REFILL_PAUSE = 0.3
+
+
+def seeded_exercises():
+    """Return (lesson name, solution, stdin) for every seeded exercise."""
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "benchmark.db")
+        initialize_tables(db_path)
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("""
+            SELECT l.name, e.solution, e.stdin
+            FROM exercise e JOIN lessons l ON l.id = e.lesson_id
+            ORDER BY e.id
+        """).fetchall()
+        conn.close()
+    return rows
+
+
+def measure(run, code, stdin, runs):
+    """Run code `runs` times with `run` and return the timings in ms."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = run(code, stdin)
+        timings.append((time.perf_counter() - start) * 1000)
+        if not result.ok:
+            sys.exit(f"✗ Execution failed: {result.status} {result.error}")
+        time.sleep(REFILL_PAUSE)
+    return timings
+
+
+def main():
+    """Print median cold and warm latency for each seeded exercise."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    pool = SandboxPool()
+    pool.warm_up()
+    time.sleep(REFILL_PAUSE)
+
+    print(f"Runs per exercise: {runs}")
+    print(f"  {'Exercise':<28} {'Cold':>9} {'Warm':>9}")
+    for name, solution, stdin in seeded_exercises():
+        cold = statistics.median(measure(run_code, solution, stdin, runs))
+        warm = statistics.median(measure(pool.run, solution, stdin, runs))
+        print(f"  {name:<28} {cold:6.1f} ms {warm:6.1f} ms")
+
+    pool.close()
+
+
+if __name__ == '__main__':
+    main()
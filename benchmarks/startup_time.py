@@ -0,0 +1,55 @@
+# startup_time.py
+# Measures the time to first paint of the home screen, comparing lazy view
+# construction (default) with building every view up front.
+# Usage: python benchmarks/startup_time.py [runs]
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_SCRIPT = os.path.join(PROJECT_ROOT, 'main.py')
+PAINT_PATTERN = re.compile(r"First paint after ([\d.]+) ms")
+
+
+def measure(extra_args, runs):
+    """Run main.py --startup-time `runs` times and return the timings in ms."""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, MAIN_SCRIPT, '--startup-time', *extra_args],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        match = PAINT_PATTERN.search(result.stdout)
+        if not match:
+            print(result.stdout + result.stderr)
+            sys.exit("✗ main.py did not report a first paint time")
+        timings.append(float(match.group(1)))
+    return timings
+
+
+def main():
+    """Print median time to first paint for lazy and eager view construction."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    # Warm the OS file cache so the first measured run is not an outlier
+    measure([], 1)
+
+    lazy = measure([], runs)
+    eager = measure(['--eager-views'], runs)
+
+    lazy_median = statistics.median(lazy)
+    eager_median = statistics.median(eager)
+    print(f"Runs per mode: {runs}")
+    print(f"  Eager views : {eager_median:8.1f} ms (median)")
+    print(f"  Lazy views  : {lazy_median:8.1f} ms (median)")
+    print(f"  Gain        : {eager_median - lazy_median:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+# achievements.py
+# Rule-based achievements unlocked from progression events.
+# Each event updates a few running counters, then only the rules indexed
+# under its type are checked; progression is never re-scanned, except
+# once to seed the counters of a database created before achievements.
+
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, List, Optional, Set, Tuple, Type
+
+from database.db import DatabaseConnection
+from controllers.progression_events import (
+    ProgressionEventBus,
+    TaskCompleted,
+    TaskReopened,
+    TaskAttempted,
+    ModuleCompleted,
+    TypingSessionRecorded,
+    AchievementUnlocked,
+)
+from utils.activity_series import streaks
+
+
+@dataclass(frozen=True)
+class AchievementRule:
+    """An achievement unlocked once `counter` reaches `threshold`.
+
+    `events` lists the event types that can move the counter; the rule is
+    only evaluated when one of them is published.
+    """
+    achievement_id: str
+    icon: str
+    title: str
+    description: str
+    counter: str
+    threshold: float
+    events: Tuple[Type, ...]
+
+
+ACHIEVEMENT_RULES: Tuple[AchievementRule, ...] = (
+    AchievementRule("tasks_1", "👣", "Premiers pas", "Compléter une première tâche",
+                    "completed_tasks", 1, (TaskCompleted,)),
+    AchievementRule("tasks_10", "📘", "Apprenti", "Compléter 10 tâches",
+                    "completed_tasks", 10, (TaskCompleted,)),
+    AchievementRule("tasks_50", "📚", "Persévérant", "Compléter 50 tâches",
+                    "completed_tasks", 50, (TaskCompleted,)),
+    AchievementRule("tasks_100", "🎓", "Expert", "Compléter 100 tâches",
+                    "completed_tasks", 100, (TaskCompleted,)),
+    AchievementRule("modules_1", "🏁", "Module terminé", "Terminer un module",
+                    "completed_modules", 1, (ModuleCompleted,)),
+    AchievementRule("modules_3", "🧭", "Explorateur", "Terminer 3 modules",
+                    "completed_modules", 3, (ModuleCompleted,)),
+    AchievementRule("streak_7", "🔥", "Semaine parfaite", "Réussir une tâche 7 jours d'affilée",
+                    "current_streak", 7, (TaskAttempted,)),
+    AchievementRule("streak_30", "🌟", "Assidu", "Réussir une tâche 30 jours d'affilée",
+                    "current_streak", 30, (TaskAttempted,)),
+    AchievementRule("wpm_30", "⌨️", "Doigts agiles", "Réussir un typing à 30 mots/min",
+                    "best_wpm", 30, (TypingSessionRecorded,)),
+    AchievementRule("wpm_50", "⚡", "Dactylo", "Réussir un typing à 50 mots/min",
+                    "best_wpm", 50, (TypingSessionRecorded,)),
+    AchievementRule("wpm_80", "🚀", "Virtuose du clavier", "Réussir un typing à 80 mots/min",
+                    "best_wpm", 80, (TypingSessionRecorded,)),
+)
+
+# Prefix of the counters flagging each completed module, so that a module
+# completed again after a failure is not counted twice
+MODULE_FLAG_PREFIX = "module:"
+
+
+class AchievementEngine:
+    """Keeps achievement counters up to date and unlocks achievements.
+
+    Counters and unlocked achievements are loaded when the engine is
+    created, before any event can be published (seeding them later would
+    count the triggering event twice), and kept in memory; each event
+    writes back only the counters it changed.
+    Subscribes to the bus itself, so it must live as long as the bus
+    (it is owned by the ServiceContainer).
+    """
+
+    def __init__(self, db: Optional[DatabaseConnection] = None,
+                 events: Optional[ProgressionEventBus] = None,
+                 rules: Tuple[AchievementRule, ...] = ACHIEVEMENT_RULES,
+                 user_id: int = 1):
+        self.db = db or DatabaseConnection()
+        self.events = events
+        self.rules = rules
+        self.user_id = user_id
+
+        # Event type -> rules that may unlock when it is published
+        self._rules_by_event: Dict[Type, List[AchievementRule]] = {}
+        for rule in rules:
+            for event_type in rule.events:
+                self._rules_by_event.setdefault(event_type, []).append(rule)
+
+        # Event type -> counter update, returning the counters it changed
+        self._updaters: Dict[Type, Callable] = {
+            TaskCompleted: self._on_task_completed,
+            TaskReopened: self._on_task_reopened,
+            ModuleCompleted: self._on_module_completed,
+            TaskAttempted: self._on_task_attempted,
+            TypingSessionRecorded: self._on_typing_session,
+        }
+
+        self._counters: Optional[Dict[str, float]] = None
+        self._unlocked: Set[str] = set()
+
+        self._ensure_loaded()
+        if events is not None:
+            for event_type in set(self._updaters) | set(self._rules_by_event):
+                events.subscribe(event_type, self.handle_event)
+
+    # ------------------------------------------------------------------
+    # Event handling
+    # ------------------------------------------------------------------
+    def handle_event(self, event) -> List[AchievementRule]:
+        """
+        Update the counters moved by an event and check the rules it affects.
+
+        Args:
+            event: A progression event
+
+        Returns:
+            The rules unlocked by this event
+        """
+        updater = self._updaters.get(type(event))
+        changed = updater(event) if updater is not None else {}
+
+        unlocked = [
+            rule for rule in self._rules_by_event.get(type(event), [])
+            if rule.achievement_id not in self._unlocked
+            and self._counters.get(rule.counter, 0) >= rule.threshold
+        ]
+        if changed or unlocked:
+            self._save(changed, unlocked)
+
+        for rule in unlocked:
+            self._unlocked.add(rule.achievement_id)
+            if self.events is not None:
+                self.events.publish(AchievementUnlocked(rule.achievement_id, rule.title))
+        return unlocked
+
+    def _on_task_completed(self, event: TaskCompleted) -> Dict[str, float]:
+        return self._add("completed_tasks", 1)
+
+    def _on_task_reopened(self, event: TaskReopened) -> Dict[str, float]:
+        if self._counters.get("completed_tasks", 0) <= 0:
+            return {}
+        return self._add("completed_tasks", -1)
+
+    def _on_module_completed(self, event: ModuleCompleted) -> Dict[str, float]:
+        flag = f"{MODULE_FLAG_PREFIX}{event.module_id}"
+        if self._counters.get(flag):
+            return {}
+        self._counters[flag] = 1
+        return {flag: 1, **self._add("completed_modules", 1)}
+
+    def _on_task_attempted(self, event: TaskAttempted) -> Dict[str, float]:
+        # Same rule as the statistics page: only days with a success count
+        if not event.success:
+            return {}
+        today = self._today().toordinal()
+        last_day = self._counters.get("last_active_day", 0)
+        if today == last_day:
+            return {}
+
+        streak = self._counters.get("current_streak", 0) + 1 if today == last_day + 1 else 1
+        self._counters["last_active_day"] = today
+        self._counters["current_streak"] = streak
+        return {"last_active_day": today, "current_streak": streak}
+
+    def _on_typing_session(self, event: TypingSessionRecorded) -> Dict[str, float]:
+        if not event.success or event.wpm <= self._counters.get("best_wpm", 0):
+            return {}
+        self._counters["best_wpm"] = event.wpm
+        return {"best_wpm": event.wpm}
+
+    def _add(self, name: str, amount: float) -> Dict[str, float]:
+        """Add `amount` to a counter and return it as changed."""
+        value = self._counters.get(name, 0) + amount
+        self._counters[name] = value
+        return {name: value}
+
+    @staticmethod
+    def _today() -> date:
+        return date.today()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _ensure_loaded(self) -> None:
+        """Read the counters and unlocked achievements, seeding them if needed."""
+        if self._counters is not None:
+            return
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT name, value FROM achievement_counters WHERE user_id = ?",
+            (self.user_id,)
+        )
+        counters = dict(cursor.fetchall())
+        cursor.execute(
+            "SELECT achievement_id FROM achievements WHERE user_id = ?",
+            (self.user_id,)
+        )
+        self._unlocked = {row[0] for row in cursor.fetchall()}
+
+        seeded = not counters
+        if seeded:
+            counters = self._seed_counters(cursor)
+        conn.close()
+        self._counters = counters
+
+        if seeded:
+            # Progress made before achievements existed
+            reached = [
+                rule for rule in self.rules
+                if counters.get(rule.counter, 0) >= rule.threshold
+            ]
+            self._save(counters, reached)
+            self._unlocked |= {rule.achievement_id for rule in reached}
+
+    def _seed_counters(self, cursor) -> Dict[str, float]:
+        """Compute the counters from existing progress, once per user."""
+        cursor.execute("""
+            SELECT COUNT(*) FROM progression
+            WHERE user_id = ? AND status = 'completed' AND task_id IS NOT NULL
+        """, (self.user_id,))
+        counters: Dict[str, float] = {"completed_tasks": cursor.fetchone()[0]}
+
+        # Modules with at least one task and none left to complete
+        cursor.execute("""
+            SELECT l.module_id FROM tasks t
+            JOIN lessons l ON l.id = t.lesson_id
+            LEFT JOIN progression p
+                ON p.task_id = t.id AND p.user_id = ? AND p.status = 'completed'
+            GROUP BY l.module_id
+            HAVING COUNT(*) = COUNT(p.id)
+        """, (self.user_id,))
+        module_ids = [row[0] for row in cursor.fetchall()]
+        counters["completed_modules"] = len(module_ids)
+        for module_id in module_ids:
+            counters[f"{MODULE_FLAG_PREFIX}{module_id}"] = 1
+
+        cursor.execute("""
+            SELECT DISTINCT date(attempted_at, 'unixepoch', 'localtime') AS day
+            FROM attempts WHERE user_id = ? AND success = 1 ORDER BY day
+        """, (self.user_id,))
+        active_days = [date.fromisoformat(row[0]) for row in cursor.fetchall()]
+        today = self._today()
+        current, _ = streaks(active_days, today)
+        counters["current_streak"] = current
+        counters["last_active_day"] = active_days[-1].toordinal() if active_days else 0
+
+        cursor.execute(
+            "SELECT MAX(wpm) FROM typing_sessions WHERE user_id = ? AND success = 1",
+            (self.user_id,)
+        )
+        counters["best_wpm"] = cursor.fetchone()[0] or 0
+        return counters
+
+    def _save(self, counters: Dict[str, float], unlocked: List[AchievementRule]) -> None:
+        """Write changed counters and newly unlocked achievements in one transaction."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT INTO achievement_counters (user_id, name, value) VALUES (?, ?, ?)
+            ON CONFLICT(user_id, name) DO UPDATE SET value = excluded.value
+        """, [(self.user_id, name, value) for name, value in counters.items()])
+        now = time.time()
+        cursor.executemany(
+            "INSERT OR IGNORE INTO achievements (user_id, achievement_id, unlocked_at) "
+            "VALUES (?, ?, ?)",
+            [(self.user_id, rule.achievement_id, now) for rule in unlocked]
+        )
+        conn.commit()
+        conn.close()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def get_achievements(self) -> List[Dict]:
+        """
+        Every achievement with its state, read from the database only.
+
+        Safe to call from a worker thread: the in-memory state is not used.
+
+        Returns:
+            List of dicts with keys achievement_id, icon, title, description,
+            unlocked, unlocked_at, progress, threshold
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT achievement_id, unlocked_at FROM achievements WHERE user_id = ?",
+            (self.user_id,)
+        )
+        unlocked = dict(cursor.fetchall())
+        cursor.execute(
+            "SELECT name, value FROM achievement_counters WHERE user_id = ?",
+            (self.user_id,)
+        )
+        counters = dict(cursor.fetchall())
+        conn.close()
+
+        # The stored streak is only updated on active days: it is over once
+        # a whole day has passed without a success
+        if counters.get("last_active_day", 0) < self._today().toordinal() - 1:
+            counters["current_streak"] = 0
+
+        return [
+            {
+                "achievement_id": rule.achievement_id,
+                "icon": rule.icon,
+                "title": rule.title,
+                "description": rule.description,
+                "unlocked": rule.achievement_id in unlocked,
+                "unlocked_at": unlocked.get(rule.achievement_id),
+                "progress": min(counters.get(rule.counter, 0), rule.threshold),
+                "threshold": rule.threshold,
+            }
+            for rule in self.rules
+        ]
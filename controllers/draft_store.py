@@ -0,0 +1,76 @@
+# draft_store.py
+# In-progress answers (typing, exercise code, free-text quiz answers)
+# saved per (user, task), so that they survive navigation and crashes.
+
+import time
+from typing import Dict, Optional
+
+from database.db import DatabaseConnection
+
+
+class DraftStore:
+    """The latest unsubmitted answer of each task, with the item it answers.
+
+    Writes come in batches from the GUI's debounced autosave; an empty
+    content deletes the draft.
+    """
+
+    def __init__(self, db: Optional[DatabaseConnection] = None):
+        self.db = db or DatabaseConnection()
+
+    def load(self, task_id: int, user_id: int = 1) -> Optional[Dict]:
+        """
+        Return the saved draft of a task.
+
+        Args:
+            task_id: The task ID
+            user_id: The user ID (default 1 for single-user mode)
+
+        Returns:
+            Dict with keys item_id and content, or None without a draft
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT item_id, content FROM drafts WHERE user_id = ? AND task_id = ?",
+            (user_id, task_id)
+        )
+        row = cursor.fetchone()
+        conn.close()
+
+        if row is None:
+            return None
+        return {"item_id": row[0], "content": row[1]}
+
+    def save_many(self, drafts: Dict[int, Dict], user_id: int = 1) -> None:
+        """
+        Store several drafts in one transaction.
+
+        Args:
+            drafts: Task ID -> dict with keys item_id and content; an empty
+                content deletes the task's draft
+            user_id: The user ID (default 1 for single-user mode)
+        """
+        now = time.time()
+        saved = [
+            (user_id, task_id, draft["item_id"], draft["content"], now)
+            for task_id, draft in drafts.items() if draft["content"]
+        ]
+        deleted = [
+            (user_id, task_id)
+            for task_id, draft in drafts.items() if not draft["content"]
+        ]
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT INTO drafts (user_id, task_id, item_id, content, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(user_id, task_id) DO UPDATE SET
+                item_id = excluded.item_id,
+                content = excluded.content,
+                updated_at = excluded.updated_at
+        """, saved)
+        cursor.executemany("DELETE FROM drafts WHERE user_id = ? AND task_id = ?", deleted)
+        conn.commit()
+        conn.close()
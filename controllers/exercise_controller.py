@@ -1,12 +1,35 @@
 # exercise_controller.py
 # Controller for exercise logic
+# Grades exercises by running the learner's code and the reference solution
+# in the sandbox and comparing what they print. The test cases of an
+# exercise run side by side, each in its own sandbox worker.
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from utils.sandbox import (
+    DEFAULT_LIMITS,
+    ExecutionLimits,
+    ExecutionResult,
+    SandboxError,
+    SandboxPool,
+    run_code,
+)
+
 
 class ExerciseController:
     """
     Handles logic for exercises.
     """
-    def __init__(self):
-        pass
+    def __init__(self, limits: ExecutionLimits = DEFAULT_LIMITS,
+                 pool: Optional[SandboxPool] = None, fail_fast: bool = True):
+        self.limits = limits
+        # Pre-started workers; without a pool each run starts a new process
+        self.pool = pool
+        # Stop grading at the first failed test case
+        self.fail_fast = fail_fast
+        # (solution, stdin) -> output of the reference solution
+        self._reference_outputs: Dict[Tuple[str, str], str] = {}
 
     def load_exercises(self):
         """
@@ -19,3 +42,186 @@ class ExerciseController:
         Adds a new exercise.
         """
         pass
+
+    # ------------------------------------------------------------------
+    # Execution-based grading
+    # ------------------------------------------------------------------
+
+    def warm_up(self) -> None:
+        """Start the sandbox workers ahead of the first submission."""
+        if self.pool is not None:
+            self.pool.warm_up()
+
+    def _run(self, code: str, stdin: str, assertion: str = "") -> ExecutionResult:
+        """Run code in a pooled worker if available, else in a new process."""
+        if self.pool is not None:
+            return self.pool.run(code, stdin, self.limits, assertion)
+        return run_code(code, stdin, self.limits, assertion)
+
+    def grade(self, solution: str, user_code: str, tests: List[Dict],
+              grading: str = "output") -> Tuple[bool, str, List[Dict]]:
+        """
+        Run the learner's code against every test case of an exercise.
+
+        Cases run in parallel; with fail_fast, grading returns at the
+        lowest-numbered failure and the cases after it are reported as
+        skipped, so the outcome does not depend on which case ends first.
+        Blocking (up to the wall-clock limit): call it off the GUI thread.
+
+        Args:
+            solution: Reference solution of the exercise
+            user_code: Code written by the learner
+            tests: Dicts with keys stdin, expected_output (None to use the
+                solution's output) and assertion (snippet run after the code)
+            grading: "output" to require the expected output exactly, "lines"
+                for open-ended exercises that only need as many lines
+
+        Returns:
+            Tuple (success, message, case results). Each case result is a
+            dict with keys number, status ("passed", "failed", "skipped"),
+            message and, for cases that ran, deterministic (False after a
+            timeout or resource kill).
+
+        Raises:
+            SandboxError: If the sandbox is unusable or the solution itself fails
+        """
+        results: Dict[int, Dict] = {}
+        executor = ThreadPoolExecutor(max_workers=self._max_parallel(len(tests)))
+        try:
+            futures = [
+                executor.submit(self._run_case, number, test, solution, user_code, grading)
+                for number, test in enumerate(tests, start=1)
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result["number"]] = result
+                if self.fail_fast and result["status"] == "failed":
+                    # An earlier case may fail too: wait for those before stopping
+                    for earlier in futures[:result["number"] - 1]:
+                        earlier_result = earlier.result()
+                        results[earlier_result["number"]] = earlier_result
+                    break
+        finally:
+            # Running cases finish in the background; pending ones are dropped
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        last_number = len(tests)
+        if self.fail_fast:
+            # Cases after the first failure may or may not have ended
+            last_number = min(
+                (number for number, result in results.items() if result["status"] == "failed"),
+                default=last_number
+            )
+        case_results = [
+            results[number] if number <= last_number and number in results
+            else {"number": number, "status": "skipped", "message": "Non exécuté"}
+            for number in range(1, len(tests) + 1)
+        ]
+        failures = [result for result in case_results if result["status"] == "failed"]
+
+        if not failures:
+            message = "Excellent ! Code correct ! ✓"
+            if len(tests) > 1:
+                message += f" ({len(tests)}/{len(tests)} tests réussis)"
+            return True, message, case_results
+
+        failure = failures[0]
+        if len(tests) == 1:
+            return False, failure["message"], case_results
+        return False, f"Test {failure['number']}/{len(tests)} échoué.\n{failure['message']}", case_results
+
+    def _max_parallel(self, case_count: int) -> int:
+        """Number of cases run at the same time."""
+        workers = self.pool.size if self.pool is not None else 4
+        return max(1, min(case_count, workers))
+
+    def _run_case(self, number: int, test: Dict, solution: str, user_code: str,
+                  grading: str) -> Dict:
+        """Run one test case and compare its output. Called on executor threads."""
+        stdin = test.get("stdin") or ""
+        expected = test.get("expected_output")
+        if expected is None:
+            expected = self._reference_output(solution, stdin)
+
+        result = self._run(user_code, stdin, test.get("assertion") or "")
+        if not result.ok:
+            passed, message = False, self._describe_failure(result)
+        elif grading == "lines":
+            passed, message = self._compare_line_counts(expected, result.stdout)
+        else:
+            passed, message = self._compare_outputs(expected, result.stdout)
+
+        return {
+            "number": number,
+            "status": "passed" if passed else "failed",
+            "message": message,
+            # Timeouts and resource kills depend on the machine's load
+            "deterministic": result.status not in ("timeout", "crashed"),
+        }
+
+    def _reference_output(self, solution: str, stdin: str) -> str:
+        """Output of the reference solution, run once per (solution, stdin)."""
+        key = (solution, stdin)
+        if key not in self._reference_outputs:
+            result = self._run(solution, stdin)
+            if not result.ok:
+                raise SandboxError(f"La solution de référence a échoué : {result.error}")
+            self._reference_outputs[key] = result.stdout
+        return self._reference_outputs[key]
+
+    @staticmethod
+    def _describe_failure(result: ExecutionResult) -> str:
+        """Feedback message for code that did not run to completion."""
+        if result.status == "timeout":
+            return "Votre programme a dépassé le temps limite. Vérifiez qu'il ne boucle pas à l'infini."
+        if result.status == "assertion_failed":
+            return f"Vérification échouée : {result.error}"
+        if result.status == "crashed":
+            return (
+                "Votre programme a été arrêté : temps de calcul ou mémoire dépassé. "
+                "Vérifiez qu'il ne boucle pas à l'infini."
+            )
+        location = f" (ligne {result.line})" if result.line else ""
+        return f"Erreur lors de l'exécution{location} :\n{result.error}"
+
+    @staticmethod
+    def _output_lines(output: str) -> List[str]:
+        """Output lines without trailing spaces or trailing blank lines."""
+        lines = [line.rstrip() for line in output.splitlines()]
+        while lines and not lines[-1]:
+            lines.pop()
+        return lines
+
+    def _compare_line_counts(self, expected: str, actual: str) -> Tuple[bool, str]:
+        """Check that the output has as many non-empty lines as expected."""
+        expected_count = sum(1 for line in self._output_lines(expected) if line)
+        actual_count = sum(1 for line in self._output_lines(actual) if line)
+
+        if actual_count == expected_count:
+            return True, "Excellent ! Code correct ! ✓"
+        if actual_count == 0:
+            return False, "Votre programme n'affiche rien."
+        return False, (
+            f"Votre programme doit afficher {expected_count} ligne(s), "
+            f"il en affiche {actual_count}."
+        )
+
+    def _compare_outputs(self, expected: str, actual: str) -> Tuple[bool, str]:
+        """Compare outputs line by line and describe the first difference."""
+        expected_lines = self._output_lines(expected)
+        actual_lines = self._output_lines(actual)
+
+        if expected_lines == actual_lines:
+            return True, "Excellent ! Code correct ! ✓"
+        if not actual_lines:
+            return False, "Votre programme n'affiche rien."
+
+        for number, (want, got) in enumerate(zip(expected_lines, actual_lines), start=1):
+            if want != got:
+                return False, (
+                    f"La sortie ne correspond pas (ligne {number}).\n"
+                    f"Attendu : {want}\nObtenu : {got}"
+                )
+        if len(actual_lines) < len(expected_lines):
+            return False, f"Il manque des lignes à la sortie ({len(actual_lines)}/{len(expected_lines)})."
+        return False, f"Votre programme affiche trop de lignes ({len(actual_lines)} au lieu de {len(expected_lines)})."
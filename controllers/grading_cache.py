@@ -0,0 +1,85 @@
+# grading_cache.py
+# Persistent cache of exercise grading verdicts for PyLearn Desktop.
+# Verdicts are keyed by a hash of the exercise, its content and the
+# canonical form of the submitted code, and evicted least recently used.
+
+import hashlib
+import json
+import time
+from typing import Dict, Optional
+
+from database.db import DatabaseConnection
+
+
+class GradingCache:
+    """SQLite-backed verdict cache with a least-recently-used size cap."""
+
+    def __init__(self, db: Optional[DatabaseConnection] = None, max_entries: int = 5000):
+        self.db = db or DatabaseConnection()
+        self.max_entries = max_entries
+
+    @staticmethod
+    def make_key(exercise_id: int, content_version: str, canonical_code: str) -> str:
+        """Hash identifying one submission of one version of an exercise."""
+        digest = hashlib.sha256()
+        for part in (str(exercise_id), content_version, canonical_code):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @staticmethod
+    def content_version(exercise_data: Dict) -> str:
+        """Hash of everything grading depends on, so edited exercises miss."""
+        content = [exercise_data["solution"], exercise_data["grading"], exercise_data["tests"]]
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Return a cached verdict and mark it as recently used.
+
+        Returns:
+            Dict with keys success, message, tests, or None on a miss
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT success, message, tests FROM grading_cache WHERE key = ?", (key,)
+        )
+        row = cursor.fetchone()
+        if row:
+            cursor.execute(
+                "UPDATE grading_cache SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            conn.commit()
+        conn.close()
+
+        if not row:
+            return None
+        return {"success": bool(row[0]), "message": row[1], "tests": json.loads(row[2])}
+
+    def put(self, key: str, success: bool, message: str, tests: list) -> None:
+        """Store a verdict, evicting the least recently used beyond the cap."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            INSERT OR REPLACE INTO grading_cache (key, success, message, tests, last_used)
+            VALUES (?, ?, ?, ?, ?)
+        """, (key, int(success), message, json.dumps(tests), time.time()))
+        cursor.execute("""
+            DELETE FROM grading_cache WHERE last_used < (
+                SELECT last_used FROM grading_cache
+                ORDER BY last_used DESC LIMIT 1 OFFSET ?
+            )
+        """, (self.max_entries - 1,))
+
+        conn.commit()
+        conn.close()
+
+    def clear(self) -> None:
+        """Remove every cached verdict."""
+        conn = self.db.get_connection()
+        conn.execute("DELETE FROM grading_cache")
+        conn.commit()
+        conn.close()
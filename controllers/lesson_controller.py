@@ -8,8 +8,9 @@ from database.db import DatabaseConnection
 class LessonController:
     """Controller for lesson-related operations."""
 
-    def __init__(self):
-        self.db = DatabaseConnection()
+    def __init__(self, db: Optional[DatabaseConnection] = None):
+        # Shared data layer when provided by the ServiceContainer
+        self.db = db or DatabaseConnection()
 
     def load_lessons(self, module_id: int) -> List[Dict]:
         """
@@ -0,0 +1,62 @@
+# progress_snapshot.py
+# Last computed progress summaries, persisted for instant display.
+# Views paint the stored snapshot right away, recompute the summary in
+# the background and save the fresh result (stale-while-revalidate).
+
+import json
+import time
+from typing import Dict, Optional
+
+from database.db import DatabaseConnection
+
+
+class ProgressSnapshotStore:
+    """One JSON summary per (user, name), e.g. "home" or "statistics".
+
+    Reading or writing a snapshot is a primary-key lookup on a single row;
+    no aggregate query runs here.
+    """
+
+    def __init__(self, db: Optional[DatabaseConnection] = None):
+        self.db = db or DatabaseConnection()
+
+    def load(self, name: str, user_id: int = 1) -> Optional[Dict]:
+        """
+        Return the last saved snapshot.
+
+        Args:
+            name: Snapshot name
+            user_id: The user ID (default 1 for single-user mode)
+
+        Returns:
+            The saved dict, or None if there is none (or it is unreadable)
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT data FROM progress_snapshots WHERE user_id = ? AND name = ?",
+            (user_id, name)
+        )
+        row = cursor.fetchone()
+        conn.close()
+
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None
+
+    def save(self, name: str, data: Dict, user_id: int = 1) -> None:
+        """Replace the snapshot `name` with freshly computed data."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO progress_snapshots (user_id, name, data, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(user_id, name) DO UPDATE SET
+                data = excluded.data,
+                updated_at = excluded.updated_at
+        """, (user_id, name, json.dumps(data), time.time()))
+        conn.commit()
+        conn.close()
@@ -0,0 +1,109 @@
+# progression_events.py
+# Typed progression-change events and a lightweight publish/subscribe bus
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Type
+
+
+# ----------------------------------------------------------------------
+# Event types
+# ----------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class TaskCompleted:
+    """A task went from not completed to completed."""
+    task_id: int
+    lesson_id: int
+    module_id: int
+    task_type: str
+
+
+@dataclass(frozen=True)
+class TaskReopened:
+    """A previously completed task was failed and is no longer completed."""
+    task_id: int
+    lesson_id: int
+    module_id: int
+    task_type: str
+
+
+@dataclass(frozen=True)
+class TaskAttempted:
+    """A validation was recorded, whatever its outcome."""
+    task_id: int
+    lesson_id: int
+    module_id: int
+    task_type: str
+    success: bool
+
+
+@dataclass(frozen=True)
+class TaskUnlocked:
+    """A task became available to the learner."""
+    task_id: int
+    lesson_id: int
+    module_id: int
+
+
+@dataclass(frozen=True)
+class LessonCompleted:
+    """Every task of a lesson is now completed."""
+    lesson_id: int
+    module_id: int
+
+
+@dataclass(frozen=True)
+class ModuleCompleted:
+    """Every task of a module is now completed."""
+    module_id: int
+
+
+@dataclass(frozen=True)
+class TypingSessionRecorded:
+    """The metrics of a typing attempt were stored."""
+    task_id: int
+    wpm: float
+    accuracy: float
+    success: bool
+
+
+@dataclass(frozen=True)
+class AchievementUnlocked:
+    """An achievement was unlocked for the first time."""
+    achievement_id: str
+    title: str
+
+
+# ----------------------------------------------------------------------
+# Event bus
+# ----------------------------------------------------------------------
+
+class ProgressionEventBus:
+    """Dispatches progression events to the callbacks subscribed to their type.
+
+    Controllers publish after their database writes succeed; views subscribe
+    and patch only the rows affected by the event. Callbacks run
+    synchronously on the publishing thread, so events must be published
+    from the GUI thread.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: Dict[Type, List[Callable]] = {}
+        # Incremented on every publish; lets callers detect stale state
+        self.revision = 0
+
+    def subscribe(self, event_type: Type, callback: Callable) -> None:
+        """Call `callback(event)` whenever an event of `event_type` is published."""
+        self._subscribers.setdefault(event_type, []).append(callback)
+
+    def unsubscribe(self, event_type: Type, callback: Callable) -> None:
+        """Remove a callback previously registered with subscribe()."""
+        callbacks = self._subscribers.get(event_type, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def publish(self, event) -> None:
+        """Deliver an event to every subscriber of its type."""
+        self.revision += 1
+        for callback in list(self._subscribers.get(type(event), [])):
+            callback(event)
@@ -1,8 +1,10 @@
 # progression_manager.py
 # Manager for user progression logic and progress calculation
 
-from typing import Dict
+from datetime import date, timedelta
+from typing import Dict, List, Optional
 from database.db import DatabaseConnection
+from utils.activity_series import dense_daily, rolling_sum, streaks, weekly_totals
 
 
 class ProgressionManager:
@@ -11,8 +13,9 @@ class ProgressionManager:
     Provides methods to get progress percentages for modules, lessons, and tasks.
     """
 
-    def __init__(self):
-        self.db = DatabaseConnection()
+    def __init__(self, db: Optional[DatabaseConnection] = None):
+        # Shared data layer when provided by the ServiceContainer
+        self.db = db or DatabaseConnection()
 
     # ------------------------------------------------------------------
     # Progress Calculation Methods
@@ -104,6 +107,72 @@ class ProgressionManager:
             "percent": percent
         }
 
+    def get_modules_progress(self, user_id: int = 1) -> Dict[int, Dict]:
+        """
+        Calculate progress for every module in a single query.
+
+        Args:
+            user_id: The user ID (default 1 for single-user mode)
+
+        Returns:
+            Dict mapping module_id to a dict with keys: completed, total, percent
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT l.module_id, COUNT(DISTINCT t.id), COUNT(DISTINCT p.task_id)
+            FROM tasks t
+            JOIN lessons l ON t.lesson_id = l.id
+            LEFT JOIN progression p
+                ON p.task_id = t.id AND p.user_id = ? AND p.status = 'completed'
+            GROUP BY l.module_id
+        """, (user_id,))
+        rows = cursor.fetchall()
+        conn.close()
+
+        return {module_id: self._progress_dict(completed, total)
+                for module_id, total, completed in rows}
+
+    def get_lessons_progress(self, module_id: int, user_id: int = 1) -> Dict[int, Dict]:
+        """
+        Calculate progress for every lesson of a module in a single query.
+
+        Args:
+            module_id: The ID of the module
+            user_id: The user ID (default 1 for single-user mode)
+
+        Returns:
+            Dict mapping lesson_id to a dict with keys: completed, total, percent
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT t.lesson_id, COUNT(DISTINCT t.id), COUNT(DISTINCT p.task_id)
+            FROM tasks t
+            JOIN lessons l ON t.lesson_id = l.id
+            LEFT JOIN progression p
+                ON p.task_id = t.id AND p.user_id = ? AND p.status = 'completed'
+            WHERE l.module_id = ?
+            GROUP BY t.lesson_id
+        """, (user_id, module_id))
+        rows = cursor.fetchall()
+        conn.close()
+
+        return {lesson_id: self._progress_dict(completed, total)
+                for lesson_id, total, completed in rows}
+
+    @staticmethod
+    def _progress_dict(completed: int, total: int) -> Dict:
+        """Build a progress dict from completed and total counts."""
+        percent = round((completed / total) * 100) if total > 0 else 0
+        return {
+            "completed": completed,
+            "total": total,
+            "percent": percent
+        }
+
     def get_task_status(self, task_id: int, user_id: int = 1) -> Dict:
         """
         Get status for a specific task.
@@ -216,6 +285,255 @@ class ProgressionManager:
             "global_percent": global_percent
         }
 
+    def get_resume_point(self, user_id: int = 1) -> Optional[Dict]:
+        """
+        Find the task to continue with, in a single query.
+
+        This is the first unlocked, not completed task of the lesson the
+        user last attempted something in. If that lesson is finished, it
+        is the first such task in curriculum order.
+
+        Args:
+            user_id: The user ID (default 1 for single-user mode)
+
+        Returns:
+            Dict with keys module_id, module_name, lesson_id, lesson_name,
+            task_id, task_name, or None when every task is completed
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT m.id, m.name, l.id, l.name, t.id, t.name
+            FROM progression p
+            JOIN tasks t ON t.id = p.task_id
+            JOIN lessons l ON l.id = t.lesson_id
+            JOIN modules m ON m.id = l.module_id
+            WHERE p.user_id = ? AND p.unlocked = 1 AND p.status != 'completed'
+            ORDER BY l.id IS (
+                         SELECT lt.lesson_id
+                         FROM attempts a
+                         JOIN tasks lt ON lt.id = a.task_id
+                         WHERE a.user_id = ?
+                         ORDER BY a.attempted_at DESC
+                         LIMIT 1
+                     ) DESC,
+                     m.id, l.id, t.id
+            LIMIT 1
+        """, (user_id, user_id))
+        row = cursor.fetchone()
+        conn.close()
+
+        if row is None:
+            return None
+        module_id, module_name, lesson_id, lesson_name, task_id, task_name = row
+        return {
+            "module_id": module_id,
+            "module_name": module_name,
+            "lesson_id": lesson_id,
+            "lesson_name": lesson_name,
+            "task_id": task_id,
+            "task_name": task_name,
+        }
+
+    # ------------------------------------------------------------------
+    # Attempt Analytics
+    # ------------------------------------------------------------------
+    # Read from task_attempt_stats, one row per (user, task) kept up to date
+    # with each attempt, never from the append-only attempts table.
+
+    def get_attempt_summary(self, user_id: int = 1) -> Dict:
+        """
+        Summarize all attempts of a user.
+
+        Args:
+            user_id: The user ID (default 1 for single-user mode)
+
+        Returns:
+            Dict with keys:
+                - attempts, failures, failure_rate (0-100)
+                - tasks_attempted, tasks_succeeded
+                - avg_attempts_to_success (None before the first success)
+                - time_on_task_ms
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT COUNT(*), COALESCE(SUM(attempts), 0), COALESCE(SUM(failures), 0),
+                   COUNT(attempts_to_success), AVG(attempts_to_success),
+                   COALESCE(SUM(total_duration_ms), 0)
+            FROM task_attempt_stats
+            WHERE user_id = ?
+        """, (user_id,))
+        tasks_attempted, attempts, failures, tasks_succeeded, avg_to_success, duration = cursor.fetchone()
+        conn.close()
+
+        return {
+            "attempts": attempts,
+            "failures": failures,
+            "failure_rate": round(failures * 100 / attempts) if attempts else 0,
+            "tasks_attempted": tasks_attempted,
+            "tasks_succeeded": tasks_succeeded,
+            "avg_attempts_to_success": avg_to_success,
+            "time_on_task_ms": duration,
+        }
+
+    def get_task_attempt_stats(self, lesson_id: Optional[int] = None,
+                               user_id: int = 1) -> List[Dict]:
+        """
+        Attempt statistics of each task a user has attempted.
+
+        Args:
+            lesson_id: Only tasks of this lesson, or all tasks if None
+            user_id: The user ID (default 1 for single-user mode)
+
+        Returns:
+            List of dicts with keys task_id, task_name, lesson_id, attempts,
+            failures, failure_rate, attempts_to_success, time_on_task_ms,
+            ordered like the tasks
+        """
+        query = """
+            SELECT t.id, t.name, t.lesson_id, s.attempts, s.failures,
+                   s.attempts_to_success, s.total_duration_ms
+            FROM task_attempt_stats s
+            JOIN tasks t ON t.id = s.task_id
+            WHERE s.user_id = ?
+        """
+        params = [user_id]
+        if lesson_id is not None:
+            query += " AND t.lesson_id = ?"
+            params.append(lesson_id)
+        query += " ORDER BY t.lesson_id, t.id"
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [
+            {
+                "task_id": task_id,
+                "task_name": name,
+                "lesson_id": task_lesson_id,
+                "attempts": attempts,
+                "failures": failures,
+                "failure_rate": round(failures * 100 / attempts) if attempts else 0,
+                "attempts_to_success": to_success,
+                "time_on_task_ms": duration,
+            }
+            for task_id, name, task_lesson_id, attempts, failures, to_success, duration in rows
+        ]
+
+    def get_hardest_tasks(self, limit: int = 5, user_id: Optional[int] = None,
+                          min_attempts: int = 2) -> List[Dict]:
+        """
+        Tasks with the highest failure rate, for learners and instructors.
+
+        Args:
+            limit: Maximum number of tasks returned
+            user_id: Only this user's attempts, or every user's if None
+            min_attempts: Tasks with fewer attempts are left out
+
+        Returns:
+            List of dicts with keys task_id, task_name, lesson_name,
+            attempts, failures, failure_rate, learners
+        """
+        user_filter = "WHERE s.user_id = ?" if user_id is not None else ""
+        params = [user_id] if user_id is not None else []
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT t.id, t.name, l.name, SUM(s.attempts), SUM(s.failures), COUNT(*)
+            FROM task_attempt_stats s
+            JOIN tasks t ON t.id = s.task_id
+            JOIN lessons l ON l.id = t.lesson_id
+            {user_filter}
+            GROUP BY s.task_id
+            HAVING SUM(s.attempts) >= ? AND SUM(s.failures) > 0
+            ORDER BY CAST(SUM(s.failures) AS REAL) / SUM(s.attempts) DESC, SUM(s.attempts) DESC
+            LIMIT ?
+        """, params + [min_attempts, limit])
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [
+            {
+                "task_id": task_id,
+                "task_name": task_name,
+                "lesson_name": lesson_name,
+                "attempts": attempts,
+                "failures": failures,
+                "failure_rate": round(failures * 100 / attempts),
+                "learners": learners,
+            }
+            for task_id, task_name, lesson_name, attempts, failures, learners in rows
+        ]
+
+    def get_activity_history(self, days: int = 90, weeks: int = 26, user_id: int = 1,
+                             today: Optional[date] = None) -> Dict:
+        """
+        Daily and weekly completion series and streaks, from the attempts.
+
+        One GROUP BY per local day over the user's attempts, served by the
+        covering (user_id, attempted_at, success) index; everything else
+        is derived from the per-day rows.
+
+        Args:
+            days: Length of the daily series
+            weeks: Length of the weekly series
+            user_id: The user ID (default 1 for single-user mode)
+            today: Last day of the series (default: today)
+
+        Returns:
+            Dict with keys:
+                - first_day: ISO date of the first day of the daily series
+                - daily_successes, daily_attempts: one value per day
+                - rolling_successes: successes over the 7 days ending each day
+                - first_week: ISO date of the Monday of the first week
+                - weekly_successes: one value per week
+                - current_streak, longest_streak: consecutive days with a success
+        """
+        today = today or date.today()
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT date(attempted_at, 'unixepoch', 'localtime') AS day, COUNT(*), SUM(success)
+            FROM attempts
+            WHERE user_id = ?
+            GROUP BY day
+            ORDER BY day
+        """, (user_id,))
+        rows = cursor.fetchall()
+        conn.close()
+
+        attempts_per_day = {}
+        successes_per_day = {}
+        for day, attempts, successes in rows:
+            day = date.fromisoformat(day)
+            attempts_per_day[day] = attempts
+            if successes:
+                successes_per_day[day] = successes
+
+        # Longer than shown, so that the first days' rolling sums are complete
+        window = 7
+        daily_successes = dense_daily(successes_per_day, today, days + window - 1)
+        rolling = rolling_sum(daily_successes, window)
+        first_week, weekly = weekly_totals(successes_per_day, today, weeks)
+        current_streak, longest_streak = streaks(sorted(successes_per_day), today)
+
+        return {
+            "first_day": (today - timedelta(days=days - 1)).isoformat(),
+            "daily_successes": daily_successes[window - 1:].tolist(),
+            "daily_attempts": dense_daily(attempts_per_day, today, days).tolist(),
+            "rolling_successes": rolling[window - 1:].tolist(),
+            "first_week": first_week[0].isoformat(),
+            "weekly_successes": weekly.tolist(),
+            "current_streak": current_streak,
+            "longest_streak": longest_streak,
+        }
+
     # ------------------------------------------------------------------
     # Legacy Methods (kept for compatibility)
     # ------------------------------------------------------------------
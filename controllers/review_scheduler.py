@@ -0,0 +1,179 @@
+# review_scheduler.py
+# Spaced-repetition reviews of completed quiz and typing tasks.
+# Each (user, task) has an SM-2 ease factor, interval and due date; the
+# due queue is read from the (user_id, due_at) index, oldest first.
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from database.db import DatabaseConnection
+
+# Task types that come back for review once completed
+REVIEWABLE_TASK_TYPES = ("quiz", "typing")
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+SECONDS_PER_DAY = 86400
+
+# SM-2 recall quality (0-5) given to a review outcome
+QUALITY_PERFECT = 5      # Succeeded at the first try of the review
+QUALITY_RECOVERED = 3    # Succeeded after failing this review
+QUALITY_FORGOTTEN = 1    # Failed
+
+
+def sm2_update(ease: float, interval_days: int, repetitions: int,
+               quality: int) -> Tuple[float, int, int]:
+    """
+    Apply one SM-2 review to an item.
+
+    Args:
+        ease: Current ease factor
+        interval_days: Current interval between reviews
+        repetitions: Successful reviews in a row
+        quality: Recall quality, 0 (forgotten) to 5 (perfect)
+
+    Returns:
+        Tuple (ease, interval_days, repetitions) after the review. A failed
+        review (quality < 3) resets repetitions and leaves the item due.
+    """
+    ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    if quality < 3:
+        return ease, 0, 0
+
+    repetitions += 1
+    if repetitions == 1:
+        interval_days = 1
+    elif repetitions == 2:
+        interval_days = 6
+    else:
+        interval_days = round(interval_days * ease)
+    return ease, interval_days, repetitions
+
+
+class ReviewScheduler:
+    """Schedules reviews of completed quiz and typing tasks."""
+
+    def __init__(self, db: Optional[DatabaseConnection] = None):
+        self.db = db or DatabaseConnection()
+
+    @staticmethod
+    def is_reviewable(task_type: str) -> bool:
+        """Whether tasks of this type are scheduled for review."""
+        return task_type in REVIEWABLE_TASK_TYPES
+
+    def record_result(self, task_id: int, success: bool, user_id: int = 1,
+                      now: Optional[float] = None) -> None:
+        """
+        Update the schedule of a task after a validation.
+
+        The first success enrolls the task, due one day later. Afterwards a
+        success only counts as a review once the task is due, while a
+        failure always sends it back to the start of the schedule.
+
+        Args:
+            task_id: The validated task (quiz or typing)
+            success: Whether the validation succeeded
+            user_id: The user ID (default 1 for single-user mode)
+            now: Current time in seconds since the epoch (default: time.time())
+        """
+        now = time.time() if now is None else now
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT ease, interval_days, repetitions, due_at
+            FROM review_schedule
+            WHERE user_id = ? AND task_id = ?
+        """, (user_id, task_id))
+        row = cursor.fetchone()
+
+        if row is None:
+            if success:
+                cursor.execute("""
+                    INSERT INTO review_schedule (
+                        user_id, task_id, ease, interval_days, repetitions, due_at, last_reviewed_at
+                    ) VALUES (?, ?, ?, 1, 1, ?, ?)
+                """, (user_id, task_id, DEFAULT_EASE, now + SECONDS_PER_DAY, now))
+                conn.commit()
+            conn.close()
+            return
+
+        ease, interval_days, repetitions, due_at = row
+        if success and due_at > now:
+            # Practising ahead of schedule does not move the next review
+            conn.close()
+            return
+
+        if not success:
+            quality = QUALITY_FORGOTTEN
+        elif repetitions == 0:
+            quality = QUALITY_RECOVERED
+        else:
+            quality = QUALITY_PERFECT
+        ease, interval_days, repetitions = sm2_update(ease, interval_days, repetitions, quality)
+
+        cursor.execute("""
+            UPDATE review_schedule
+            SET ease = ?, interval_days = ?, repetitions = ?, due_at = ?, last_reviewed_at = ?
+            WHERE user_id = ? AND task_id = ?
+        """, (ease, interval_days, repetitions, now + interval_days * SECONDS_PER_DAY, now,
+              user_id, task_id))
+        conn.commit()
+        conn.close()
+
+    def get_due_reviews(self, limit: int = 20, user_id: int = 1,
+                        now: Optional[float] = None) -> List[Dict]:
+        """
+        Tasks due for review, the most overdue first.
+
+        Args:
+            limit: Maximum number of tasks returned
+            user_id: The user ID (default 1 for single-user mode)
+            now: Current time in seconds since the epoch (default: time.time())
+
+        Returns:
+            List of dicts with keys task_id, task_name, task_type, lesson_id,
+            lesson_name, due_at, interval_days
+        """
+        now = time.time() if now is None else now
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        # Range scan of idx_review_schedule_due, stopped after `limit` rows
+        cursor.execute("""
+            SELECT r.task_id, t.name, t.task_type, t.lesson_id, l.name, r.due_at, r.interval_days
+            FROM review_schedule r
+            JOIN tasks t ON t.id = r.task_id
+            JOIN lessons l ON l.id = t.lesson_id
+            WHERE r.user_id = ? AND r.due_at <= ?
+            ORDER BY r.due_at
+            LIMIT ?
+        """, (user_id, now, limit))
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [
+            {
+                "task_id": task_id,
+                "task_name": task_name,
+                "task_type": task_type,
+                "lesson_id": lesson_id,
+                "lesson_name": lesson_name,
+                "due_at": due_at,
+                "interval_days": interval_days,
+            }
+            for task_id, task_name, task_type, lesson_id, lesson_name, due_at, interval_days in rows
+        ]
+
+    def count_due_reviews(self, user_id: int = 1, now: Optional[float] = None) -> int:
+        """Number of tasks due for review, counted on the index alone."""
+        now = time.time() if now is None else now
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) FROM review_schedule WHERE user_id = ? AND due_at <= ?",
+            (user_id, now)
+        )
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
@@ -1,15 +1,53 @@
 # task_controller.py
 # Controller for managing tasks in PyLearn Desktop
 
+import hashlib
+import random
+import time
 from typing import List, Dict, Optional
 from database.db import DatabaseConnection
+from utils.text_similarity import compare_texts, first_mismatch_position
+from utils.typing_metrics import TypingSessionMetrics
+from utils.sandbox import SandboxError
+from controllers.exercise_controller import ExerciseController
+from controllers.grading_cache import GradingCache
+from controllers.review_scheduler import ReviewScheduler
+from utils.code_canonical import canonical_forms, matches_reference, may_be_nondeterministic
+from utils.code_checks import unmet_requirement
+from controllers.progression_events import (
+    ProgressionEventBus,
+    TaskCompleted,
+    TaskReopened,
+    TaskAttempted,
+    TaskUnlocked,
+    LessonCompleted,
+    ModuleCompleted,
+    TypingSessionRecorded,
+)
 
 
 class TaskController:
     """Controller for task-related operations."""
 
-    def __init__(self):
-        self.db = DatabaseConnection()
+    def __init__(self, db: Optional[DatabaseConnection] = None,
+                 events: Optional[ProgressionEventBus] = None,
+                 exercise_controller: Optional[ExerciseController] = None,
+                 grading_cache: Optional[GradingCache] = None,
+                 review_scheduler: Optional[ReviewScheduler] = None):
+        # Shared data layer when provided by the ServiceContainer
+        self.db = db or DatabaseConnection()
+        # Optional bus receiving progression-change events
+        self.events = events
+        # Execution-based grading of exercises
+        self.exercise_controller = exercise_controller or ExerciseController()
+        # Verdicts of previously graded submissions
+        self.grading_cache = grading_cache or GradingCache(self.db)
+        # Spaced-repetition schedule of quiz and typing tasks, if any
+        self.review_scheduler = review_scheduler
+        # task_id -> content items of the task, see get_item_pool()
+        self._item_pools: Dict[int, List[Dict]] = {}
+        # Source of the random item draws
+        self.rng = random.Random()
 
     def load_tasks(self, lesson_id: int) -> List[Dict]:
         """
@@ -82,8 +120,9 @@ class TaskController:
         conn = self.db.get_connection()
         cursor = conn.cursor()
 
+        # Theory text is not needed here: it is read by sections
         cursor.execute(
-            "SELECT id, lesson_id, name, task_type, description, content FROM tasks WHERE id = ?",
+            "SELECT id, lesson_id, name, task_type, description FROM tasks WHERE id = ?",
             (task_id,)
         )
         row = cursor.fetchone()
@@ -95,8 +134,7 @@ class TaskController:
                 "lesson_id": row[1],
                 "name": row[2],
                 "task_type": row[3] or "theory",
-                "description": row[4] or "",
-                "content": row[5] or ""
+                "description": row[4] or ""
             }
         return None
 
@@ -140,14 +178,89 @@ class TaskController:
         conn.commit()
         conn.close()
 
+    def save_typing_session(self, task_id: int, metrics: TypingSessionMetrics,
+                            success: bool, keystroke_intervals: bytes = b"") -> int:
+        """
+        Store the metrics of one typing attempt for user 1 in a single insert.
+
+        Args:
+            task_id: The typing task that was attempted
+            metrics: Metrics computed by the KeystrokeRecorder
+            success: Whether the attempt passed validation
+            keystroke_intervals: Raw float32 intervals between keys, in ms
+
+        Returns:
+            The ID of the stored session
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            INSERT INTO typing_sessions (
+                user_id, task_id, success, duration_ms, wpm, accuracy, error_rate,
+                mean_latency_ms, hesitation_ms, keystrokes, errors, corrections,
+                keystroke_intervals
+            ) VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            task_id, int(success), metrics.duration_ms, metrics.wpm, metrics.accuracy,
+            metrics.error_rate, metrics.mean_latency_ms, metrics.hesitation_ms,
+            metrics.keystrokes, metrics.errors, metrics.corrections, keystroke_intervals,
+        ))
+        session_id = cursor.lastrowid
+
+        conn.commit()
+        conn.close()
+
+        if self.events is not None:
+            self.events.publish(
+                TypingSessionRecorded(task_id, metrics.wpm, metrics.accuracy, success)
+            )
+
+        return session_id
+
     # ------------------------------------------------------------------
     # Content Loading Methods
     # ------------------------------------------------------------------
+    def count_theory_sections(self, task_id: int) -> int:
+        """Number of sections of a theory task, counted on the primary key."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM theory_sections WHERE task_id = ?", (task_id,))
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
+
+    def load_theory_sections(self, task_id: int, start: int = 0, limit: int = 4) -> List[str]:
+        """
+        Load a page of a theory task's sections.
+
+        Args:
+            task_id: The theory task
+            start: Position of the first section (0 for the beginning)
+            limit: Maximum number of sections returned
 
-    def load_task_content(self, task_id: int) -> Dict:
+        Returns:
+            Section texts, in reading order
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT body FROM theory_sections
+            WHERE task_id = ? AND position >= ?
+            ORDER BY position
+            LIMIT ?
+        """, (task_id, start, limit))
+        sections = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return sections
+
+    def load_task_content(self, task_id: int, item_id: Optional[int] = None) -> Dict:
         """
         Load full content for a specific task based on its type.
 
+        Quiz, typing and exercise tasks show one item of their pool: the
+        item `item_id`, or one drawn at random when it is None.
+
         Returns:
             Dict with structured content:
             {
@@ -156,9 +269,11 @@ class TaskController:
                 "lesson_id": int,
                 "name": str,
                 "description": str,
-                "content": str (for theory),
+                "item_id": int (id of the item shown, to pass to validate_task),
+                "section_count": int (for theory, see load_theory_sections()),
                 "question": str (for quiz),
                 "answer": str (for quiz),
+                "options": List[Dict] (for quiz, see load_quiz()),
                 "text": str (for typing),
                 "prompt": str (for exercise),
                 "solution": str (for exercise)
@@ -180,89 +295,202 @@ class TaskController:
         }
 
         if task_type == "theory":
-            result["content"] = task.get("content", "")
-        elif task_type == "quiz":
-            quiz_data = self.load_quiz(lesson_id)
+            result["section_count"] = self.count_theory_sections(task_id)
+            return result
+
+        if item_id is None:
+            item_id = self.draw_item_id(task_id, task_type)
+        result["item_id"] = item_id
+
+        if task_type == "quiz":
+            quiz_data = self.load_quiz(task_id, item_id)
             result["question"] = quiz_data.get("question", "")
             result["answer"] = quiz_data.get("answer", "")
+            result["options"] = quiz_data.get("options", [])
         elif task_type == "typing":
-            typing_data = self.load_typing(lesson_id)
+            typing_data = self.load_typing(task_id, item_id)
             result["text"] = typing_data.get("text", "")
         elif task_type == "exercise":
-            exercise_data = self.load_exercise(lesson_id)
+            exercise_data = self.load_exercise(task_id, item_id)
             result["prompt"] = exercise_data.get("prompt", "")
             result["solution"] = exercise_data.get("solution", "")
 
         return result
 
-    def load_quiz(self, lesson_id: int) -> Dict:
+    # ------------------------------------------------------------------
+    # Item Pools
+    # ------------------------------------------------------------------
+    # Every quiz question, typing text or exercise of a task is read in a
+    # single query the first time the task is needed, then served from
+    # memory: draws and validations do not touch the database again.
+
+    def get_item_pool(self, task_id: int, task_type: str) -> List[Dict]:
         """
-        Load quiz content for a lesson.
+        Return every item of a task, ordered by position.
+
+        Args:
+            task_id: The task whose items are returned
+            task_type: "quiz", "typing" or "exercise"
 
         Returns:
-            Dict with keys: question, answer
+            List of item dicts, as returned by load_quiz(), load_typing()
+            or load_exercise()
         """
+        pool = self._item_pools.get(task_id)
+        if pool is None:
+            loader = {
+                "quiz": self._query_quiz_pool,
+                "typing": self._query_typing_pool,
+                "exercise": self._query_exercise_pool,
+            }.get(task_type)
+            pool = loader(task_id) if loader else []
+            self._item_pools[task_id] = pool
+        return pool
+
+    def clear_item_pools(self) -> None:
+        """Forget the loaded pools, e.g. after the content was edited."""
+        self._item_pools.clear()
+
+    def draw_item_id(self, task_id: int, task_type: str) -> Optional[int]:
+        """Id of an item drawn at random from the task's pool, None if it is empty."""
+        pool = self.get_item_pool(task_id, task_type)
+        return self.rng.choice(pool)["id"] if pool else None
+
+    def _get_item(self, task_id: int, task_type: str, item_id: Optional[int]) -> Optional[Dict]:
+        """The item `item_id` of a task, or its first item if None or unknown."""
+        pool = self.get_item_pool(task_id, task_type)
+        if not pool:
+            return None
+        return next((item for item in pool if item["id"] == item_id), pool[0])
+
+    def _query_quiz_pool(self, task_id: int) -> List[Dict]:
+        """Read the questions of a quiz task together with their options."""
         conn = self.db.get_connection()
         cursor = conn.cursor()
+        cursor.execute("""
+            SELECT q.id, q.question, q.answer, o.id, o.label, o.is_correct
+            FROM quiz q
+            LEFT JOIN quiz_options o ON o.quiz_id = q.id
+            WHERE q.task_id = ?
+            ORDER BY q.position, q.id, o.position, o.id
+        """, (task_id,))
+        rows = cursor.fetchall()
+        conn.close()
 
+        pool: List[Dict] = []
+        for quiz_id, question, answer, option_id, label, is_correct in rows:
+            if not pool or pool[-1]["id"] != quiz_id:
+                pool.append({"id": quiz_id, "question": question or "",
+                             "answer": answer or "", "options": []})
+            if option_id is not None:
+                pool[-1]["options"].append(
+                    {"id": option_id, "label": label, "is_correct": bool(is_correct)}
+                )
+        return pool
+
+    def _query_typing_pool(self, task_id: int) -> List[Dict]:
+        """Read the texts of a typing task."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
         cursor.execute(
-            "SELECT question, answer FROM quiz WHERE lesson_id = ? LIMIT 1",
-            (lesson_id,)
+            "SELECT id, text FROM typing WHERE task_id = ? ORDER BY position, id",
+            (task_id,)
         )
-        row = cursor.fetchone()
+        rows = cursor.fetchall()
         conn.close()
+        return [{"id": row[0], "text": row[1] or ""} for row in rows]
 
-        if row:
-            return {
-                "question": row[0] or "",
-                "answer": row[1] or ""
-            }
-        return {"question": "", "answer": ""}
+    def _query_exercise_pool(self, task_id: int) -> List[Dict]:
+        """Read the exercises of a task and all their test cases."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
 
-    def load_typing(self, lesson_id: int) -> Dict:
+        cursor.execute("""
+            SELECT id, prompt, solution, stdin, grading, requirements
+            FROM exercise
+            WHERE task_id = ?
+            ORDER BY position, id
+        """, (task_id,))
+        rows = cursor.fetchall()
+
+        cursor.execute("""
+            SELECT et.exercise_id, et.stdin, et.expected_output, et.assertion
+            FROM exercise_tests et
+            JOIN exercise e ON e.id = et.exercise_id
+            WHERE e.task_id = ?
+            ORDER BY et.exercise_id, et.position, et.id
+        """, (task_id,))
+        tests_by_exercise: Dict[int, List[Dict]] = {}
+        for exercise_id, stdin, expected_output, assertion in cursor.fetchall():
+            tests_by_exercise.setdefault(exercise_id, []).append(
+                {"stdin": stdin or "", "expected_output": expected_output,
+                 "assertion": assertion or ""}
+            )
+        conn.close()
+
+        pool = []
+        for exercise_id, prompt, solution, stdin, grading, requirements in rows:
+            stdin = stdin or ""
+            # Exercises without rows in exercise_tests get one case reading `stdin`
+            tests = tests_by_exercise.get(exercise_id) or [
+                {"stdin": stdin, "expected_output": None, "assertion": ""}
+            ]
+            pool.append({
+                "id": exercise_id,
+                "prompt": prompt or "",
+                "solution": solution or "",
+                "stdin": stdin,
+                "grading": grading or "output",
+                "requirements": [name for name in (requirements or "").split(",") if name],
+                "tests": tests
+            })
+        return pool
+
+    def load_quiz(self, task_id: int, item_id: Optional[int] = None) -> Dict:
         """
-        Load typing content for a lesson.
+        Load a question of a quiz task.
+
+        Args:
+            task_id: The quiz task
+            item_id: The question to load (default: the first one)
 
         Returns:
-            Dict with key: text
+            Dict with keys: id, question, answer, options (dicts with keys
+            id, label, is_correct; empty for free-text answers)
         """
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        item = self._get_item(task_id, "quiz", item_id)
+        return item or {"id": None, "question": "", "answer": "", "options": []}
 
-        cursor.execute(
-            "SELECT text FROM typing WHERE lesson_id = ? LIMIT 1",
-            (lesson_id,)
-        )
-        row = cursor.fetchone()
-        conn.close()
+    def load_typing(self, task_id: int, item_id: Optional[int] = None) -> Dict:
+        """
+        Load a text of a typing task.
 
-        if row:
-            return {"text": row[0] or ""}
-        return {"text": ""}
+        Args:
+            task_id: The typing task
+            item_id: The text to load (default: the first one)
 
-    def load_exercise(self, lesson_id: int) -> Dict:
+        Returns:
+            Dict with keys: id, text
         """
-        Load exercise content for a lesson.
+        item = self._get_item(task_id, "typing", item_id)
+        return item or {"id": None, "text": ""}
 
-        Returns:
-            Dict with keys: prompt, solution
+    def load_exercise(self, task_id: int, item_id: Optional[int] = None) -> Dict:
         """
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        Load an exercise of an exercise task.
 
-        cursor.execute(
-            "SELECT prompt, solution FROM exercise WHERE lesson_id = ? LIMIT 1",
-            (lesson_id,)
-        )
-        row = cursor.fetchone()
-        conn.close()
+        Args:
+            task_id: The exercise task
+            item_id: The exercise to load (default: the first one)
 
-        if row:
-            return {
-                "prompt": row[0] or "",
-                "solution": row[1] or ""
-            }
-        return {"prompt": "", "solution": ""}
+        Returns:
+            Dict with keys: id, prompt, solution, stdin, grading, requirements,
+            tests. Exercises without rows in exercise_tests get one case
+            reading `stdin`.
+        """
+        item = self._get_item(task_id, "exercise", item_id)
+        return item or {"id": None, "prompt": "", "solution": "", "stdin": "",
+                        "grading": "output", "requirements": [], "tests": []}
 
     def get_task_content(self, task_id: int) -> Dict:
         """
@@ -278,13 +506,18 @@ class TaskController:
     # Task Validation Methods
     # ------------------------------------------------------------------
 
-    def validate_task(self, task_id: int, user_input: str = "") -> Dict:
+    def validate_task(self, task_id: int, user_input: str = "",
+                      duration_ms: Optional[float] = None,
+                      item_id: Optional[int] = None) -> Dict:
         """
         Validate a task based on its type and user input.
 
         Args:
             task_id: The ID of the task to validate
             user_input: The user's input/answer (if applicable)
+            duration_ms: Time spent on the task for this attempt, if known
+            item_id: Item answered, from load_task_content() (default: the
+                task's first item)
 
         Returns:
             Dict with keys:
@@ -292,50 +525,112 @@ class TaskController:
                 - message: str - Feedback message
                 - unlock_next: bool - Whether next task was unlocked
         """
+        return self.apply_evaluation(self.evaluate_task(task_id, user_input, item_id), duration_ms)
+
+    def evaluate_task(self, task_id: int, user_input: str = "",
+                      item_id: Optional[int] = None) -> Dict:
+        """
+        Grade an answer without recording anything.
+
+        Exercises are executed in the sandbox, which can take up to the
+        execution time limit: views call this from a worker thread, then
+        apply_evaluation() on the GUI thread.
+
+        Args:
+            task_id: The ID of the task to grade
+            user_input: The user's input/answer (if applicable)
+            item_id: Item answered (default: the task's first item)
+
+        Returns:
+            Dict with keys: task (Dict or None), success, message, tests
+            (per-case results of an exercise, see ExerciseController.grade),
+            input_hash
+        """
         task = self.get_task_by_id(task_id)
         if not task:
-            return {
-                "success": False,
-                "message": "Tâche non trouvée.",
-                "unlock_next": False
-            }
+            return {"task": None, "success": False, "message": "Tâche non trouvée.", "tests": []}
+        input_hash = hashlib.sha256(user_input.strip().encode("utf-8")).hexdigest()
 
         task_type = task["task_type"]
-        lesson_id = task["lesson_id"]
 
         # Validate based on task type
+        test_results = []
         if task_type == "theory":
             success, message = self._validate_theory(task_id)
         elif task_type == "quiz":
-            success, message = self._validate_quiz(lesson_id, user_input)
+            success, message = self._validate_quiz(self.load_quiz(task_id, item_id), user_input)
         elif task_type == "typing":
-            success, message = self._validate_typing(lesson_id, user_input)
+            success, message = self._validate_typing(self.load_typing(task_id, item_id), user_input)
         elif task_type == "exercise":
-            success, message = self._validate_exercise(lesson_id, user_input)
+            success, message, test_results = self._validate_exercise(
+                self.load_exercise(task_id, item_id), user_input
+            )
         else:
             success, message = False, "Type de tâche inconnu."
 
+        return {"task": task, "success": success, "message": message,
+                "tests": test_results, "input_hash": input_hash}
+
+    def apply_evaluation(self, evaluation: Dict, duration_ms: Optional[float] = None) -> Dict:
+        """
+        Record the outcome of evaluate_task() and publish progression events.
+
+        Must run on the GUI thread, where progression event handlers live.
+
+        Args:
+            evaluation: Dict returned by evaluate_task()
+            duration_ms: Time spent on the task for this attempt, if known
+
+        Returns:
+            Dict with keys: success, message, unlock_next, tests
+        """
+        task = evaluation["task"]
+        success = evaluation["success"]
+        message = evaluation["message"]
+        tests = evaluation.get("tests", [])
+        if not task:
+            return {"success": False, "message": message, "unlock_next": False, "tests": tests}
+
+        task_id = task["id"]
+        lesson_id = task["lesson_id"]
+
         # Update progression and unlock next if successful
-        unlock_next = False
+        was_completed = self.is_task_completed(task_id)
+        attempt = {
+            "success": success,
+            "duration_ms": duration_ms,
+            "input_hash": evaluation.get("input_hash"),
+        }
+        unlocked_task_id = None
         if success:
-            self._update_task_status(task_id, "completed")
-            unlock_next = self._unlock_next_task(task_id, lesson_id)
+            self._update_task_status(task_id, "completed", attempt)
+            unlocked_task_id = self._unlock_next_task(task_id, lesson_id)
         else:
-            self._update_task_status(task_id, "failed")
+            self._update_task_status(task_id, "failed", attempt)
+        unlock_next = unlocked_task_id is not None
+
+        if self.review_scheduler is not None and self.review_scheduler.is_reviewable(task["task_type"]):
+            self.review_scheduler.record_result(task_id, success)
+
+        self._publish_progression_events(task, success, was_completed, unlocked_task_id)
 
         return {
             "success": success,
             "message": message,
-            "unlock_next": unlock_next
+            "unlock_next": unlock_next,
+            "tests": tests
         }
 
     def _validate_theory(self, task_id: int) -> tuple:
         """Validate theory task - always passes."""
         return True, "Théorie marquée comme lue ! ✓"
 
-    def _validate_quiz(self, lesson_id: int, user_input: str) -> tuple:
-        """Validate quiz answer."""
-        quiz_data = self.load_quiz(lesson_id)
+    def _validate_quiz(self, quiz_data: Dict, user_input: str) -> tuple:
+        """Validate quiz answer: an option id, or free text without options."""
+        options = quiz_data.get("options", [])
+        if options:
+            return self._validate_quiz_option(options, user_input)
+
         correct_answer = quiz_data.get("answer", "").strip().upper()
         user_answer = user_input.strip().upper()
 
@@ -347,9 +642,24 @@ class TaskController:
         else:
             return False, f"Incorrect. La bonne réponse était: {correct_answer}"
 
-    def _validate_typing(self, lesson_id: int, user_input: str) -> tuple:
+    def _validate_quiz_option(self, options: List[Dict], user_input: str) -> tuple:
+        """Validate the id of the chosen option (or its letter, "A" for the first)."""
+        choice = user_input.strip().upper()
+        if not choice:
+            return False, "Veuillez choisir une réponse."
+        if len(choice) == 1 and "A" <= choice <= "Z":
+            position = ord(choice) - ord("A")
+            choice = str(options[position]["id"]) if position < len(options) else ""
+
+        correct = next((option for option in options if option["is_correct"]), None)
+        if correct is None:
+            return False, "Incorrect."
+        if choice == str(correct["id"]):
+            return True, "Bonne réponse ! ✓"
+        return False, f"Incorrect. La bonne réponse était: {correct['label']}"
+
+    def _validate_typing(self, typing_data: Dict, user_input: str) -> tuple:
         """Validate typing task - exact match with whitespace stripped."""
-        typing_data = self.load_typing(lesson_id)
         target_text = typing_data.get("text", "").strip()
         user_text = user_input.strip()
 
@@ -359,32 +669,99 @@ class TaskController:
         if user_text == target_text:
             return True, "Parfait ! Texte correct ! ✓"
         else:
-            # Calculate similarity for feedback
-            similarity = self._calculate_similarity(target_text, user_text)
-            if similarity > 0.8:
-                return False, "Presque ! Vérifiez les petites différences."
+            # Edit-distance similarity, stopping early below the threshold
+            result = compare_texts(target_text, user_text, min_ratio=0.8)
+            if not result.exceeded_threshold and result.ratio > 0.8:
+                return False, (
+                    "Presque ! Vérifiez les petites différences"
+                    f"{self._describe_first_mismatch(target_text, result)}."
+                )
             else:
                 return False, "Le texte ne correspond pas. Réessayez."
 
-    def _validate_exercise(self, lesson_id: int, user_input: str) -> tuple:
-        """Validate exercise - simple string match."""
-        exercise_data = self.load_exercise(lesson_id)
+    def _validate_exercise(self, exercise_data: Dict, user_input: str) -> tuple:
+        """Validate exercise - run its test cases and compare outputs.
+
+        Returns:
+            Tuple (success, message, per-case results)
+        """
         solution = exercise_data.get("solution", "").strip()
         user_code = user_input.strip()
 
         if not user_code:
-            return False, "Veuillez écrire votre code."
+            return False, "Veuillez écrire votre code.", []
+
+        # Checked first: what it requires (e.g. a comment) is not in the AST
+        # nor in the output
+        missing = unmet_requirement(user_code, exercise_data.get("requirements", []))
+        if missing is not None:
+            return False, missing, []
+
+        # Parsed once: canonical form for the equivalence check and the
+        # fallback, with statement lines for the cache key
+        dump, dump_with_lines = canonical_forms(user_code) or (None, None)
+
+        # Same program as the solution up to formatting: no need to run it
+        if matches_reference(dump, solution):
+            return True, "Excellent ! Code correct ! ✓", [
+                {"number": number, "status": "passed", "message": "Identique à la solution"}
+                for number in range(1, len(exercise_data["tests"]) + 1)
+            ]
+
+        # Identical (or identically parsed) code was already graded
+        cache_key = self._grading_cache_key(exercise_data, user_code, dump_with_lines)
+        cached = self.grading_cache.get(cache_key)
+        if cached is not None:
+            return cached["success"], cached["message"], cached["tests"]
 
+        try:
+            success, message, tests = self.exercise_controller.grade(
+                solution, user_code, exercise_data["tests"], exercise_data["grading"]
+            )
+        except SandboxError:
+            # No usable sandbox: fall back to comparing the source text
+            return (*self._compare_exercise_source(solution, user_code, dump), [])
+
+        # A timeout, or code using chance or the clock, may end differently next time
+        if (all(test.get("deterministic", True) for test in tests)
+                and not may_be_nondeterministic(user_code)):
+            self.grading_cache.put(cache_key, success, message, tests)
+        return success, message, tests
+
+    def _grading_cache_key(self, exercise_data: Dict, user_code: str,
+                           canonical: Optional[str]) -> str:
+        """Cache key of a submission: exercise, content version and canonical code.
+
+        `canonical` is canonical_dump(user_code, keep_lines=True): statement
+        lines are kept so cached error messages cite the right line. Code
+        that does not parse (None) is keyed on its text.
+        """
+        if canonical is None:
+            canonical = "source:" + "\n".join(line.rstrip() for line in user_code.splitlines())
+        return self.grading_cache.make_key(
+            exercise_data["id"], self.grading_cache.content_version(exercise_data), canonical
+        )
+
+    def _compare_exercise_source(self, solution: str, user_code: str,
+                                 dump: Optional[str]) -> tuple:
+        """Validate exercise - source comparison, used when code cannot be run.
+
+        `dump` is canonical_dump(user_code), None if the code does not parse.
+        """
         # Normalize both strings for comparison (remove extra whitespace)
         normalized_solution = self._normalize_code(solution)
         normalized_user = self._normalize_code(user_code)
 
-        if normalized_user == normalized_solution:
+        if matches_reference(dump, solution) or normalized_user == normalized_solution:
             return True, "Excellent ! Code correct ! ✓"
         else:
             # Check if it's close
-            if self._calculate_similarity(normalized_solution, normalized_user) > 0.7:
-                return False, "Presque correct ! Vérifiez votre syntaxe."
+            result = compare_texts(normalized_solution, normalized_user, min_ratio=0.7)
+            if not result.exceeded_threshold and result.ratio > 0.7:
+                return False, (
+                    "Presque correct ! Vérifiez votre syntaxe"
+                    f"{self._describe_first_mismatch(normalized_solution, result)}."
+                )
             else:
                 return False, "Le code ne correspond pas à la solution attendue."
 
@@ -394,18 +771,27 @@ class TaskController:
         lines = [line.strip() for line in code.strip().split('\n') if line.strip()]
         return '\n'.join(lines)
 
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """Calculate simple similarity ratio between two strings."""
-        if not str1 or not str2:
-            return 0.0
-        
-        # Simple character-based similarity
-        matches = sum(1 for a, b in zip(str1, str2) if a == b)
-        max_len = max(len(str1), len(str2))
-        return matches / max_len if max_len > 0 else 0.0
+    def _describe_first_mismatch(self, target: str, result) -> str:
+        """Describe where the first difference is, e.g. " (ligne 2, colonne 5)"."""
+        # Both texts agree up to the first edit, so its index is the same
+        # in the target and in the typed text
+        starts = [spans[0][0] for spans in (result.target_mismatches, result.typed_mismatches)
+                  if spans]
+        if not starts:
+            return ""
+        line, column = first_mismatch_position(target, min(starts))
+        return f" (ligne {line}, colonne {column})"
+
+    def _update_task_status(self, task_id: int, status: str,
+                            attempt: Optional[Dict] = None) -> None:
+        """Update task status in progression table.
 
-    def _update_task_status(self, task_id: int, status: str) -> None:
-        """Update task status in progression table."""
+        Args:
+            task_id: The task whose status changes
+            status: New status ('completed' or 'failed')
+            attempt: Attempt to record in the same transaction, with keys
+                success, duration_ms, input_hash
+        """
         conn = self.db.get_connection()
         cursor = conn.cursor()
 
@@ -433,11 +819,43 @@ class TaskController:
                 VALUES (1, ?, ?, ?, 1)
             """, (task_id, lesson_id, status))
 
+        if attempt is not None:
+            self._record_attempt(cursor, task_id, attempt)
+
         conn.commit()
         conn.close()
 
-    def _unlock_next_task(self, current_task_id: int, lesson_id: int) -> bool:
-        """Unlock the next task in the lesson. Returns True if a task was unlocked."""
+    def _record_attempt(self, cursor, task_id: int, attempt: Dict) -> None:
+        """Append an attempt and fold it into the per-task running totals."""
+        now = time.time()
+        success = 1 if attempt["success"] else 0
+        duration_ms = attempt.get("duration_ms")
+
+        cursor.execute("""
+            INSERT INTO attempts (user_id, task_id, attempted_at, success, duration_ms, input_hash)
+            VALUES (1, ?, ?, ?, ?, ?)
+        """, (task_id, now, success, duration_ms, attempt.get("input_hash")))
+
+        # SET expressions read the row as it was before this attempt
+        cursor.execute("""
+            INSERT INTO task_attempt_stats (
+                user_id, task_id, attempts, failures, successes, attempts_to_success,
+                total_duration_ms, first_attempt_at, last_attempt_at
+            ) VALUES (1, ?, 1, ?, ?, CASE WHEN ? = 1 THEN 1 END, ?, ?, ?)
+            ON CONFLICT(user_id, task_id) DO UPDATE SET
+                attempts = attempts + 1,
+                failures = failures + excluded.failures,
+                successes = successes + excluded.successes,
+                attempts_to_success = COALESCE(
+                    attempts_to_success,
+                    CASE WHEN excluded.successes = 1 THEN attempts + 1 END
+                ),
+                total_duration_ms = total_duration_ms + excluded.total_duration_ms,
+                last_attempt_at = excluded.last_attempt_at
+        """, (task_id, 1 - success, success, success, duration_ms or 0.0, now, now))
+
+    def _unlock_next_task(self, current_task_id: int, lesson_id: int) -> Optional[int]:
+        """Unlock the next task in the lesson. Returns its ID, or None if there is none."""
         conn = self.db.get_connection()
         cursor = conn.cursor()
 
@@ -476,12 +894,20 @@ class TaskController:
 
                 conn.commit()
                 conn.close()
-                return True
+                return next_task_id
         except ValueError:
             pass
 
         conn.close()
-        return False
+        return None
+
+    def is_task_completed(self, task_id: int) -> bool:
+        """Check if a task is completed for user 1."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        completed = self._is_task_completed(cursor, task_id)
+        conn.close()
+        return completed
 
     def is_task_unlocked(self, task_id: int) -> bool:
         """Check if a task is unlocked for user 1."""
@@ -496,3 +922,84 @@ class TaskController:
         conn.close()
 
         return bool(row[0]) if row else False
+
+    # ------------------------------------------------------------------
+    # Progression Events
+    # ------------------------------------------------------------------
+
+    def _publish_progression_events(self, task: Dict, success: bool,
+                                     was_completed: bool,
+                                     unlocked_task_id: Optional[int]) -> None:
+        """Publish the events describing what a validation changed.
+
+        Completion events are only published on actual transitions, so
+        subscribers can keep running counts without re-querying.
+        TaskAttempted is published for every validation, since each one
+        adds an attempt to the statistics.
+        """
+        if self.events is None:
+            return
+
+        task_id = task["id"]
+        lesson_id = task["lesson_id"]
+        task_type = task["task_type"]
+        module_id = self._get_module_id(lesson_id)
+
+        self.events.publish(TaskAttempted(task_id, lesson_id, module_id, task_type, success))
+
+        if success and not was_completed:
+            self.events.publish(TaskCompleted(task_id, lesson_id, module_id, task_type))
+        elif not success and was_completed:
+            self.events.publish(TaskReopened(task_id, lesson_id, module_id, task_type))
+
+        if unlocked_task_id is not None:
+            self.events.publish(TaskUnlocked(unlocked_task_id, lesson_id, module_id))
+
+        if success and not was_completed and self._is_lesson_completed(lesson_id):
+            self.events.publish(LessonCompleted(lesson_id, module_id))
+            if self._is_module_completed(module_id):
+                self.events.publish(ModuleCompleted(module_id))
+
+    def _get_module_id(self, lesson_id: int) -> Optional[int]:
+        """Get the module a lesson belongs to."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT module_id FROM lessons WHERE id = ?", (lesson_id,))
+        row = cursor.fetchone()
+        conn.close()
+
+        return row[0] if row else None
+
+    def _is_lesson_completed(self, lesson_id: int) -> bool:
+        """Check if every task of a lesson is completed for user 1."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT COUNT(*) FROM tasks t
+            LEFT JOIN progression p
+                ON p.task_id = t.id AND p.user_id = 1 AND p.status = 'completed'
+            WHERE t.lesson_id = ? AND p.id IS NULL
+        """, (lesson_id,))
+        remaining = cursor.fetchone()[0]
+        conn.close()
+
+        return remaining == 0
+
+    def _is_module_completed(self, module_id: int) -> bool:
+        """Check if every task of a module is completed for user 1."""
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT COUNT(*) FROM tasks t
+            JOIN lessons l ON l.id = t.lesson_id
+            LEFT JOIN progression p
+                ON p.task_id = t.id AND p.user_id = 1 AND p.status = 'completed'
+            WHERE l.module_id = ? AND p.id IS NULL
+        """, (module_id,))
+        remaining = cursor.fetchone()[0]
+        conn.close()
+
+        return remaining == 0
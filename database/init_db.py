@@ -2,7 +2,9 @@
 # SQLite database initialization for PyLearn Desktop
 # Creates tables and inserts default data if tables are empty.
 
+import re
 import sqlite3
+from typing import List, Set, Tuple
 
 
 def initialize_tables(db_path: str) -> None:
@@ -10,6 +12,10 @@ def initialize_tables(db_path: str) -> None:
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
+    # Tables present before this run, so that one-off migrations run once
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    existing_tables = {row[0] for row in cursor.fetchall()}
+
     # Table definitions
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS modules (
@@ -42,26 +48,52 @@ def initialize_tables(db_path: str) -> None:
     CREATE TABLE IF NOT EXISTS quiz (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         lesson_id INTEGER,
+        task_id INTEGER,
+        position INTEGER DEFAULT 0,
         question TEXT NOT NULL,
         answer TEXT,
-        FOREIGN KEY(lesson_id) REFERENCES lessons(id)
+        FOREIGN KEY(lesson_id) REFERENCES lessons(id),
+        FOREIGN KEY(task_id) REFERENCES tasks(id)
+    );
+    """)
+    # Choices of a quiz question, answered by option id
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS quiz_options (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        quiz_id INTEGER,
+        position INTEGER DEFAULT 0,
+        label TEXT NOT NULL,
+        is_correct INTEGER DEFAULT 0,
+        FOREIGN KEY(quiz_id) REFERENCES quiz(id)
     );
     """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_quiz_options_quiz ON quiz_options(quiz_id, position)"
+    )
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS exercise (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         lesson_id INTEGER,
+        task_id INTEGER,
+        position INTEGER DEFAULT 0,
         prompt TEXT NOT NULL,
         solution TEXT,
-        FOREIGN KEY(lesson_id) REFERENCES lessons(id)
+        stdin TEXT DEFAULT '',
+        grading TEXT DEFAULT 'output',
+        requirements TEXT DEFAULT '',
+        FOREIGN KEY(lesson_id) REFERENCES lessons(id),
+        FOREIGN KEY(task_id) REFERENCES tasks(id)
     );
     """)
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS typing (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         lesson_id INTEGER,
+        task_id INTEGER,
+        position INTEGER DEFAULT 0,
         text TEXT NOT NULL,
-        FOREIGN KEY(lesson_id) REFERENCES lessons(id)
+        FOREIGN KEY(lesson_id) REFERENCES lessons(id),
+        FOREIGN KEY(task_id) REFERENCES tasks(id)
     );
     """)
     cursor.execute("""
@@ -78,15 +110,319 @@ def initialize_tables(db_path: str) -> None:
         FOREIGN KEY(task_id) REFERENCES tasks(id)
     );
     """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_progression_user_task ON progression(user_id, task_id)"
+    )
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS exercise_tests (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        exercise_id INTEGER,
+        position INTEGER DEFAULT 0,
+        stdin TEXT DEFAULT '',
+        expected_output TEXT,
+        assertion TEXT,
+        FOREIGN KEY(exercise_id) REFERENCES exercise(id)
+    );
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_exercise_tests_exercise "
+        "ON exercise_tests(exercise_id, position)"
+    )
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS attempts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER DEFAULT 1,
+        task_id INTEGER,
+        attempted_at REAL,
+        success INTEGER,
+        duration_ms REAL,
+        input_hash TEXT,
+        FOREIGN KEY(task_id) REFERENCES tasks(id)
+    );
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_attempts_user_task "
+        "ON attempts(user_id, task_id, attempted_at)"
+    )
+    # Covers the per-day activity GROUP BY (success included)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_attempts_user_time "
+        "ON attempts(user_id, attempted_at, success)"
+    )
+    # Running totals per (user, task), updated with each attempt, so that
+    # analytics never scan the attempts table
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS task_attempt_stats (
+        user_id INTEGER,
+        task_id INTEGER,
+        attempts INTEGER DEFAULT 0,
+        failures INTEGER DEFAULT 0,
+        successes INTEGER DEFAULT 0,
+        attempts_to_success INTEGER,
+        total_duration_ms REAL DEFAULT 0,
+        first_attempt_at REAL,
+        last_attempt_at REAL,
+        PRIMARY KEY(user_id, task_id),
+        FOREIGN KEY(task_id) REFERENCES tasks(id)
+    );
+    """)
+    # SM-2 review schedule of completed quiz and typing tasks
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS review_schedule (
+        user_id INTEGER,
+        task_id INTEGER,
+        ease REAL DEFAULT 2.5,
+        interval_days INTEGER DEFAULT 0,
+        repetitions INTEGER DEFAULT 0,
+        due_at REAL,
+        last_reviewed_at REAL,
+        PRIMARY KEY(user_id, task_id),
+        FOREIGN KEY(task_id) REFERENCES tasks(id)
+    );
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_review_schedule_due ON review_schedule(user_id, due_at)"
+    )
+    # Unlocked achievements and the running counters their rules check
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS achievements (
+        user_id INTEGER,
+        achievement_id TEXT,
+        unlocked_at REAL,
+        PRIMARY KEY(user_id, achievement_id)
+    );
+    """)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS achievement_counters (
+        user_id INTEGER,
+        name TEXT,
+        value REAL DEFAULT 0,
+        PRIMARY KEY(user_id, name)
+    );
+    """)
+    # Theory text split into sections, loaded a few at a time
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS theory_sections (
+        task_id INTEGER,
+        position INTEGER,
+        body TEXT,
+        PRIMARY KEY(task_id, position),
+        FOREIGN KEY(task_id) REFERENCES tasks(id)
+    );
+    """)
+    # Unsubmitted answers, autosaved while the learner types
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS drafts (
+        user_id INTEGER,
+        task_id INTEGER,
+        item_id INTEGER,
+        content TEXT,
+        updated_at REAL,
+        PRIMARY KEY(user_id, task_id),
+        FOREIGN KEY(task_id) REFERENCES tasks(id)
+    );
+    """)
+    # Last computed progress summaries (JSON), painted at startup
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS progress_snapshots (
+        user_id INTEGER,
+        name TEXT,
+        data TEXT,
+        updated_at REAL,
+        PRIMARY KEY(user_id, name)
+    );
+    """)
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS grading_cache (
+        key TEXT PRIMARY KEY,
+        success INTEGER,
+        message TEXT,
+        tests TEXT,
+        last_used REAL
+    );
+    """)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_grading_cache_last_used ON grading_cache(last_used)"
+    )
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS typing_sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER DEFAULT 1,
+        task_id INTEGER,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        success INTEGER DEFAULT 0,
+        duration_ms REAL,
+        wpm REAL,
+        accuracy REAL,
+        error_rate REAL,
+        mean_latency_ms REAL,
+        hesitation_ms REAL,
+        keystrokes INTEGER,
+        errors INTEGER,
+        corrections INTEGER,
+        keystroke_intervals BLOB,
+        FOREIGN KEY(task_id) REFERENCES tasks(id)
+    );
+    """)
 
     conn.commit()
 
+    # Bring databases created by older versions up to date
+    _migrate_schema(conn, existing_tables)
+
     # Insert default data if tables are empty
     _insert_default_data(conn)
 
     conn.close()
 
 
+# Tables holding the items of a task, named after the task type
+CONTENT_TABLES = ("quiz", "typing", "exercise")
+
+# Longest theory section, in characters (a longer paragraph stays whole)
+THEORY_SECTION_CHARS = 1500
+
+# Seeded lessons whose exercise only checks the number of printed lines
+# ("La fonction print()" and "Commentaires en Python")
+LINES_GRADED_LESSON_IDS = (2, 4)
+# Seeded lesson whose exercise must contain a comment ("Commentaires en Python")
+COMMENT_REQUIRED_LESSON_IDS = (4,)
+
+
+def _migrate_schema(conn: sqlite3.Connection, existing_tables: Set[str]) -> None:
+    """Add columns introduced after a database was created.
+
+    Args:
+        conn: Open connection to the database
+        existing_tables: Tables the database had before initialize_tables()
+            created the missing ones
+    """
+    cursor = conn.cursor()
+
+    cursor.execute("PRAGMA table_info(exercise)")
+    exercise_columns = {row[1] for row in cursor.fetchall()}
+    if "stdin" not in exercise_columns:
+        # Exercises are graded by running them: input() reads this fixture
+        cursor.execute("ALTER TABLE exercise ADD COLUMN stdin TEXT DEFAULT ''")
+        cursor.execute(
+            "UPDATE exercise SET stdin = ? WHERE solution LIKE '%input(%'",
+            ("Alice\n",)
+        )
+    if "grading" not in exercise_columns:
+        # 'output': same output as the solution, 'lines': same number of lines
+        cursor.execute("ALTER TABLE exercise ADD COLUMN grading TEXT DEFAULT 'output'")
+        placeholders = ", ".join("?" * len(LINES_GRADED_LESSON_IDS))
+        cursor.execute(
+            f"UPDATE exercise SET grading = 'lines' WHERE lesson_id IN ({placeholders})",
+            LINES_GRADED_LESSON_IDS
+        )
+    if "requirements" not in exercise_columns:
+        # Comma-separated checks of the source itself (see utils.code_checks)
+        cursor.execute("ALTER TABLE exercise ADD COLUMN requirements TEXT DEFAULT ''")
+        placeholders = ", ".join("?" * len(COMMENT_REQUIRED_LESSON_IDS))
+        cursor.execute(
+            f"UPDATE exercise SET requirements = 'comment' WHERE lesson_id IN ({placeholders})",
+            COMMENT_REQUIRED_LESSON_IDS
+        )
+
+    # Content used to be matched to its task through the lesson: key it by
+    # task, several items per task ordered by position
+    for table in CONTENT_TABLES:
+        cursor.execute(f"PRAGMA table_info({table})")
+        columns = {row[1] for row in cursor.fetchall()}
+        if "task_id" not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN task_id INTEGER")
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN position INTEGER DEFAULT 0")
+            cursor.execute(f"""
+                UPDATE {table} SET task_id = (
+                    SELECT MIN(t.id) FROM tasks t
+                    WHERE t.lesson_id = {table}.lesson_id AND t.task_type = ?
+                )
+            """, (table,))
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_task ON {table}(task_id, position)"
+        )
+
+    # Questions with their choices written in the text ("A) ...") and the
+    # letter of the right one in `answer`: move the choices to quiz_options
+    cursor.execute("""
+        SELECT id, question, answer FROM quiz
+        WHERE id NOT IN (SELECT quiz_id FROM quiz_options)
+    """)
+    for quiz_id, question, answer in cursor.fetchall():
+        stem, labels = _split_quiz_question(question)
+        if not labels:
+            continue
+        letter = (answer or "").strip().upper()
+        cursor.execute("UPDATE quiz SET question = ? WHERE id = ?", (stem, quiz_id))
+        cursor.executemany(
+            "INSERT INTO quiz_options (quiz_id, position, label, is_correct) VALUES (?, ?, ?, ?)",
+            [
+                (quiz_id, position, label, int(chr(ord("A") + position) == letter))
+                for position, label in enumerate(labels)
+            ]
+        )
+
+    # Theory written as a single text: split it into sections
+    cursor.execute("""
+        SELECT id, content FROM tasks
+        WHERE task_type = 'theory'
+          AND id NOT IN (SELECT DISTINCT task_id FROM theory_sections)
+    """)
+    for task_id, content in cursor.fetchall():
+        _insert_theory_sections(cursor, task_id, content)
+
+    if "review_schedule" not in existing_tables:
+        # Quiz and typing tasks completed before reviews existed: first review tomorrow
+        cursor.execute("""
+            INSERT OR IGNORE INTO review_schedule (
+                user_id, task_id, ease, interval_days, repetitions, due_at, last_reviewed_at
+            )
+            SELECT p.user_id, p.task_id, 2.5, 1, 1,
+                   CAST(strftime('%s', 'now') AS REAL) + 86400, CAST(strftime('%s', 'now') AS REAL)
+            FROM progression p
+            JOIN tasks t ON t.id = p.task_id
+            WHERE p.status = 'completed' AND t.task_type IN ('quiz', 'typing')
+        """)
+
+    conn.commit()
+
+
+def _split_quiz_question(text: str) -> Tuple[str, List[str]]:
+    """Split a question followed by "A) ...", "B) ..." lines into its text and choices."""
+    stem_lines, labels = [], []
+    for line in (text or "").splitlines():
+        match = re.match(r"^\s*([A-Z])\)\s*(.*)$", line)
+        if match and match.group(1) == chr(ord("A") + len(labels)):
+            labels.append(match.group(2).strip())
+        elif not labels:
+            stem_lines.append(line)
+    return "\n".join(stem_lines).strip(), labels
+
+
+def _split_theory(text: str, max_chars: int = THEORY_SECTION_CHARS) -> List[str]:
+    """Group the paragraphs of a theory text into sections of at most max_chars."""
+    sections, current = [], []
+    size = 0
+    for paragraph in re.split(r"\n\s*\n", (text or "").strip()):
+        if current and size + len(paragraph) > max_chars:
+            sections.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(paragraph)
+        size += len(paragraph) + 2
+    if current and current != [""]:
+        sections.append("\n\n".join(current))
+    return sections
+
+
+def _insert_theory_sections(cursor, task_id: int, text: str) -> None:
+    """Store the sections of a theory task's text."""
+    cursor.executemany(
+        "INSERT INTO theory_sections (task_id, position, body) VALUES (?, ?, ?)",
+        [(task_id, position, body) for position, body in enumerate(_split_theory(text))]
+    )
+
+
 def _insert_default_data(conn: sqlite3.Connection) -> None:
     """Insert default modules, lessons, and tasks if tables are empty."""
     cursor = conn.cursor()
@@ -130,41 +466,68 @@ def _insert_default_data(conn: sqlite3.Connection) -> None:
     # Lesson 1: Introduction à Python
     _insert_lesson_tasks(cursor, 1, {
         "theory": "Python est un langage de programmation interprété, facile à apprendre et très populaire. Il est utilisé pour le développement web, l'analyse de données, l'intelligence artificielle et bien plus encore.\n\nCaractéristiques principales:\n• Syntaxe claire et lisible\n• Typage dynamique\n• Grande bibliothèque standard\n• Communauté active",
-        "quiz_question": "Quel type de langage est Python?\n\nA) Compilé\nB) Interprété\nC) Assembleur\nD) Machine",
-        "quiz_answer": "B",
+        "quiz_questions": [
+            ("Quel type de langage est Python?", ["Compilé", "Interprété", "Assembleur", "Machine"], 1),
+            ("Quelle extension ont les fichiers Python?", [".pt", ".pyt", ".py", ".python"], 2),
+            ("Qui a créé Python?", ["Guido van Rossum", "Dennis Ritchie", "James Gosling", "Linus Torvalds"], 0),
+        ],
         "typing_text": "print('Bienvenue en Python!')",
         "exercise_prompt": "Écrivez un programme qui affiche 'Hello, World!' dans la console.",
-        "exercise_solution": "print('Hello, World!')"
+        "exercise_solution": "print('Hello, World!')",
+        "exercise_tests": [
+            {"expected_output": "Hello, World!\n"},
+        ]
     })
 
     # Lesson 2: La fonction print()
     _insert_lesson_tasks(cursor, 2, {
         "theory": "La fonction print() permet d'afficher du texte ou des valeurs dans la console.\n\nSyntaxe:\nprint('votre texte')\nprint(variable)\n\nExemples:\nprint('Bonjour')\nprint(42)\nprint('Résultat:', 10 + 5)",
-        "quiz_question": "Quelle syntaxe est correcte pour afficher 'Salut'?\n\nA) print Salut\nB) print('Salut')\nC) echo('Salut')\nD) display('Salut')",
-        "quiz_answer": "B",
+        "quiz_questions": [
+            ("Quelle syntaxe est correcte pour afficher 'Salut'?", ["print Salut", "print('Salut')", "echo('Salut')", "display('Salut')"], 1),
+            ("Qu'affiche print('A', 'B')?", ["AB", "A,B", "A B", "'A' 'B'"], 2),
+            ("Qu'affiche print(2 + 3)?", ["2 + 3", "5", "23", "Une erreur"], 1),
+        ],
         "typing_text": "print('Hello, Python!')\nprint(2024)",
         "exercise_prompt": "Utilisez print() pour afficher votre prénom sur une ligne et votre âge sur la ligne suivante.",
-        "exercise_solution": "print('Jean')\nprint(25)"
+        "exercise_solution": "print('Jean')\nprint(25)",
+        # Any name and age are accepted: only the number of lines is checked
+        "exercise_grading": "lines"
     })
 
     # Lesson 3: La fonction input()
     _insert_lesson_tasks(cursor, 3, {
         "theory": "La fonction input() permet de récupérer une entrée utilisateur depuis la console.\n\nSyntaxe:\nvariable = input('Message à afficher: ')\n\nExemple:\nnom = input('Entrez votre nom: ')\nprint('Bonjour', nom)\n\nNote: input() retourne toujours une chaîne de caractères (str).",
-        "quiz_question": "Quel type de données retourne input()?\n\nA) int\nB) float\nC) str\nD) bool",
-        "quiz_answer": "C",
+        "quiz_questions": [
+            ("Quel type de données retourne input()?", ["int", "float", "str", "bool"], 2),
+            ("Comment convertir la saisie en nombre entier?", ["int(input())", "input(int)", "input().int()", "number(input())"], 0),
+            ("À quoi sert le texte passé à input('Nom: ')?", ["Valeur par défaut", "Message affiché à l'utilisateur", "Nom de la variable", "Type attendu"], 1),
+        ],
         "typing_text": "nom = input('Votre nom: ')\nprint('Bonjour', nom)",
         "exercise_prompt": "Demandez à l'utilisateur son prénom avec input(), puis affichez 'Bienvenue, [prénom]!'",
-        "exercise_solution": "prenom = input('Entrez votre prénom: ')\nprint('Bienvenue,', prenom + '!')"
+        "exercise_solution": "prenom = input('Entrez votre prénom: ')\nprint('Bienvenue,', prenom + '!')",
+        "exercise_stdin": "Alice\n",
+        # Expected output comes from running the solution with each input
+        "exercise_tests": [
+            {"stdin": "Alice\n"},
+            {"stdin": "Mohamed\n"},
+            {"stdin": "Zoé\n"},
+        ]
     })
 
     # Lesson 4: Commentaires en Python
     _insert_lesson_tasks(cursor, 4, {
         "theory": "Les commentaires permettent de documenter votre code sans affecter son exécution.\n\nCommentaire sur une ligne:\n# Ceci est un commentaire\n\nCommentaire multi-lignes:\n'''\nCeci est un\ncommentaire sur\nplusieurs lignes\n'''\n\nBonne pratique: Commentez votre code pour le rendre compréhensible!",
-        "quiz_question": "Comment écrire un commentaire sur une ligne en Python?\n\nA) // commentaire\nB) /* commentaire */\nC) # commentaire\nD) -- commentaire",
-        "quiz_answer": "C",
+        "quiz_questions": [
+            ("Comment écrire un commentaire sur une ligne en Python?", ["// commentaire", "/* commentaire */", "# commentaire", "-- commentaire"], 2),
+            ("Que fait Python d'un commentaire?", ["Il l'affiche", "Il l'ignore", "Il l'exécute", "Il le traduit"], 1),
+            ("Quelle syntaxe permet d'écrire un texte sur plusieurs lignes?", ["''' texte '''", "<!-- texte -->", "## texte ##", "{# texte #}"], 0),
+        ],
         "typing_text": "# Mon premier programme\nprint('Hello')  # Affiche Hello",
         "exercise_prompt": "Écrivez un programme avec un commentaire expliquant ce que fait le code, suivi d'un print().",
-        "exercise_solution": "# Ce programme affiche un message de bienvenue\nprint('Bienvenue dans PyLearn!')"
+        "exercise_solution": "# Ce programme affiche un message de bienvenue\nprint('Bienvenue dans PyLearn!')",
+        "exercise_grading": "lines",
+        # Comments do not change the output: check the source for one
+        "exercise_requirements": "comment"
     })
     # ------------------------------------------------------------------
     # Insert initial progression for user 1 (first lesson unlocked)
@@ -213,16 +576,28 @@ def _insert_lesson_tasks(cursor, lesson_id: int, content: dict) -> None:
         "INSERT INTO tasks (lesson_id, name, task_type, description, content) VALUES (?, ?, ?, ?, ?)",
         (lesson_id, "Théorie", "theory", "Lire la théorie de la leçon", content["theory"])
     )
+    _insert_theory_sections(cursor, cursor.lastrowid, content["theory"])
 
     # Task 2: Quiz
     cursor.execute(
         "INSERT INTO tasks (lesson_id, name, task_type, description, content) VALUES (?, ?, ?, ?, ?)",
         (lesson_id, "Quiz", "quiz", "Répondre aux questions du quiz", None)
     )
-    cursor.execute(
-        "INSERT INTO quiz (lesson_id, question, answer) VALUES (?, ?, ?)",
-        (lesson_id, content["quiz_question"], content["quiz_answer"])
-    )
+    quiz_task_id = cursor.lastrowid
+    for position, (question, options, correct) in enumerate(content["quiz_questions"]):
+        # `answer` keeps the letter of the right option for older readers
+        cursor.execute(
+            "INSERT INTO quiz (lesson_id, task_id, position, question, answer) VALUES (?, ?, ?, ?, ?)",
+            (lesson_id, quiz_task_id, position, question, chr(ord("A") + correct))
+        )
+        quiz_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO quiz_options (quiz_id, position, label, is_correct) VALUES (?, ?, ?, ?)",
+            [
+                (quiz_id, option_position, label, int(option_position == correct))
+                for option_position, label in enumerate(options)
+            ]
+        )
 
     # Task 3: Typing
     cursor.execute(
@@ -230,8 +605,8 @@ def _insert_lesson_tasks(cursor, lesson_id: int, content: dict) -> None:
         (lesson_id, "Typing", "typing", "Pratiquer la frappe de code", None)
     )
     cursor.execute(
-        "INSERT INTO typing (lesson_id, text) VALUES (?, ?)",
-        (lesson_id, content["typing_text"])
+        "INSERT INTO typing (lesson_id, task_id, text) VALUES (?, ?, ?)",
+        (lesson_id, cursor.lastrowid, content["typing_text"])
     )
 
     # Task 4: Exercise
@@ -240,6 +615,19 @@ def _insert_lesson_tasks(cursor, lesson_id: int, content: dict) -> None:
         (lesson_id, "Exercice", "exercise", "Compléter l'exercice de code", None)
     )
     cursor.execute(
-        "INSERT INTO exercise (lesson_id, prompt, solution) VALUES (?, ?, ?)",
-        (lesson_id, content["exercise_prompt"], content["exercise_solution"])
+        "INSERT INTO exercise (lesson_id, task_id, prompt, solution, stdin, grading, requirements) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (lesson_id, cursor.lastrowid, content["exercise_prompt"], content["exercise_solution"],
+         content.get("exercise_stdin", ""), content.get("exercise_grading", "output"),
+         content.get("exercise_requirements", ""))
+    )
+    exercise_id = cursor.lastrowid
+    cursor.executemany(
+        "INSERT INTO exercise_tests (exercise_id, position, stdin, expected_output, assertion) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [
+            (exercise_id, position, test.get("stdin", ""), test.get("expected_output"),
+             test.get("assertion"))
+            for position, test in enumerate(content.get("exercise_tests", []))
+        ]
     )
@@ -0,0 +1,108 @@
+# activity_chart.py
+# Bar chart of an activity series, painted with QPainter.
+# Series longer than the widget is wide are bucketed per pixel column
+# once per resize, so painting costs the same for a week or for years.
+
+from typing import List, Optional, Sequence
+
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+
+class ActivityChart(QWidget):
+    """Bars for one value per period, with an optional line over them.
+
+    Typically daily successes as bars and their 7-day rolling sum as the
+    line. The first and last period labels are drawn under the bars.
+    """
+
+    BAR_COLOR = "#3c78d8"
+    LINE_COLOR = "#27ae60"
+    AXIS_COLOR = "#dddddd"
+    LABEL_COLOR = "#666666"
+    LABEL_HEIGHT = 18
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setMinimumHeight(120)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self._values: List[int] = []
+        self._line: List[int] = []
+        self._first_label = ""
+        self._last_label = ""
+        # Values and line reduced to at most one point per pixel column
+        self._buckets: Optional[tuple] = None
+
+    def set_series(self, values: Sequence[int], line: Sequence[int] = (),
+                   first_label: str = "", last_label: str = "") -> None:
+        """
+        Show a new series.
+
+        Args:
+            values: One bar per period, oldest first
+            line: Optional values drawn as a line, aligned with `values`
+            first_label: Label of the first period
+            last_label: Label of the last period
+        """
+        self._values = list(values)
+        self._line = list(line)
+        self._first_label = first_label
+        self._last_label = last_label
+        self._buckets = None
+        self.update()
+
+    def resizeEvent(self, event) -> None:
+        self._buckets = None
+        super().resizeEvent(event)
+
+    def _bucketed(self, columns: int) -> tuple:
+        """Series reduced to at most `columns` points, keeping each bucket's maximum."""
+        if self._buckets is None or self._buckets[0] != columns:
+            count = len(self._values)
+            size = max(1, -(-count // max(columns, 1)))
+            values = [max(self._values[i:i + size]) for i in range(0, count, size)]
+            line = [max(self._line[i:i + size]) for i in range(0, len(self._line), size)]
+            self._buckets = (columns, values, line)
+        return self._buckets[1], self._buckets[2]
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        plot = QRectF(self.rect()).adjusted(4, 4, -4, -4 - self.LABEL_HEIGHT)
+        painter.setPen(QPen(QColor(self.AXIS_COLOR), 1))
+        painter.drawLine(plot.bottomLeft(), plot.bottomRight())
+
+        if self._values and plot.width() > 0:
+            values, line = self._bucketed(int(plot.width()))
+            peak = max(max(values), max(line) if line else 0, 1)
+            step = plot.width() / len(values)
+            gap = 1.0 if step > 3 else 0.0
+
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(self.BAR_COLOR))
+            for index, value in enumerate(values):
+                if value:
+                    height = plot.height() * value / peak
+                    painter.drawRect(QRectF(plot.left() + index * step, plot.bottom() - height,
+                                            max(step - gap, 1.0), height))
+
+            if line:
+                points = QPolygonF([
+                    QPointF(plot.left() + (index + 0.5) * step,
+                            plot.bottom() - plot.height() * value / peak)
+                    for index, value in enumerate(line)
+                ])
+                painter.setPen(QPen(QColor(self.LINE_COLOR), 2))
+                painter.setBrush(Qt.NoBrush)
+                painter.drawPolyline(points)
+
+        font = QFont(self.font())
+        font.setPixelSize(11)
+        painter.setFont(font)
+        painter.setPen(QColor(self.LABEL_COLOR))
+        labels = QRectF(plot.left(), plot.bottom() + 2, plot.width(), self.LABEL_HEIGHT - 2)
+        painter.drawText(labels, Qt.AlignLeft | Qt.AlignVCenter, self._first_label)
+        painter.drawText(labels, Qt.AlignRight | Qt.AlignVCenter, self._last_label)
+        painter.end()
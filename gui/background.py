@@ -0,0 +1,282 @@
+# background.py
+# Runs blocking work on the global QThreadPool and reports back on the
+# GUI thread through Qt signals.
+
+import threading
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Qt, Signal
+
+
+class _TaskSignals(QObject):
+    """Signals of a BackgroundTask (QRunnable is not a QObject)."""
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class BackgroundTask(QRunnable):
+    """Calls a function with arguments on a pool thread.
+
+    The function must not touch widgets or publish progression events;
+    it returns a value which is delivered to `finished` on the GUI thread.
+    """
+
+    def __init__(self, function: Callable, *args) -> None:
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.function(*self.args)
+        except Exception as exc:
+            self.signals.failed.emit(f"{type(exc).__name__}: {exc}")
+            return
+        self.signals.finished.emit(result)
+
+
+def run_in_background(function: Callable, *args,
+                      on_finished: Optional[Callable] = None,
+                      on_failed: Optional[Callable] = None) -> BackgroundTask:
+    """
+    Start `function(*args)` on the global thread pool.
+
+    Callbacks are queued to the GUI thread. Keep a reference to the returned
+    task until it has reported, so its signals object stays alive.
+
+    Returns:
+        The started BackgroundTask
+    """
+    task = BackgroundTask(function, *args)
+    if on_finished is not None:
+        task.signals.finished.connect(on_finished, Qt.QueuedConnection)
+    if on_failed is not None:
+        task.signals.failed.connect(on_failed, Qt.QueuedConnection)
+    QThreadPool.globalInstance().start(task)
+    return task
+
+
+class SnapshotRefresher:
+    """Stale-while-revalidate display of a computed summary.
+
+    The last stored summary is painted at once; the summary is then
+    recomputed on the thread pool, stored and painted again. A result
+    computed while progression changed is dropped and computed again, so
+    it never overwrites numbers already patched by progression events.
+    """
+
+    def __init__(self, store, name: str, compute: Callable[[], dict],
+                 paint: Callable[[dict], None], revision: Callable[[], int]) -> None:
+        """
+        Args:
+            store: ProgressSnapshotStore keeping the summaries
+            name: Name of the summary in the store
+            compute: Builds the summary; runs on a pool thread
+            paint: Shows a summary; runs on the GUI thread
+            revision: Returns the current progression revision
+        """
+        self.store = store
+        self.name = name
+        self.compute = compute
+        self.paint = paint
+        self.revision = revision
+        self._task: Optional[BackgroundTask] = None
+        self._started_revision: Optional[int] = None
+
+    def paint_snapshot(self) -> bool:
+        """Paint the stored summary, if any. Returns whether there was one."""
+        snapshot = self.store.load(self.name)
+        if snapshot is None:
+            return False
+        self.paint(snapshot)
+        return True
+
+    def revalidate(self) -> None:
+        """Recompute, store and paint the summary in the background."""
+        if self._task is not None:
+            # Started again when the running computation reports
+            self._started_revision = None
+            return
+        self._started_revision = self.revision()
+        self._task = run_in_background(
+            self._compute_and_store,
+            on_finished=self._on_finished,
+            on_failed=self._on_failed,
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Whether a recomputation has not reported yet."""
+        return self._task is not None
+
+    def _compute_and_store(self) -> dict:
+        """Pool thread: compute the summary and persist it."""
+        summary = self.compute()
+        self.store.save(self.name, summary)
+        return summary
+
+    def _on_finished(self, summary: dict) -> None:
+        """Paint a fresh summary, unless progression changed meanwhile."""
+        self._task = None
+        if self._started_revision != self.revision():
+            self.revalidate()
+            return
+        self.paint(summary)
+
+    def _on_failed(self, error: str) -> None:
+        """Keep the current display when the summary could not be computed."""
+        self._task = None
+
+
+class DebouncedWriter:
+    """Coalesces values per key and writes them in batches on the thread pool.
+
+    schedule() only records the latest value of a key in memory. Pending
+    values are written together at most once every `interval_ms`, one
+    batch at a time so that batches reach the database in order.
+    """
+
+    def __init__(self, write: Callable[[Dict], None], interval_ms: int) -> None:
+        """
+        Args:
+            write: Stores a batch {key: value}; runs on a pool thread
+            interval_ms: Minimum delay between two batches
+        """
+        self.write = write
+        self._pending: Dict = {}
+        self._in_flight: Dict = {}
+        self._task: Optional[BackgroundTask] = None
+        self._batch_written = threading.Event()
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def schedule(self, key, value) -> None:
+        """Record the latest value of `key`; no I/O happens here."""
+        self._pending[key] = value
+        if self._task is None and not self._timer.isActive():
+            self._timer.start()
+
+    def get(self, key, default=None):
+        """Latest value of `key` not yet known to be written, else `default`."""
+        if key in self._pending:
+            return self._pending[key]
+        return self._in_flight.get(key, default)
+
+    def flush(self) -> None:
+        """Start writing the pending values now, still in the background."""
+        self._timer.stop()
+        if self._task is not None or not self._pending:
+            return
+        self._in_flight, self._pending = self._pending, {}
+        self._batch_written.clear()
+        self._task = run_in_background(
+            self._write_batch, self._in_flight,
+            on_finished=self._on_written,
+            on_failed=self._on_failed,
+        )
+
+    def flush_now(self) -> None:
+        """Write every pending value before returning (e.g. when closing)."""
+        self._timer.stop()
+        if self._task is not None:
+            # The batch in flight holds older values: let it land first
+            self._batch_written.wait()
+        if self._pending:
+            self.write(self._pending)
+            self._pending = {}
+
+    def _write_batch(self, batch: Dict) -> None:
+        """Pool thread: store a batch, then signal flush_now()."""
+        try:
+            self.write(batch)
+        finally:
+            self._batch_written.set()
+
+    def _on_written(self, _result) -> None:
+        self._task = None
+        self._in_flight = {}
+        if self._pending:
+            self._timer.start()
+
+    def _on_failed(self, error: str) -> None:
+        """Keep the values of a failed batch unless newer ones replaced them."""
+        self._task = None
+        for key, value in self._in_flight.items():
+            self._pending.setdefault(key, value)
+        self._in_flight = {}
+        if self._pending:
+            self._timer.start()
+
+
+class LatestResultJob:
+    """Runs a function on the thread pool for the latest input only.
+
+    request() restarts a debounce delay; once input has been stable for
+    `delay_ms`, the function runs in the background. Results computed for
+    an input that has since changed are stale: they are dropped and the
+    latest input is processed instead, so `on_result` only ever sees the
+    result for the current input.
+    """
+
+    def __init__(self, function: Callable, on_result: Callable, delay_ms: int) -> None:
+        """
+        Args:
+            function: Computes a result from one input; runs on a pool thread
+            on_result: Receives each up-to-date result on the GUI thread
+            delay_ms: Time without new input before the function runs
+        """
+        self.function = function
+        self.on_result = on_result
+        self._input = None
+        # Incremented with each input; a result is current if it matches
+        self._generation = 0
+        self._task: Optional[BackgroundTask] = None
+        self._task_generation = 0
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._start)
+
+    def request(self, value) -> None:
+        """Process `value` once input settles; earlier inputs become stale."""
+        self._input = value
+        self._generation += 1
+        self._timer.start()
+
+    def cancel(self) -> None:
+        """Drop the pending input and any result still being computed."""
+        self._timer.stop()
+        self._input = None
+        self._generation += 1
+
+    def _start(self) -> None:
+        if self._task is not None:
+            # Restarted with the latest input when the running one reports
+            return
+        self._task_generation = self._generation
+        self._task = run_in_background(
+            self.function, self._input,
+            on_finished=self._on_finished,
+            on_failed=self._on_failed,
+        )
+
+    def _on_finished(self, result) -> None:
+        self._task = None
+        if self._task_generation == self._generation:
+            self.on_result(result)
+        else:
+            self._restart_if_stale()
+
+    def _on_failed(self, error: str) -> None:
+        """Drop a failed run; an input received meanwhile is still processed."""
+        self._task = None
+        if self._task_generation != self._generation:
+            self._restart_if_stale()
+
+    def _restart_if_stale(self) -> None:
+        """Process the latest input now, unless it was cancelled or is still settling."""
+        if self._input is not None and not self._timer.isActive():
+            self._start()
@@ -0,0 +1,191 @@
+# card_delegates.py
+# Item delegates painting module and lesson cards for the list models.
+# Cards, lock icons, progress bars and buttons are painted, not widgets,
+# so a catalog of any size costs one row dict per item.
+
+from PySide6.QtCore import QRect, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+from gui.list_models import CardListModel
+
+
+# ----------------------------------------------------------------------
+# Painting helpers
+# ----------------------------------------------------------------------
+
+def _percent(item: dict) -> int:
+    """Completion percentage of a row with completed/total counts."""
+    total = item["total"]
+    return round((item["completed"] / total) * 100) if total > 0 else 0
+
+
+def _font(base: QFont, pixel_size: int, bold: bool = False) -> QFont:
+    """Copy a font with a pixel size and weight."""
+    font = QFont(base)
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
+
+
+def _paint_card(painter: QPainter, rect: QRect, hovered: bool) -> None:
+    """Paint the rounded white card background."""
+    painter.setPen(QPen(QColor("#cccccc" if hovered else "#dddddd"), 1))
+    painter.setBrush(QColor("#fafafa" if hovered else "#ffffff"))
+    painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 12, 12)
+
+
+def _paint_text(painter: QPainter, rect: QRect, text: str, font: QFont,
+                color: str, flags=Qt.AlignLeft | Qt.AlignVCenter) -> None:
+    """Paint text, eliding it when it does not wrap."""
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    if not flags & Qt.TextWordWrap:
+        text = painter.fontMetrics().elidedText(text, Qt.ElideRight, rect.width())
+    painter.drawText(rect, flags, text)
+
+
+def _paint_progress_bar(painter: QPainter, rect: QRect, percent: int, text: str,
+                        chunk_color: str, font: QFont) -> None:
+    """Paint a progress bar with centered text."""
+    painter.setPen(QPen(QColor("#dddddd"), 1))
+    painter.setBrush(QColor("#f0f0f0"))
+    painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+
+    if percent > 0:
+        chunk = QRectF(rect).adjusted(1, 1, -1, -1)
+        chunk.setWidth(chunk.width() * min(percent, 100) / 100)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(chunk_color))
+        painter.drawRoundedRect(chunk, 3, 3)
+
+    _paint_text(painter, rect, text, font, "#333333", Qt.AlignCenter)
+
+
+def _paint_button(painter: QPainter, rect: QRect, text: str, primary: bool,
+                  enabled: bool, font: QFont) -> None:
+    """Paint a primary (blue) or secondary (grey) button face."""
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor("#3c78d8" if primary else "#e0e0e0"))
+    painter.drawRoundedRect(QRectF(rect), 6, 6)
+    if primary:
+        color = "#ffffff"
+    else:
+        color = "#333333" if enabled else "#999999"
+    _paint_text(painter, rect, text, font, color, Qt.AlignCenter)
+
+
+# ----------------------------------------------------------------------
+# Delegates
+# ----------------------------------------------------------------------
+
+class ModuleCardDelegate(QStyledItemDelegate):
+    """Paints a module as a 280x220 card with icon, progress and button."""
+
+    CARD_SIZE = QSize(280, 220)
+    PADDING = 20
+
+    def sizeHint(self, option, index) -> QSize:
+        return self.CARD_SIZE
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        module = index.data(CardListModel.ItemRole)
+        if module is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = option.rect
+        _paint_card(painter, rect, bool(option.state & QStyle.State_MouseOver))
+
+        inner = rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        left, top, width = inner.left(), inner.top(), inner.width()
+        unlocked = module["is_unlocked"]
+        percent = _percent(module)
+
+        _paint_text(painter, QRect(left, top, width, 40), "📘" if unlocked else "🔒",
+                    _font(option.font, 32), "#333333", Qt.AlignCenter)
+        _paint_text(painter, QRect(left, top + 44, width, 24), module["name"],
+                    _font(option.font, 16, bold=True), "#222222", Qt.AlignCenter)
+        _paint_text(painter, QRect(left, top + 70, width, 36), module["description"],
+                    _font(option.font, 12), "#666666",
+                    Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap)
+        _paint_progress_bar(painter, QRect(left, top + 112, width, 18), percent,
+                            f"{percent}%", "#3c78d8", _font(option.font, 11, bold=True))
+
+        if unlocked:
+            button_text = "Continuer" if percent > 0 else "Commencer"
+        else:
+            button_text = "Verrouillé"
+        _paint_button(painter, QRect(left, inner.bottom() - 35, width, 36), button_text,
+                      primary=unlocked, enabled=unlocked, font=_font(option.font, 13))
+
+        painter.restore()
+
+
+class LessonCardDelegate(QStyledItemDelegate):
+    """Paints a lesson as a 100px high card with status, progress and button."""
+
+    CARD_HEIGHT = 100
+    BUTTON_WIDTH = 120
+
+    # status -> (icon, color)
+    STATUS_ICONS = {
+        "completed": ("✔", "#27ae60"),
+        "in_progress": ("●", "#3c78d8"),
+    }
+    LOCKED_ICON = ("🔒", "#7f8c8d")
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(400, self.CARD_HEIGHT)
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        lesson = index.data(CardListModel.ItemRole)
+        if lesson is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = option.rect
+        _paint_card(painter, rect, bool(option.state & QStyle.State_MouseOver))
+
+        inner = rect.adjusted(20, 15, -20, -15)
+        left, top, height = inner.left(), inner.top(), inner.height()
+        status = lesson["status"]
+        percent = _percent(lesson)
+
+        # Status icon and lesson number
+        icon, color = self.STATUS_ICONS.get(status, self.LOCKED_ICON)
+        _paint_text(painter, QRect(left, top, 30, height), icon,
+                    _font(option.font, 20), color)
+        _paint_text(painter, QRect(left + 45, top, 30, height), f"{lesson['number']}.",
+                    _font(option.font, 16, bold=True), "#2c3e50")
+
+        # Lesson info with progress bar
+        info_left = left + 90
+        info_width = inner.right() - self.BUTTON_WIDTH - 15 - info_left
+        _paint_text(painter, QRect(info_left, top, info_width, 22), lesson["name"],
+                    _font(option.font, 14, bold=True), "#222222")
+        _paint_text(painter, QRect(info_left, top + 24, info_width, 20), lesson["description"],
+                    _font(option.font, 12), "#666666")
+        _paint_progress_bar(
+            painter, QRect(info_left, top + height - 16, info_width, 16), percent,
+            f"{lesson['completed']}/{lesson['total']} tâches ({percent}%)",
+            "#27ae60", _font(option.font, 10),
+        )
+
+        # Action button
+        if status == "locked":
+            text, primary = "Verrouillé", False
+        elif status == "completed":
+            text, primary = "Réviser", False
+        else:
+            text, primary = "Continuer", True
+        button_rect = QRect(inner.right() - self.BUTTON_WIDTH, top + (height - 34) // 2,
+                            self.BUTTON_WIDTH, 34)
+        _paint_button(painter, button_rect, text, primary=primary,
+                      enabled=status != "locked", font=_font(option.font, 13))
+
+        painter.restore()
@@ -0,0 +1,136 @@
+# code_highlighter.py
+# Python syntax highlighting: incremental for editors, cached HTML for
+# static code (typing targets, solutions).
+
+import hashlib
+from collections import OrderedDict
+from html import escape
+from typing import Dict
+
+from PySide6.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat, QTextDocument
+
+from utils.python_tokens import (
+    STATE_NORMAL,
+    KEYWORD,
+    BUILTIN,
+    STRING,
+    NUMBER,
+    COMMENT,
+    DECORATOR,
+    DEFINITION,
+    tokenize_line,
+)
+
+# Token kind -> color, for dark (editor, typing target) and light backgrounds
+THEMES: Dict[str, Dict[str, str]] = {
+    "dark": {
+        KEYWORD: "#c586c0",
+        BUILTIN: "#4ec9b0",
+        STRING: "#ce9178",
+        NUMBER: "#b5cea8",
+        COMMENT: "#6a9955",
+        DECORATOR: "#dcdcaa",
+        DEFINITION: "#dcdcaa",
+    },
+    "light": {
+        KEYWORD: "#af00db",
+        BUILTIN: "#267f99",
+        STRING: "#a31515",
+        NUMBER: "#098658",
+        COMMENT: "#008000",
+        DECORATOR: "#795e26",
+        DEFINITION: "#795e26",
+    },
+}
+
+# Kinds drawn in bold or italic, whatever the theme
+BOLD_KINDS = (KEYWORD, DEFINITION)
+ITALIC_KINDS = (COMMENT,)
+
+
+class PythonHighlighter(QSyntaxHighlighter):
+    """Highlights Python code in a QTextDocument, one block (line) at a time.
+
+    Each block stores the tokenizer state it ends in. After an edit, Qt
+    re-highlights the edited blocks and keeps going only while the end
+    state of a block changes (e.g. a triple-quoted string was opened), so
+    typing in a large cell touches a single line.
+    """
+
+    def __init__(self, document: QTextDocument, theme: str = "dark") -> None:
+        super().__init__(document)
+        self._formats: Dict[str, QTextCharFormat] = {}
+        for kind, color in THEMES[theme].items():
+            char_format = QTextCharFormat()
+            char_format.setForeground(QColor(color))
+            if kind in BOLD_KINDS:
+                char_format.setFontWeight(QFont.Bold)
+            if kind in ITALIC_KINDS:
+                char_format.setFontItalic(True)
+            self._formats[kind] = char_format
+
+    def highlightBlock(self, text: str) -> None:
+        # previousBlockState() is -1 for the first block
+        state = max(self.previousBlockState(), STATE_NORMAL)
+        tokens, end_state = tokenize_line(text, state)
+        for start, length, kind in tokens:
+            self.setFormat(start, length, self._formats[kind])
+        self.setCurrentBlockState(end_state)
+
+
+# ----------------------------------------------------------------------
+# Static code as HTML
+# ----------------------------------------------------------------------
+
+# Rendered HTML keyed by (theme, sha256 of the code), least recently used first
+_HTML_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+HTML_CACHE_SIZE = 128
+
+
+def highlight_html(code: str, theme: str = "dark") -> str:
+    """
+    Render Python code as highlighted HTML for a rich-text QLabel.
+
+    Renderings are cached by content hash, so showing the same typing
+    target or solution again costs a dictionary lookup.
+
+    Args:
+        code: Python source
+        theme: Key of THEMES matching the label's background
+
+    Returns:
+        A <pre> element keeping whitespace and wrapping long lines
+    """
+    key = (theme, hashlib.sha256(code.encode("utf-8")).hexdigest())
+    html = _HTML_CACHE.get(key)
+    if html is not None:
+        _HTML_CACHE.move_to_end(key)
+        return html
+
+    html = _render_html(code, THEMES[theme])
+    _HTML_CACHE[key] = html
+    if len(_HTML_CACHE) > HTML_CACHE_SIZE:
+        _HTML_CACHE.popitem(last=False)
+    return html
+
+
+def _render_html(code: str, colors: Dict[str, str]) -> str:
+    """Tokenize every line and wrap each token in a colored span."""
+    lines = []
+    state = STATE_NORMAL
+    for line in code.split("\n"):
+        tokens, state = tokenize_line(line, state)
+        parts = []
+        position = 0
+        for start, length, kind in tokens:
+            parts.append(escape(line[position:start]))
+            style = f"color: {colors[kind]};"
+            if kind in BOLD_KINDS:
+                style += " font-weight: bold;"
+            if kind in ITALIC_KINDS:
+                style += " font-style: italic;"
+            parts.append(f'<span style="{style}">{escape(line[start:start + length])}</span>')
+            position = start + length
+        parts.append(escape(line[position:]))
+        lines.append("".join(parts))
+    return '<pre style="white-space: pre-wrap; margin: 0;">' + "\n".join(lines) + "</pre>"
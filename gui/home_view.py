@@ -14,8 +14,9 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QProgressBar,
 )
-from controllers.progression_manager import ProgressionManager
-from controllers.module_controller import ModuleController
+from service_container import ServiceContainer
+from gui.background import SnapshotRefresher
+from controllers.progression_events import TaskCompleted, TaskReopened
 
 
 class HomeView(QWidget):
@@ -25,18 +26,39 @@ class HomeView(QWidget):
         navigate_to_modules: emitted when the user clicks "Commencer l'apprentissage".
         navigate_continue: emitted when the user clicks "Continuer".
         navigate_to_statistics: emitted when the user clicks "Statistiques".
+        navigate_to_review: emitted when the user clicks "Réviser".
     """
 
     navigate_to_modules = Signal()
     navigate_continue = Signal()
     navigate_to_statistics = Signal()
+    navigate_to_review = Signal()
 
-    def __init__(self) -> None:
+    # Name of the stored summary painted at startup
+    SNAPSHOT_NAME = "home"
+
+    def __init__(self, services: ServiceContainer) -> None:
         super().__init__()
-        self.progression_manager = ProgressionManager()
-        self.module_controller = ModuleController()
+        self.progression_manager = services.progression_manager
+        self.module_controller = services.module_controller
+        self.review_scheduler = services.review_scheduler
+        # Stored summary painted at startup, recomputed in the background
+        self._summary = SnapshotRefresher(
+            services.progress_snapshots, self.SNAPSHOT_NAME,
+            self._compute_summary, self._paint_summary,
+            lambda: services.events.revision,
+        )
+        # Running task counts behind the global progress bar
+        self._completed_tasks = 0
+        self._total_tasks = 0
+        # module_id -> widgets and counts of the preview cards, for patching
+        self._module_cards = {}
         self._setup_ui()
 
+        # Patch progress in place when progression changes
+        services.events.subscribe(TaskCompleted, self._on_task_completed)
+        services.events.subscribe(TaskReopened, self._on_task_reopened)
+
     # ------------------------------------------------------------------
     # UI construction
     # ------------------------------------------------------------------
@@ -85,8 +107,14 @@ class HomeView(QWidget):
         stats_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         stats_button.clicked.connect(self._on_stats_clicked)
 
+        self.review_button = QPushButton("🔁 Réviser")
+        self.review_button.setObjectName("secondaryButton")
+        self.review_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self.review_button.clicked.connect(self._on_review_clicked)
+
         buttons_layout.addWidget(start_button)
         buttons_layout.addWidget(continue_button)
+        buttons_layout.addWidget(self.review_button)
         buttons_layout.addWidget(stats_button)
 
         # Module preview section
@@ -111,8 +139,9 @@ class HomeView(QWidget):
 
         self.setLayout(main_layout)
 
-        # Load dynamic content
-        self._load_modules_preview()
+        # Paint the last stored summary right away, then bring it up to date
+        self._summary.paint_snapshot()
+        self._summary.revalidate()
 
     def _create_global_progress_section(self) -> QFrame:
         """Create a global progress bar section."""
@@ -151,32 +180,54 @@ class HomeView(QWidget):
 
         return frame
 
+    # ------------------------------------------------------------------
+    # Progress summary (stale-while-revalidate)
+    # ------------------------------------------------------------------
+    def _compute_summary(self) -> dict:
+        """Compute the home summary. Runs on the thread pool."""
+        global_stats = self.progression_manager.get_global_progress()
+
+        # Show first 3 modules as preview
+        modules = []
+        for module in self.module_controller.load_modules()[:3]:
+            progress = self.progression_manager.get_module_progress(module["id"])
+            modules.append({
+                "id": module["id"],
+                "name": module.get("name", "Module"),
+                "is_unlocked": module.get("is_unlocked", False),
+                "completed": progress.get("completed", 0),
+                "total": progress.get("total", 0),
+                "percent": progress.get("percent", 0),
+            })
+
+        return {
+            "completed_tasks": global_stats.get("completed_tasks", 0),
+            "total_tasks": global_stats.get("total_tasks", 0),
+            "modules": modules,
+            "due_reviews": self.review_scheduler.count_due_reviews(),
+        }
+
     def _load_modules_preview(self) -> None:
         """Load modules from database with dynamic progress."""
+        summary = self._compute_summary()
+        self._paint_summary(summary)
+
+    def _paint_summary(self, summary: dict) -> None:
+        """Show a home summary: global progress, module cards, due reviews."""
         # Clear existing cards
+        self._module_cards = {}
         while self.modules_list_layout.count():
             child = self.modules_list_layout.takeAt(0)
             if child.widget():
                 child.widget().deleteLater()
 
-        # Get global progress
-        global_stats = self.progression_manager.get_global_progress()
-        global_percent = global_stats.get("global_percent", 0)
-        self.global_progress_bar.setValue(global_percent)
-        self.progress_label.setText(f"Progression globale: {global_percent}%")
-
-        # Load modules from database
-        modules = self.module_controller.load_modules()
+        self._completed_tasks = summary.get("completed_tasks", 0)
+        self._total_tasks = summary.get("total_tasks", 0)
+        self._update_global_progress()
 
-        # Show first 3 modules as preview
-        for module in modules[:3]:
-            module_id = module.get("id")
-            title = module.get("name", "Module")
-            unlocked = module.get("is_unlocked", False)
-
-            # Get progress for this module
-            progress = self.progression_manager.get_module_progress(module_id)
-            percent = progress.get("percent", 0)
+        for module in summary.get("modules", []):
+            unlocked = module["is_unlocked"]
+            percent = module["percent"]
 
             if unlocked:
                 status_text = f"{percent}%"
@@ -184,13 +235,30 @@ class HomeView(QWidget):
                 status_text = "Verrouillé"
 
             card = self._create_module_card(
-                title=title,
+                title=module["name"],
                 status_text=status_text,
                 locked=not unlocked,
                 progress_percent=percent if unlocked else 0,
             )
             self.modules_list_layout.addWidget(card)
 
+            if unlocked:
+                self._module_cards[module["id"]] = {
+                    "progress_bar": card.findChild(QProgressBar),
+                    "status_label": card.findChild(QLabel, "moduleStatus"),
+                    "completed": module["completed"],
+                    "total": module["total"],
+                }
+
+        self._update_review_button(summary.get("due_reviews", 0))
+
+    def _update_global_progress(self) -> None:
+        """Show the running task counts on the global progress bar."""
+        total = self._total_tasks
+        global_percent = round((self._completed_tasks / total) * 100) if total > 0 else 0
+        self.global_progress_bar.setValue(global_percent)
+        self.progress_label.setText(f"Progression globale: {global_percent}%")
+
     def _create_module_card(self, title: str, status_text: str, locked: bool, progress_percent: int = 0) -> QFrame:
         """Create a simple horizontal module card with progress."""
         card = QFrame()
@@ -220,6 +288,7 @@ class HomeView(QWidget):
 
         # Status text
         status_label = QLabel(status_text)
+        status_label.setObjectName("moduleStatus")
         status_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         top_row.addWidget(status_label)
 
@@ -248,10 +317,48 @@ class HomeView(QWidget):
 
         return card
 
+    def _update_review_button(self, due: int) -> None:
+        """Show how many reviews are due; nothing to review disables the button."""
+        self.review_button.setText(f"🔁 Réviser ({due})" if due else "🔁 Réviser")
+        self.review_button.setEnabled(due > 0)
+
     def refresh_data(self) -> None:
         """Refresh the home view with latest progress data."""
         self._load_modules_preview()
 
+    def refresh_view(self) -> None:
+        """Bring the summary up to date after progression changed.
+
+        Progress bars are already patched by progression events; this also
+        updates the due reviews and the stored snapshot.
+        """
+        self._summary.revalidate()
+
+    # ------------------------------------------------------------------
+    # Progression event handlers
+    # ------------------------------------------------------------------
+    def _shift_completed(self, module_id: int, delta: int) -> None:
+        """Adjust the global counts and the affected module preview card."""
+        self._completed_tasks = max(0, min(self._total_tasks, self._completed_tasks + delta))
+        self._update_global_progress()
+
+        card = self._module_cards.get(module_id)
+        if card is None:
+            return
+        card["completed"] = max(0, min(card["total"], card["completed"] + delta))
+        total = card["total"]
+        percent = round((card["completed"] / total) * 100) if total > 0 else 0
+        card["progress_bar"].setValue(percent)
+        card["status_label"].setText(f"{percent}%")
+
+    def _on_task_completed(self, event: TaskCompleted) -> None:
+        """Count a newly completed task."""
+        self._shift_completed(event.module_id, 1)
+
+    def _on_task_reopened(self, event: TaskReopened) -> None:
+        """Un-count a task that is no longer completed."""
+        self._shift_completed(event.module_id, -1)
+
     # ------------------------------------------------------------------
     # Signal emitters
     # ------------------------------------------------------------------
@@ -266,3 +373,7 @@ class HomeView(QWidget):
     def _on_stats_clicked(self) -> None:
         """Emit navigation signal when the user wants to see statistics."""
         self.navigate_to_statistics.emit()
+
+    def _on_review_clicked(self) -> None:
+        """Emit navigation signal when the user wants to review due tasks."""
+        self.navigate_to_review.emit()
@@ -1,20 +1,21 @@
 # lessons_view.py
 # Lessons screen view for PyLearn Desktop
-# Displays a list of lessons for the selected module as styled cards.
+# Displays a list of lessons for the selected module as painted cards.
 
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QModelIndex
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QScrollArea,
-    QFrame,
-    QProgressBar,
+    QListView,
+    QAbstractItemView,
 )
-from controllers.lesson_controller import LessonController
-from controllers.progression_manager import ProgressionManager
+from service_container import ServiceContainer
+from gui.list_models import LessonListModel
+from gui.card_delegates import LessonCardDelegate
+from controllers.progression_events import TaskCompleted, TaskReopened, LessonCompleted
 
 
 class LessonsView(QWidget):
@@ -30,16 +31,22 @@ class LessonsView(QWidget):
     navigate_to_tasks = Signal(int)
     navigate_back = Signal()
 
-    def __init__(self) -> None:
+    def __init__(self, services: ServiceContainer) -> None:
         super().__init__()
-        self.controller = LessonController()
-        self.progression_manager = ProgressionManager()
+        self.controller = services.lesson_controller
+        self.progression_manager = services.progression_manager
         self.lessons = []
         self.current_module_id = None
+        self.current_module_name = ""
         # Placeholder module name; can be updated later by controllers
         self._module_name = "Module 1 : Python Start"
         self._setup_ui()
 
+        # Patch lesson cards in place when progression changes
+        services.events.subscribe(TaskCompleted, self._on_task_completed)
+        services.events.subscribe(TaskReopened, self._on_task_reopened)
+        services.events.subscribe(LessonCompleted, self._on_lesson_completed)
+
     # ------------------------------------------------------------------
     # UI construction
     # ------------------------------------------------------------------
@@ -74,25 +81,29 @@ class LessonsView(QWidget):
         self.subtitle.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.subtitle)
 
-        # Scrollable area for lessons
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        scroll_content = QWidget()
-        self.lessons_layout = QVBoxLayout(scroll_content)
-        self.lessons_layout.setSpacing(15)
-        self.lessons_layout.setContentsMargins(50, 10, 50, 10)
-
-        scroll.setWidget(scroll_content)
-        layout.addWidget(scroll)
+        # Virtualized list of lesson cards
+        self.model = LessonListModel(self)
+        self.lesson_list = QListView()
+        self.lesson_list.setObjectName("lessonList")
+        self.lesson_list.setModel(self.model)
+        self.lesson_list.setItemDelegate(LessonCardDelegate(self.lesson_list))
+        self.lesson_list.setUniformItemSizes(True)
+        self.lesson_list.setLayoutMode(QListView.Batched)
+        self.lesson_list.setSpacing(8)
+        self.lesson_list.setViewportMargins(42, 0, 42, 0)
+        self.lesson_list.setSelectionMode(QAbstractItemView.NoSelection)
+        self.lesson_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.lesson_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.lesson_list.viewport().setCursor(Qt.PointingHandCursor)
+        self.lesson_list.clicked.connect(self._on_lesson_clicked)
+        layout.addWidget(self.lesson_list)
 
         self.setLayout(layout)
 
     def load_lessons(self, module_id: int, module_name: str = ""):
         """Load lessons for a specific module."""
         self.current_module_id = module_id
+        self.current_module_name = module_name
 
         # Update title
         if module_name:
@@ -100,119 +111,69 @@ class LessonsView(QWidget):
         else:
             self.title.setText(f"Leçons du module {module_id}")
 
-        # Clear existing lesson cards
-        while self.lessons_layout.count():
-            item = self.lessons_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Load lessons from controller
+        # Load lessons and their progress (one query for all lessons)
         self.lessons = self.controller.load_lessons(module_id)
+        progress_by_lesson = self.progression_manager.get_lessons_progress(module_id)
+
+        rows = []
+        for number, lesson in enumerate(self.lessons, start=1):
+            progress = progress_by_lesson.get(lesson["id"], {"completed": 0, "total": 0})
+            rows.append(dict(
+                lesson,
+                number=number,
+                completed=progress["completed"],
+                total=progress["total"],
+            ))
+        self.model.set_rows(rows)
 
-        # Create lesson cards
-        for idx, lesson in enumerate(self.lessons):
-            card = self._create_lesson_card(lesson, idx + 1)
-            self.lessons_layout.addWidget(card)
-
-        # Add stretch at the end
-        self.lessons_layout.addStretch()
-
-    def _create_lesson_card(self, lesson: dict, number: int) -> QFrame:
-        """Create a card widget for a lesson."""
-        card = QFrame()
-        card.setObjectName("lessonCard")
-        card.setFixedHeight(100)
-
-        card_layout = QHBoxLayout(card)
-        card_layout.setContentsMargins(20, 15, 20, 15)
-        card_layout.setSpacing(15)
-
-        # Status icon
-        status = lesson["status"]
-        if status == "completed":
-            status_icon = "✔"
-            status_color = "#27ae60"
-        elif status == "in_progress":
-            status_icon = "●"
-            status_color = "#3c78d8"
-        else:  # locked
-            status_icon = "🔒"
-            status_color = "#7f8c8d"
-
-        icon_label = QLabel(status_icon)
-        icon_label.setStyleSheet(f"font-size: 20px; color: {status_color};")
-        icon_label.setFixedWidth(30)
-        card_layout.addWidget(icon_label)
-
-        # Lesson number
-        num_label = QLabel(f"{number}.")
-        num_label.setStyleSheet(
-            "font-size: 16px; font-weight: bold; color: #2c3e50;"
-        )
-        num_label.setFixedWidth(30)
-        card_layout.addWidget(num_label)
-
-        # Lesson info with progress bar
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(4)
-
-        name_label = QLabel(lesson["name"])
-        name_label.setObjectName("lessonTitle")
-        info_layout.addWidget(name_label)
-
-        desc_label = QLabel(lesson["description"])
-        desc_label.setObjectName("lessonDescription")
-        info_layout.addWidget(desc_label)
-
-        # Progress bar for lesson
-        progress = self.progression_manager.get_lesson_progress(lesson["id"])
-        progress_bar = QProgressBar()
-        progress_bar.setObjectName("lessonProgressBar")
-        progress_bar.setMinimum(0)
-        progress_bar.setMaximum(100)
-        progress_bar.setValue(progress["percent"])
-        progress_bar.setFormat(f"{progress['completed']}/{progress['total']} tâches ({progress['percent']}%)")
-        progress_bar.setTextVisible(True)
-        progress_bar.setFixedHeight(16)
-        progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #ddd;
-                border-radius: 3px;
-                background-color: #f0f0f0;
-                text-align: center;
-                font-size: 10px;
-            }
-            QProgressBar::chunk {
-                background-color: #27ae60;
-                border-radius: 2px;
-            }
-        """)
-        info_layout.addWidget(progress_bar)
-
-        card_layout.addLayout(info_layout, 1)
-
-        # Action button
-        if status == "locked":
-            btn = QPushButton("Verrouillé")
-            btn.setObjectName("secondaryButton")
-            btn.setEnabled(False)
-        elif status == "completed":
-            btn = QPushButton("Réviser")
-            btn.setObjectName("secondaryButton")
-            btn.clicked.connect(
-                lambda checked, l_id=lesson["id"]: self.navigate_to_tasks.emit(l_id)
-            )
-        else:
-            btn = QPushButton("Continuer")
-            btn.setObjectName("primaryButton")
-            btn.clicked.connect(
-                lambda checked, l_id=lesson["id"]: self.navigate_to_tasks.emit(l_id)
-            )
-
-        btn.setFixedWidth(120)
-        card_layout.addWidget(btn)
+    # ------------------------------------------------------------------
+    # Navigation history state
+    # ------------------------------------------------------------------
+    def navigation_params(self):
+        """Parameters of the content shown, or None before the first load."""
+        if self.current_module_id is None:
+            return None
+        return {"module_id": self.current_module_id, "module_name": self.current_module_name}
+
+    def open_with(self, params: dict) -> None:
+        """Load the view for a history entry."""
+        self.load_lessons(params["module_id"], params.get("module_name", ""))
+
+    def scroll_position(self) -> int:
+        """Current vertical scroll position of the lesson list."""
+        return self.lesson_list.verticalScrollBar().value()
+
+    def set_scroll_position(self, value: int) -> None:
+        """Restore a saved vertical scroll position."""
+        self.lesson_list.verticalScrollBar().setValue(value)
+
+    def _on_lesson_clicked(self, index: QModelIndex) -> None:
+        """Open a lesson unless it is locked."""
+        lesson = self.model.item(index.row())
+        if lesson is not None and lesson["status"] != "locked":
+            self._on_open_lesson(lesson["id"])
 
-        return card
+    # ------------------------------------------------------------------
+    # Progression event handlers
+    # ------------------------------------------------------------------
+    def _on_task_completed(self, event: TaskCompleted) -> None:
+        """Advance the progress bar of the affected lesson."""
+        self.model.shift_completed(event.lesson_id, 1)
+
+    def _on_task_reopened(self, event: TaskReopened) -> None:
+        """Roll back the progress bar of the affected lesson, reopening it if it was completed."""
+        row = self.model.row_of(event.lesson_id)
+        if row < 0:
+            return
+        lesson = self.model.item(row)
+        changes = {"completed": max(0, lesson["completed"] - 1)}
+        if lesson["status"] == "completed" and changes["completed"] < lesson["total"]:
+            changes["status"] = "in_progress"
+        self.model.update_item(event.lesson_id, **changes)
+
+    def _on_lesson_completed(self, event: LessonCompleted) -> None:
+        """Show a lesson card as completed."""
+        self.model.update_item(event.lesson_id, status="completed")
 
     # ------------------------------------------------------------------
     # Signal emitters
@@ -0,0 +1,143 @@
+# list_models.py
+# Qt list models backing the modules, lessons and tasks lists.
+# Rows are plain dicts; views only pay for the rows that are visible.
+
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class CardListModel(QAbstractListModel):
+    """Base list model holding one dict per row, addressed by its "id" key.
+
+    The full row dict is exposed through ItemRole for delegates; patching
+    a row only emits dataChanged for that row.
+    """
+
+    ItemRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+        # id -> row index, rebuilt on every reset
+        self._index_by_id: Dict[int, int] = {}
+
+    # ------------------------------------------------------------------
+    # QAbstractListModel interface
+    # ------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if role == self.ItemRole:
+            return row
+        if role == Qt.DisplayRole:
+            return self.display_text(row)
+        if role == Qt.UserRole:
+            return row["id"]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if self.is_locked(self._rows[index.row()]):
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # ------------------------------------------------------------------
+    # Row access and patching
+    # ------------------------------------------------------------------
+    def set_rows(self, rows: List[Dict]) -> None:
+        """Replace all rows."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._index_by_id = {row["id"]: i for i, row in enumerate(self._rows)}
+        self.endResetModel()
+
+    def rows(self) -> List[Dict]:
+        """Return the row dicts, in display order."""
+        return self._rows
+
+    def row_of(self, item_id: int) -> int:
+        """Return the row index of an item, or -1 if it is not loaded."""
+        return self._index_by_id.get(item_id, -1)
+
+    def item(self, row: int) -> Optional[Dict]:
+        """Return the row dict at a given index."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def update_item(self, item_id: int, **changes) -> bool:
+        """Update fields of a single row and repaint only that row."""
+        row = self.row_of(item_id)
+        if row < 0:
+            return False
+        self._rows[row].update(changes)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def shift_completed(self, item_id: int, delta: int) -> bool:
+        """Adjust the completed task count of a row by delta."""
+        row = self.row_of(item_id)
+        if row < 0:
+            return False
+        item = self._rows[row]
+        completed = max(0, min(item["total"], item["completed"] + delta))
+        return self.update_item(item_id, completed=completed)
+
+    # ------------------------------------------------------------------
+    # Hooks for subclasses
+    # ------------------------------------------------------------------
+    def display_text(self, row: Dict) -> str:
+        """Text used for Qt.DisplayRole (accessibility, keyboard search)."""
+        return row.get("name", "")
+
+    def is_locked(self, row: Dict) -> bool:
+        """Whether a row is disabled."""
+        return False
+
+
+class ModuleListModel(CardListModel):
+    """Modules with their task completion counts.
+
+    Row keys: id, name, description, is_unlocked, completed, total
+    """
+
+    def is_locked(self, row: Dict) -> bool:
+        return not row["is_unlocked"]
+
+
+class LessonListModel(CardListModel):
+    """Lessons of one module with their task completion counts.
+
+    Row keys: id, module_id, name, description, status, number, completed, total
+    """
+
+    def is_locked(self, row: Dict) -> bool:
+        return row["status"] == "locked"
+
+
+class TaskListModel(CardListModel):
+    """Tasks of one lesson, displayed as "<status icon>  <name>".
+
+    Row keys: the dicts returned by TaskController.load_tasks()
+    """
+
+    def display_text(self, row: Dict) -> str:
+        if row["is_completed"]:
+            icon = "✔"
+        elif row["is_unlocked"]:
+            icon = "○"
+        else:
+            icon = "🔒"
+        return f"{icon}  {row['name']}"
+
+    def is_locked(self, row: Dict) -> bool:
+        return not row["is_unlocked"] and not row["is_completed"]
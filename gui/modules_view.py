@@ -3,11 +3,13 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QFrame, QGridLayout, QProgressBar
+    QListView, QAbstractItemView
 )
-from PySide6.QtCore import Signal, Qt
-from controllers.module_controller import ModuleController
-from controllers.progression_manager import ProgressionManager
+from PySide6.QtCore import Signal, Qt, QModelIndex
+from service_container import ServiceContainer
+from gui.list_models import ModuleListModel
+from gui.card_delegates import ModuleCardDelegate
+from controllers.progression_events import TaskCompleted, TaskReopened
 
 
 class ModulesView(QWidget):
@@ -17,13 +19,18 @@ class ModulesView(QWidget):
     navigate_back = Signal()
     navigate_to_lessons = Signal(int)  # Emits module_id
 
-    def __init__(self, parent=None):
+    def __init__(self, services: ServiceContainer, parent=None):
         super().__init__(parent)
-        self.controller = ModuleController()
-        self.progression_manager = ProgressionManager()
+        self.controller = services.module_controller
+        self.progression_manager = services.progression_manager
         self.modules = []
+        self._loaded = False
         self._setup_ui()
 
+        # Patch module cards in place when progression changes
+        services.events.subscribe(TaskCompleted, self._on_task_completed)
+        services.events.subscribe(TaskReopened, self._on_task_reopened)
+
     def _setup_ui(self):
         """Set up the user interface."""
         layout = QVBoxLayout(self)
@@ -53,115 +60,70 @@ class ModulesView(QWidget):
         subtitle.setAlignment(Qt.AlignCenter)
         layout.addWidget(subtitle)
 
-        # Scrollable area for modules
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        scroll_content = QWidget()
-        self.grid_layout = QGridLayout(scroll_content)
-        self.grid_layout.setSpacing(20)
-        self.grid_layout.setContentsMargins(10, 10, 10, 10)
-
-        scroll.setWidget(scroll_content)
-        layout.addWidget(scroll)
+        # Virtualized grid of module cards
+        self.model = ModuleListModel(self)
+        self.module_list = QListView()
+        self.module_list.setObjectName("moduleList")
+        self.module_list.setModel(self.model)
+        self.module_list.setItemDelegate(ModuleCardDelegate(self.module_list))
+        self.module_list.setViewMode(QListView.IconMode)
+        self.module_list.setMovement(QListView.Static)
+        self.module_list.setResizeMode(QListView.Adjust)
+        self.module_list.setUniformItemSizes(True)
+        self.module_list.setLayoutMode(QListView.Batched)
+        self.module_list.setSpacing(10)
+        self.module_list.setSelectionMode(QAbstractItemView.NoSelection)
+        self.module_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.module_list.viewport().setCursor(Qt.PointingHandCursor)
+        self.module_list.clicked.connect(self._on_module_clicked)
+        layout.addWidget(self.module_list)
 
     def load_modules(self):
         """Load modules from database and refresh the view."""
-        # Clear existing cards
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Load modules from controller
         self.modules = self.controller.load_modules()
 
-        # Create module cards
-        for idx, module in enumerate(self.modules):
-            card = self._create_module_card(module)
-            row = idx // 3
-            col = idx % 3
-            self.grid_layout.addWidget(card, row, col)
-
-        # Add stretch at the end
-        self.grid_layout.setRowStretch(len(self.modules) // 3 + 1, 1)
-
-    def _create_module_card(self, module: dict) -> QFrame:
-        """Create a card widget for a module."""
-        card = QFrame()
-        card.setObjectName("moduleCard")
-        card.setFixedSize(280, 220)
-        
-        card_layout = QVBoxLayout(card)
-        card_layout.setContentsMargins(20, 20, 20, 20)
-        card_layout.setSpacing(8)
-
-        # Lock icon or module number
-        if module["is_unlocked"]:
-            icon_text = "📘"
-        else:
-            icon_text = "🔒"
-        
-        icon_label = QLabel(icon_text)
-        icon_label.setStyleSheet("font-size: 32px;")
-        icon_label.setAlignment(Qt.AlignCenter)
-        card_layout.addWidget(icon_label)
-
-        # Module name
-        name_label = QLabel(module["name"])
-        name_label.setObjectName("cardTitle")
-        name_label.setAlignment(Qt.AlignCenter)
-        name_label.setWordWrap(True)
-        card_layout.addWidget(name_label)
-
-        # Module description
-        desc_label = QLabel(module["description"])
-        desc_label.setObjectName("cardDescription")
-        desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setWordWrap(True)
-        card_layout.addWidget(desc_label)
-
-        # Progress bar
-        progress = self.progression_manager.get_module_progress(module["id"])
-        progress_bar = QProgressBar()
-        progress_bar.setObjectName("moduleProgressBar")
-        progress_bar.setMinimum(0)
-        progress_bar.setMaximum(100)
-        progress_bar.setValue(progress["percent"])
-        progress_bar.setFormat(f"{progress['percent']}%")
-        progress_bar.setTextVisible(True)
-        progress_bar.setFixedHeight(18)
-        progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                background-color: #f0f0f0;
-                text-align: center;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #3c78d8;
-                border-radius: 3px;
-            }
-        """)
-        card_layout.addWidget(progress_bar)
-
-        card_layout.addStretch()
-
-        # Button
-        if module["is_unlocked"]:
-            btn_text = "Continuer" if progress["percent"] > 0 else "Commencer"
-            btn = QPushButton(btn_text)
-            btn.setObjectName("primaryButton")
-            btn.clicked.connect(lambda checked, m_id=module["id"]: self.navigate_to_lessons.emit(m_id))
-        else:
-            btn = QPushButton("Verrouillé")
-            btn.setObjectName("secondaryButton")
-            btn.setEnabled(False)
-        
-        card_layout.addWidget(btn)
-
-        return card
+        # Progress for all modules in one query
+        progress_by_module = self.progression_manager.get_modules_progress()
+
+        rows = []
+        for module in self.modules:
+            progress = progress_by_module.get(module["id"], {"completed": 0, "total": 0})
+            rows.append(dict(module, completed=progress["completed"], total=progress["total"]))
+        self.model.set_rows(rows)
+        self._loaded = True
+
+    # ------------------------------------------------------------------
+    # Navigation history state
+    # ------------------------------------------------------------------
+    def navigation_params(self):
+        """Parameters of the content shown, or None before the first load."""
+        return {} if self._loaded else None
+
+    def open_with(self, params: dict) -> None:
+        """Load the view for a history entry."""
+        self.load_modules()
+
+    def scroll_position(self) -> int:
+        """Current vertical scroll position of the module grid."""
+        return self.module_list.verticalScrollBar().value()
+
+    def set_scroll_position(self, value: int) -> None:
+        """Restore a saved vertical scroll position."""
+        self.module_list.verticalScrollBar().setValue(value)
+
+    def _on_module_clicked(self, index: QModelIndex) -> None:
+        """Open an unlocked module."""
+        module = self.model.item(index.row())
+        if module is not None and module["is_unlocked"]:
+            self.navigate_to_lessons.emit(module["id"])
+
+    # ------------------------------------------------------------------
+    # Progression event handlers
+    # ------------------------------------------------------------------
+    def _on_task_completed(self, event: TaskCompleted) -> None:
+        """Advance the progress bar of the affected module."""
+        self.model.shift_completed(event.module_id, 1)
+
+    def _on_task_reopened(self, event: TaskReopened) -> None:
+        """Roll back the progress bar of the affected module."""
+        self.model.shift_completed(event.module_id, -1)
@@ -2,6 +2,8 @@
 # Statistics screen view for PyLearn Desktop
 # Displays global progress statistics and achievements.
 
+from typing import Tuple
+
 from PySide6.QtCore import Signal, Qt
 from PySide6.QtWidgets import (
     QWidget,
@@ -12,8 +14,11 @@ from PySide6.QtWidgets import (
     QFrame,
     QProgressBar,
     QGridLayout,
+    QScrollArea,
 )
-from controllers.progression_manager import ProgressionManager
+from service_container import ServiceContainer
+from gui.background import SnapshotRefresher
+from gui.activity_chart import ActivityChart
 
 
 class StatisticsView(QWidget):
@@ -26,14 +31,36 @@ class StatisticsView(QWidget):
     # Navigation signals
     navigate_back = Signal()
 
-    def __init__(self, parent=None):
+    # Name of the stored summary painted when the view opens
+    SNAPSHOT_NAME = "statistics"
+
+    def __init__(self, services: ServiceContainer, parent=None):
         super().__init__(parent)
-        self.progression_manager = ProgressionManager()
+        self.progression_manager = services.progression_manager
+        self.achievements = services.achievements
+        self._loaded = False
+        # Stored statistics painted at once, recomputed in the background
+        self._statistics = SnapshotRefresher(
+            services.progress_snapshots, self.SNAPSHOT_NAME,
+            self._compute_statistics, self._paint_statistics,
+            lambda: services.events.revision,
+        )
         self._setup_ui()
 
     def _setup_ui(self) -> None:
         """Configure the layout and widgets for the statistics page."""
-        layout = QVBoxLayout(self)
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+
+        # The cards are taller than the window: scroll them
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.NoFrame)
+        outer_layout.addWidget(scroll_area)
+
+        content = QWidget()
+        scroll_area.setWidget(content)
+        layout = QVBoxLayout(content)
         layout.setContentsMargins(40, 40, 40, 40)
         layout.setSpacing(30)
 
@@ -68,10 +95,27 @@ class StatisticsView(QWidget):
         stats_grid = self._create_stats_grid()
         layout.addLayout(stats_grid)
 
+        # Attempts card
+        attempts_card = self._create_attempts_card()
+        layout.addWidget(attempts_card)
+
+        # Activity card
+        activity_card = self._create_activity_card()
+        layout.addWidget(activity_card)
+
+        # Achievements card
+        achievements_card = self._create_achievements_card()
+        layout.addWidget(achievements_card)
+
         layout.addStretch()
 
-    def _create_global_progress_card(self) -> QFrame:
-        """Create the main global progress card."""
+    def _create_titled_card(self, title: str,
+                            spacing: int = 10) -> Tuple[QFrame, QVBoxLayout, QLabel]:
+        """Create a white section card starting with a title.
+
+        Returns:
+            Tuple (card, its layout with the title added, title label)
+        """
         card = QFrame()
         card.setObjectName("moduleCard")
         card.setStyleSheet("""
@@ -84,12 +128,16 @@ class StatisticsView(QWidget):
         """)
 
         layout = QVBoxLayout(card)
-        layout.setSpacing(15)
+        layout.setSpacing(spacing)
 
-        # Title
-        title = QLabel("🎯 Progression globale")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50;")
-        layout.addWidget(title)
+        title_label = QLabel(title)
+        title_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50;")
+        layout.addWidget(title_label)
+        return card, layout, title_label
+
+    def _create_global_progress_card(self) -> QFrame:
+        """Create the main global progress card."""
+        card, layout, _ = self._create_titled_card("🎯 Progression globale", spacing=15)
 
         # Global progress bar
         self.global_progress_bar = QProgressBar()
@@ -123,6 +171,55 @@ class StatisticsView(QWidget):
 
         return card
 
+    def _create_attempts_card(self) -> QFrame:
+        """Create the card summarizing attempts and the hardest tasks."""
+        card, layout, _ = self._create_titled_card("📈 Tentatives")
+
+        self.attempts_summary = QLabel("Chargement...")
+        self.attempts_summary.setStyleSheet("font-size: 13px; color: #666;")
+        self.attempts_summary.setWordWrap(True)
+        layout.addWidget(self.attempts_summary)
+
+        self.hardest_tasks_label = QLabel("")
+        self.hardest_tasks_label.setStyleSheet("font-size: 13px; color: #666;")
+        self.hardest_tasks_label.setWordWrap(True)
+        layout.addWidget(self.hardest_tasks_label)
+
+        return card
+
+    def _create_activity_card(self) -> QFrame:
+        """Create the card with streaks and the daily and weekly charts."""
+        card, layout, _ = self._create_titled_card("📅 Activité")
+
+        self.streak_label = QLabel("Chargement...")
+        self.streak_label.setStyleSheet("font-size: 13px; color: #666;")
+        layout.addWidget(self.streak_label)
+
+        daily_title = QLabel("Réussites par jour (ligne : total sur 7 jours)")
+        daily_title.setStyleSheet("font-size: 13px; font-weight: bold; color: #2c3e50;")
+        layout.addWidget(daily_title)
+        self.daily_chart = ActivityChart()
+        layout.addWidget(self.daily_chart)
+
+        weekly_title = QLabel("Réussites par semaine")
+        weekly_title.setStyleSheet("font-size: 13px; font-weight: bold; color: #2c3e50;")
+        layout.addWidget(weekly_title)
+        self.weekly_chart = ActivityChart()
+        layout.addWidget(self.weekly_chart)
+
+        return card
+
+    def _create_achievements_card(self) -> QFrame:
+        """Create the card listing unlocked and locked achievements."""
+        card, layout, self.achievements_title = self._create_titled_card("🏆 Succès")
+
+        self.achievements_label = QLabel("Chargement...")
+        self.achievements_label.setStyleSheet("font-size: 13px; color: #666;")
+        self.achievements_label.setWordWrap(True)
+        layout.addWidget(self.achievements_label)
+
+        return card
+
     def _create_stats_grid(self) -> QGridLayout:
         """Create grid of individual stat cards."""
         grid = QGridLayout()
@@ -187,8 +284,25 @@ class StatisticsView(QWidget):
         return card
 
     def load_statistics(self) -> None:
-        """Load and display statistics from the database."""
-        stats = self.progression_manager.get_global_progress()
+        """Show the last stored statistics, then refresh them in the background."""
+        if not self._loaded:
+            self._statistics.paint_snapshot()
+        self._loaded = True
+        self._statistics.revalidate()
+
+    def _compute_statistics(self) -> dict:
+        """Run the statistics queries. Runs on the thread pool."""
+        return {
+            "global": self.progression_manager.get_global_progress(),
+            "attempts": self.progression_manager.get_attempt_summary(),
+            "hardest": self.progression_manager.get_hardest_tasks(limit=3, user_id=1),
+            "activity": self.progression_manager.get_activity_history(),
+            "achievements": self.achievements.get_achievements(),
+        }
+
+    def _paint_statistics(self, statistics: dict) -> None:
+        """Display computed statistics."""
+        stats = statistics["global"]
 
         # Update global progress
         self.global_progress_bar.setValue(stats["global_percent"])
@@ -213,6 +327,90 @@ class StatisticsView(QWidget):
             f"{stats['completed_tasks']}/{stats['total_tasks']}"
         )
 
+        self._paint_attempt_statistics(statistics["attempts"], statistics["hardest"])
+        if "activity" in statistics:
+            self._paint_activity(statistics["activity"])
+        if "achievements" in statistics:
+            self._paint_achievements(statistics["achievements"])
+
+    def _paint_achievements(self, achievements: list) -> None:
+        """List the unlocked achievements first, then the progress of the others."""
+        unlocked = [a for a in achievements if a["unlocked"]]
+        locked = [a for a in achievements if not a["unlocked"]]
+        self.achievements_title.setText(f"🏆 Succès ({len(unlocked)}/{len(achievements)})")
+
+        lines = [f"{a['icon']} {a['title']} — {a['description']}" for a in unlocked]
+        lines += [
+            f"🔒 {a['title']} — {a['description']} "
+            f"({a['progress']:.0f}/{a['threshold']:.0f})"
+            for a in locked
+        ]
+        self.achievements_label.setText("\n".join(lines))
+
+    def _paint_activity(self, activity: dict) -> None:
+        """Display the streaks and the completion time series."""
+        current, longest = activity["current_streak"], activity["longest_streak"]
+        self.streak_label.setText(
+            f"🔥 Série actuelle : {current} jour{'s' if current > 1 else ''} · "
+            f"Record : {longest} jour{'s' if longest > 1 else ''}"
+        )
+        self.daily_chart.set_series(
+            activity["daily_successes"], activity["rolling_successes"],
+            self._format_day(activity["first_day"]), "Aujourd'hui",
+        )
+        self.weekly_chart.set_series(
+            activity["weekly_successes"], (),
+            f"Semaine du {self._format_day(activity['first_week'])}", "Cette semaine",
+        )
+
+    @staticmethod
+    def _format_day(iso_day: str) -> str:
+        """Format an ISO date as DD/MM."""
+        _, month, day = iso_day.split("-")
+        return f"{day}/{month}"
+
+    def _paint_attempt_statistics(self, summary: dict, hardest: list) -> None:
+        """Display the attempt aggregates (time on task, failure rate...)."""
+        if not summary["attempts"]:
+            self.attempts_summary.setText("Aucune tentative pour le moment.")
+            self.hardest_tasks_label.setText("")
+            return
+
+        minutes = round(summary["time_on_task_ms"] / 60000)
+        parts = [
+            f"{summary['attempts']} tentatives",
+            f"taux d'échec : {summary['failure_rate']}%",
+            f"temps passé : {minutes} min",
+        ]
+        if summary["avg_attempts_to_success"] is not None:
+            parts.append(f"essais avant réussite : {summary['avg_attempts_to_success']:.1f}")
+        self.attempts_summary.setText(" · ".join(parts))
+
+        if hardest:
+            lines = ["Tâches les plus difficiles :"] + [
+                f"• {task['task_name']} ({task['lesson_name']}) — "
+                f"{task['failure_rate']}% d'échecs sur {task['attempts']} essais"
+                for task in hardest
+            ]
+            self.hardest_tasks_label.setText("\n".join(lines))
+        else:
+            self.hardest_tasks_label.setText("")
+
+    # ------------------------------------------------------------------
+    # Navigation history state
+    # ------------------------------------------------------------------
+    def navigation_params(self):
+        """Parameters of the content shown, or None before the first load."""
+        return {} if self._loaded else None
+
+    def open_with(self, params: dict) -> None:
+        """Load the view for a history entry."""
+        self.load_statistics()
+
+    def refresh_view(self) -> None:
+        """Recompute the statistics after progression changed."""
+        self.load_statistics()
+
     def _update_stat_card(self, card: QFrame, value: str) -> None:
         """Update the value label in a stat card."""
         # Find the value label (last QLabel in the card)
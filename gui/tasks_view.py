@@ -2,7 +2,11 @@
 # Tasks screen view for PyLearn Desktop
 # Displays a sidebar with task list and a content area on the right.
 
+import time
+from typing import Optional
+
 from PySide6.QtCore import Signal, Qt
+from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,18 +14,28 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QFrame,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QStackedWidget,
     QTextEdit,
-    QScrollArea,
+    QTextBrowser,
     QRadioButton,
     QButtonGroup,
     QMessageBox,
     QProgressBar,
 )
-from controllers.task_controller import TaskController
-from controllers.progression_manager import ProgressionManager
+from service_container import ServiceContainer
+from gui.list_models import TaskListModel
+from gui.background import DebouncedWriter, LatestResultJob, run_in_background
+from gui.code_highlighter import PythonHighlighter, highlight_html
+from controllers.progression_events import (
+    TaskCompleted,
+    TaskReopened,
+    TaskUnlocked,
+    AchievementUnlocked,
+)
+from utils.typing_comparator import IncrementalTypingComparator
+from utils.typing_metrics import KeystrokeRecorder, KEY_CORRECT, KEY_ERROR, KEY_CORRECTION
+from utils.code_checks import check_code, ERROR, WARNING
 
 
 class TasksView(QWidget):
@@ -42,17 +56,60 @@ class TasksView(QWidget):
     navigate_back = Signal()
     validation_requested = Signal(int, str)  # Emits (task_id, user_input)
 
-    def __init__(self, parent=None):
+    # Minimum delay between two draft writes
+    DRAFT_SAVE_INTERVAL_MS = 2000
+    # Pause in exercise editing before the code is checked
+    CODE_CHECK_DELAY_MS = 400
+    # Theory sections loaded at once
+    THEORY_PAGE_SIZE = 4
+
+    def __init__(self, services: ServiceContainer, parent=None):
         super().__init__(parent)
-        self.controller = TaskController()
-        self.progression_manager = ProgressionManager()
+        self.controller = services.task_controller
+        self.exercise_controller = services.exercise_controller
+        self.progression_manager = services.progression_manager
+        self.drafts = services.drafts
         self.tasks = []
         self.current_lesson_id = None
         self.current_lesson_name = ""
         self.current_task_index = 0
         self.current_task_data = {}
+        # Live comparison of the typing input against the target text
+        self.typing_comparator = IncrementalTypingComparator()
+        self._applying_typing_format = False
+        # Keystroke timings of the current typing attempt
+        self.keystroke_recorder = KeystrokeRecorder()
+        # Exercise grading running on the thread pool, if any
+        self._grading_task = None
+        self._grading_task_id = None
+        self._warm_up_task = None
+        # perf_counter() when the current attempt started, for time on task
+        self._attempt_started_at = time.perf_counter()
+        self._grading_duration_ms = None
+        # Task requested when the lesson was opened (e.g. a review), if any
+        self._opened_task_id = None
+        # Titles of achievements unlocked by the validation being shown
+        self._unlocked_achievements = []
+        # Unsubmitted answers, written off the GUI thread at most once per interval
+        self._draft_writer = DebouncedWriter(self.drafts.save_many, self.DRAFT_SAVE_INTERVAL_MS)
+        # True while a task is displayed, so that filling its editors is not saved
+        self._showing_task = False
+        # Static checks of the exercise code, run off the GUI thread on the latest text
+        self._code_check = LatestResultJob(
+            check_code, self._show_code_issues, self.CODE_CHECK_DELAY_MS
+        )
         self._setup_ui()
 
+        for editor in (self.quiz_answer_input, self.typing_input, self.exercise_input):
+            editor.textChanged.connect(self._on_draft_edited)
+        self.exercise_input.textChanged.connect(self._on_exercise_edited)
+
+        # Patch task rows in place when progression changes
+        services.events.subscribe(TaskCompleted, self._on_task_completed)
+        services.events.subscribe(TaskReopened, self._on_task_reopened)
+        services.events.subscribe(TaskUnlocked, self._on_task_unlocked)
+        services.events.subscribe(AchievementUnlocked, self._on_achievement_unlocked)
+
     # ------------------------------------------------------------------
     # UI construction
     # ------------------------------------------------------------------
@@ -93,9 +150,14 @@ class TasksView(QWidget):
         layout.addWidget(self.sidebar_title)
 
         # Task list
-        self.task_list = QListWidget()
+        self.task_model = TaskListModel(self)
+        self.task_list = QListView()
         self.task_list.setObjectName("taskList")
-        self.task_list.currentRowChanged.connect(self._on_task_selected)
+        self.task_list.setModel(self.task_model)
+        self.task_list.setUniformItemSizes(True)
+        self.task_list.selectionModel().currentRowChanged.connect(
+            lambda current, previous: self._on_task_selected(current.row())
+        )
         layout.addWidget(self.task_list)
 
         # Progress bar
@@ -188,27 +250,29 @@ class TasksView(QWidget):
 
     def _create_theory_widget(self) -> None:
         """Create the theory content widget."""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        
-        self.theory_content = QLabel()
+        # A text document lays out paragraph by paragraph, so resizing does
+        # not re-wrap the whole chapter as a single label would
+        self.theory_content = QTextBrowser()
         self.theory_content.setObjectName("theoryContent")
-        self.theory_content.setWordWrap(True)
-        self.theory_content.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        self.theory_content.setTextFormat(Qt.PlainText)
+        self.theory_content.setFrameShape(QFrame.NoFrame)
+        self.theory_content.setOpenLinks(False)
+        self.theory_content.document().setDocumentMargin(20)
         self.theory_content.setStyleSheet("""
-            QLabel {
+            QTextBrowser {
                 font-size: 14px;
-                line-height: 1.6;
-                padding: 20px;
                 background-color: #ffffff;
                 border-radius: 8px;
             }
         """)
-        
-        scroll.setWidget(self.theory_content)
-        self.content_stack.addWidget(scroll)
+        # Sections are loaded a page at a time, as the reader nears the end
+        scroll_bar = self.theory_content.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._on_theory_scrolled)
+        scroll_bar.rangeChanged.connect(self._on_theory_scrolled)
+        self._theory_task_id = None
+        self._theory_loaded = 0
+        self._theory_total = 0
+
+        self.content_stack.addWidget(self.theory_content)
 
     def _create_quiz_widget(self) -> None:
         """Create the quiz content widget."""
@@ -238,9 +302,11 @@ class TasksView(QWidget):
         self.quiz_options_layout = QVBoxLayout(self.quiz_options_frame)
         self.quiz_options_layout.setSpacing(10)
         self.quiz_button_group = QButtonGroup(self)
+        # Radio buttons reused from one question to the next, see _show_quiz_options()
+        self.quiz_option_buttons = []
         quiz_layout.addWidget(self.quiz_options_frame)
 
-        # User answer input (alternative)
+        # User answer input, for questions without options
         self.quiz_answer_label = QLabel("Votre réponse:")
         self.quiz_answer_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
         quiz_layout.addWidget(self.quiz_answer_label)
@@ -270,6 +336,7 @@ class TasksView(QWidget):
         self.typing_target = QLabel()
         self.typing_target.setObjectName("typingTarget")
         self.typing_target.setWordWrap(True)
+        self.typing_target.setTextFormat(Qt.RichText)
         self.typing_target.setStyleSheet("""
             QLabel {
                 font-family: 'Consolas', 'Monaco', monospace;
@@ -302,8 +369,24 @@ class TasksView(QWidget):
                 border-color: #3c78d8;
             }
         """)
+        # Plain text only, and no undo: error highlighting would otherwise
+        # be recorded as undo steps between keystrokes
+        self.typing_input.setAcceptRichText(False)
+        self.typing_input.setUndoRedoEnabled(False)
+        self.typing_input.document().contentsChange.connect(self._on_typing_contents_change)
         typing_layout.addWidget(self.typing_input)
 
+        # Live typing feedback
+        self.typing_status = QLabel("")
+        self.typing_status.setObjectName("typingStatus")
+        self.typing_status.setStyleSheet("font-size: 13px; color: #7f8c8d;")
+        typing_layout.addWidget(self.typing_status)
+
+        self._typing_error_format = QTextCharFormat()
+        self._typing_error_format.setBackground(QColor("#f8d7da"))
+        self._typing_error_format.setForeground(QColor("#c0392b"))
+        self._typing_ok_format = QTextCharFormat()
+
         typing_layout.addStretch()
         self.content_stack.addWidget(typing_frame)
 
@@ -347,8 +430,45 @@ class TasksView(QWidget):
                 border-radius: 8px;
             }
         """)
+        # Plain text only: colors come from the highlighter, which
+        # re-tokenizes only the lines touched by each edit
+        self.exercise_input.setAcceptRichText(False)
+        self.exercise_highlighter = PythonHighlighter(self.exercise_input.document())
         exercise_layout.addWidget(self.exercise_input)
 
+        # Problems found by the static checks, also underlined in the editor
+        self.exercise_issues = QLabel()
+        self.exercise_issues.setObjectName("exerciseIssues")
+        self.exercise_issues.setWordWrap(True)
+        self.exercise_issues.setTextFormat(Qt.PlainText)
+        self.exercise_issues.setVisible(False)
+        self.exercise_issues.setStyleSheet("font-size: 13px; color: #b45309;")
+        exercise_layout.addWidget(self.exercise_issues)
+
+        self._issue_formats = {}
+        for severity, color in ((ERROR, "#f14c4c"), (WARNING, "#cca700")):
+            issue_format = QTextCharFormat()
+            issue_format.setUnderlineStyle(QTextCharFormat.WaveUnderline)
+            issue_format.setUnderlineColor(QColor(color))
+            self._issue_formats[severity] = issue_format
+
+        # Per-test-case results of the last submission
+        self.exercise_results = QLabel()
+        self.exercise_results.setObjectName("exerciseResults")
+        self.exercise_results.setWordWrap(True)
+        self.exercise_results.setTextFormat(Qt.PlainText)
+        self.exercise_results.setVisible(False)
+        self.exercise_results.setStyleSheet("""
+            QLabel {
+                font-size: 13px;
+                padding: 10px 15px;
+                background-color: #f8f9fa;
+                border: 1px solid #dddddd;
+                border-radius: 8px;
+            }
+        """)
+        exercise_layout.addWidget(self.exercise_results)
+
         # Hint area (hidden solution)
         self.exercise_hint_btn = QPushButton("💡 Voir un indice")
         self.exercise_hint_btn.setObjectName("secondaryButton")
@@ -358,6 +478,7 @@ class TasksView(QWidget):
         self.exercise_solution = QLabel()
         self.exercise_solution.setObjectName("exerciseSolution")
         self.exercise_solution.setWordWrap(True)
+        self.exercise_solution.setTextFormat(Qt.RichText)
         self.exercise_solution.setVisible(False)
         self.exercise_solution.setStyleSheet("""
             QLabel {
@@ -386,11 +507,12 @@ class TasksView(QWidget):
     # ------------------------------------------------------------------
     # Task loading and selection
     # ------------------------------------------------------------------
-    def load_tasks(self, lesson_id: int, lesson_name: str = ""):
-        """Load tasks for a specific lesson."""
+    def load_tasks(self, lesson_id: int, lesson_name: str = "", task_id: Optional[int] = None):
+        """Load tasks for a specific lesson, showing task_id if given."""
         self.current_lesson_id = lesson_id
         self.current_lesson_name = lesson_name
         self.current_task_index = 0
+        self._opened_task_id = task_id
 
         # Update sidebar title
         if lesson_name:
@@ -398,50 +520,59 @@ class TasksView(QWidget):
         else:
             self.sidebar_title.setText(f"Leçon {lesson_id}")
 
-        # Clear and reload task list
-        self.task_list.clear()
+        # Reload the task list model; load_tasks already carries each
+        # task's progression state, which drives its status icon
         self.tasks = self.controller.load_tasks(lesson_id)
+        self.task_model.set_rows(self.tasks)
 
-        # Populate task list with status icons based on progression
-        for task in self.tasks:
-            # Get dynamic status from progression manager
-            task_status = self.progression_manager.get_task_status(task["id"])
-            is_completed = task_status["is_completed"]
-            is_unlocked = task_status["unlocked"] or task["is_unlocked"]
-            
-            if is_completed:
-                icon = "✔"
-            elif is_unlocked:
-                icon = "○"
-            else:
-                icon = "🔒"
-            
-            item = QListWidgetItem(f"{icon}  {task['name']}")
-            item.setData(Qt.UserRole, task["id"])
-            
-            # Disable locked tasks visually
-            if not is_unlocked and not is_completed:
-                item.setFlags(item.flags() & ~Qt.ItemIsEnabled)
-            
-            self.task_list.addItem(item)
-
-        # Update progress using ProgressionManager
-        progress = self.progression_manager.get_lesson_progress(lesson_id)
-        completed = progress["completed"]
-        total = progress["total"]
-        percent = progress["percent"]
-        
-        self.progress_label.setText(f"Progression: {completed}/{total}")
-        self.task_progress_bar.setValue(percent)
-        self.task_progress_bar.setFormat(f"{percent}%")
+        self._update_progress_display()
 
-        # Select first unlocked task
+        # Select the requested task, else the first unlocked task
         first_unlocked = next(
             (i for i, t in enumerate(self.tasks) if t["is_unlocked"] and not t["is_completed"]),
             0
         )
+        row = next((i for i, t in enumerate(self.tasks) if t["id"] == task_id), first_unlocked)
         if self.tasks:
-            self.task_list.setCurrentRow(first_unlocked)
+            self._select_row(row)
+
+    # ------------------------------------------------------------------
+    # Navigation history state
+    # ------------------------------------------------------------------
+    def navigation_params(self):
+        """Parameters of the content shown, or None before the first load."""
+        if self.current_lesson_id is None:
+            return None
+        params = {"lesson_id": self.current_lesson_id, "lesson_name": self.current_lesson_name}
+        if self._opened_task_id is not None:
+            params["task_id"] = self._opened_task_id
+        return params
+
+    def open_with(self, params: dict) -> None:
+        """Load the view for a history entry."""
+        self.load_tasks(params["lesson_id"], params.get("lesson_name", ""), params.get("task_id"))
+
+    def scroll_position(self) -> int:
+        """Current vertical scroll position of the task list."""
+        return self.task_list.verticalScrollBar().value()
+
+    def set_scroll_position(self, value: int) -> None:
+        """Restore a saved vertical scroll position."""
+        self.task_list.verticalScrollBar().setValue(value)
+
+    def _select_row(self, row: int) -> None:
+        """Make a task row current, which displays its content."""
+        self.task_list.setCurrentIndex(self.task_model.index(row))
+
+    def _update_progress_display(self) -> None:
+        """Update the lesson progress bar from the loaded task states."""
+        completed = sum(1 for task in self.tasks if task["is_completed"])
+        total = len(self.tasks)
+        percent = round((completed / total) * 100) if total > 0 else 0
+
+        self.progress_label.setText(f"Progression: {completed}/{total}")
+        self.task_progress_bar.setValue(percent)
+        self.task_progress_bar.setFormat(f"{percent}%")
 
     def _on_task_selected(self, row: int):
         """Handle task selection from the list."""
@@ -456,19 +587,36 @@ class TasksView(QWidget):
             self.task_title.setText("🔒 Tâche verrouillée")
             self.task_description.setText("Complétez les tâches précédentes pour débloquer celle-ci.")
             self.content_stack.setCurrentIndex(0)
-            self.theory_content.setText("Cette tâche est verrouillée.\n\nVeuillez compléter les tâches précédentes.")
+            self._theory_task_id = None
+            self.theory_content.setPlainText("Cette tâche est verrouillée.\n\nVeuillez compléter les tâches précédentes.")
             self.validate_btn.setEnabled(False)
             return
 
-        # Enable validate button
-        self.validate_btn.setEnabled(True)
+        # Enable validate button, unless a submission is still being graded
+        self.validate_btn.setEnabled(self._grading_task is None)
 
-        # Load full task content from controller
+        # Write the previous task's draft, and show this task's draft on the
+        # item it was typed for
+        self._draft_writer.flush()
         task_id = task["id"]
-        self.current_task_data = self.controller.load_task_content(task_id)
-        
+        draft = self._load_draft(task_id)
+
+        # Load full task content from controller
+        self.current_task_data = self.controller.load_task_content(
+            task_id, draft["item_id"] if draft else None
+        )
+
         # Display the task content
-        self.display_task_content(self.current_task_data)
+        self._showing_task = True
+        try:
+            self.display_task_content(self.current_task_data)
+            if draft:
+                self._restore_draft(draft["content"])
+        finally:
+            self._showing_task = False
+        if self._grading_task is not None and task_id == self._grading_task_id:
+            self.validate_btn.setText("Exécution…")
+        self._attempt_started_at = time.perf_counter()
 
         # Update next button state
         self.next_btn.setEnabled(row < len(self.tasks) - 1)
@@ -500,9 +648,16 @@ class TasksView(QWidget):
             self._display_exercise(task_data)
 
     def _display_theory(self, task_data: dict) -> None:
-        """Display theory content."""
-        content = task_data.get("content", "Contenu non disponible.")
-        self.theory_content.setText(content)
+        """Display the first sections of the theory; the rest load on scroll."""
+        self._theory_task_id = None
+        self.theory_content.clear()
+        self._theory_task_id = task_data["task_id"]
+        self._theory_loaded = 0
+        self._theory_total = task_data.get("section_count", 0)
+        if self._theory_total:
+            self._load_theory_page()
+        else:
+            self.theory_content.setPlainText("Contenu non disponible.")
         self.content_stack.setCurrentIndex(0)
         self.validate_btn.setText("Marquer comme lu")
 
@@ -511,14 +666,45 @@ class TasksView(QWidget):
         question = task_data.get("question", "Question non disponible.")
         self.quiz_question.setText(question)
         self.quiz_answer_input.clear()
+
+        options = task_data.get("options", [])
+        self._show_quiz_options(options)
+        self.quiz_options_frame.setVisible(bool(options))
+        self.quiz_answer_label.setVisible(not options)
+        self.quiz_answer_input.setVisible(not options)
         self.content_stack.setCurrentIndex(1)
         self.validate_btn.setText("Vérifier")
 
+    def _show_quiz_options(self, options: list) -> None:
+        """Show one radio button per option, reusing the existing buttons."""
+        while len(self.quiz_option_buttons) < len(options):
+            button = QRadioButton()
+            button.setObjectName("quizOption")
+            self.quiz_options_layout.addWidget(button)
+            self.quiz_option_buttons.append(button)
+
+        # Clear the previous answer: an exclusive group keeps one button checked,
+        # so uncheck while the group is not exclusive, before the buttons leave it
+        self.quiz_button_group.setExclusive(False)
+        for button in self.quiz_option_buttons:
+            button.setChecked(False)
+            self.quiz_button_group.removeButton(button)
+            button.setVisible(False)
+        self.quiz_button_group.setExclusive(True)
+
+        for button, option in zip(self.quiz_option_buttons, options):
+            button.setText(option["label"])
+            self.quiz_button_group.addButton(button, option["id"])
+            button.setVisible(True)
+
     def _display_typing(self, task_data: dict) -> None:
         """Display typing content."""
         text = task_data.get("text", "Texte non disponible.")
-        self.typing_target.setText(text)
+        self.typing_target.setText(highlight_html(text))
+        self.typing_comparator.reset(text)
         self.typing_input.clear()
+        self.keystroke_recorder.reset()
+        self._update_typing_status()
         self.content_stack.setCurrentIndex(2)
         self.validate_btn.setText("Vérifier")
 
@@ -528,13 +714,209 @@ class TasksView(QWidget):
         solution = task_data.get("solution", "")
         
         self.exercise_prompt.setText(prompt)
-        self.exercise_solution.setText(f"Solution:\n{solution}")
+        self.exercise_solution.setText("Solution:" + highlight_html(solution, "light"))
         self.exercise_solution.setVisible(False)
         self.exercise_hint_btn.setText("💡 Voir un indice")
+        self._code_check.cancel()
+        self._show_code_issues([])
         self.exercise_input.clear()
+        self.exercise_results.setVisible(False)
         self.content_stack.setCurrentIndex(3)
         self.validate_btn.setText("Soumettre")
 
+        # Have sandbox workers ready by the time the code is submitted
+        if self._warm_up_task is None:
+            self._warm_up_task = run_in_background(self.exercise_controller.warm_up)
+
+    def _load_theory_page(self) -> None:
+        """Append the next page of sections to the theory document."""
+        sections = self.controller.load_theory_sections(
+            self._theory_task_id, self._theory_loaded, self.THEORY_PAGE_SIZE
+        )
+        if not sections:
+            # Fewer sections than counted: nothing more to load
+            self._theory_total = self._theory_loaded
+            return
+
+        cursor = QTextCursor(self.theory_content.document())
+        cursor.movePosition(QTextCursor.End)
+        # One edit block: the document is laid out once, after the page
+        cursor.beginEditBlock()
+        for section in sections:
+            if self._theory_loaded:
+                cursor.insertText("\n\n")
+            # Plain text: "\n" starts a new paragraph
+            cursor.insertText(section)
+            self._theory_loaded += 1
+        cursor.endEditBlock()
+
+    def _on_theory_scrolled(self, *args) -> None:
+        """Load more sections when the end of the loaded text comes into view."""
+        if self._theory_task_id is None or self._theory_loaded >= self._theory_total:
+            return
+        scroll_bar = self.theory_content.verticalScrollBar()
+        if scroll_bar.value() >= scroll_bar.maximum() - scroll_bar.pageStep():
+            self._load_theory_page()
+
+    # ------------------------------------------------------------------
+    # Draft autosave
+    # ------------------------------------------------------------------
+    def _draft_editor(self):
+        """Text editor holding the answer of the current task, if it has one."""
+        task_type = self.current_task_data.get("type")
+        if task_type == "quiz" and not self.current_task_data.get("options"):
+            return self.quiz_answer_input
+        if task_type == "typing":
+            return self.typing_input
+        if task_type == "exercise":
+            return self.exercise_input
+        return None
+
+    def _on_draft_edited(self) -> None:
+        """Schedule saving the edited answer; the write happens later, off the GUI thread."""
+        if self._showing_task:
+            return
+        editor = self._draft_editor()
+        if editor is None:
+            return
+        self._draft_writer.schedule(self.current_task_data["task_id"], {
+            "item_id": self.current_task_data.get("item_id"),
+            "content": editor.toPlainText(),
+        })
+
+    def _load_draft(self, task_id: int) -> Optional[dict]:
+        """Draft of a task, including one not written yet."""
+        draft = self._draft_writer.get(task_id)
+        if draft is None:
+            draft = self.drafts.load(task_id)
+        return draft if draft and draft["content"] else None
+
+    def _restore_draft(self, content: str) -> None:
+        """Put a saved answer back in the editor of the displayed task."""
+        editor = self._draft_editor()
+        if editor is None:
+            return
+        editor.setPlainText(content)
+        editor.moveCursor(QTextCursor.End)
+        if editor is self.typing_input:
+            # Restored text was not typed in this attempt
+            self.keystroke_recorder.reset()
+
+    def _discard_draft(self, task_id: int) -> None:
+        """Forget the draft of a task whose answer was accepted."""
+        self._draft_writer.schedule(task_id, {"item_id": None, "content": ""})
+
+    def save_drafts(self) -> None:
+        """Write pending drafts before returning (the application is closing)."""
+        self._draft_writer.flush_now()
+
+    def hideEvent(self, event) -> None:
+        """Write pending drafts in the background when leaving the view."""
+        self._draft_writer.flush()
+        super().hideEvent(event)
+
+    # ------------------------------------------------------------------
+    # Exercise code checks
+    # ------------------------------------------------------------------
+    def _on_exercise_edited(self) -> None:
+        """Check the code once editing pauses; older checks become stale."""
+        if self.current_task_data.get("type") != "exercise":
+            return
+        self._code_check.request(self.exercise_input.toPlainText())
+
+    def _show_code_issues(self, issues: list) -> None:
+        """Underline each issue in the editor and list them under it."""
+        document = self.exercise_input.document()
+        selections = []
+        for issue in issues:
+            block = document.findBlockByNumber(issue.line - 1)
+            if not block.isValid():
+                continue
+            # length() counts the block's line break
+            last = block.position() + block.length() - 1
+            start = min(block.position() + issue.column, last)
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(document)
+            selection.cursor.setPosition(start)
+            selection.cursor.setPosition(min(start + issue.length, last), QTextCursor.KeepAnchor)
+            selection.format = self._issue_formats[issue.severity]
+            selections.append(selection)
+        self.exercise_input.setExtraSelections(selections)
+
+        self.exercise_issues.setText("\n".join(
+            f"{'✘' if issue.severity == ERROR else '⚠'}  Ligne {issue.line} : {issue.message}"
+            for issue in issues
+        ))
+        self.exercise_issues.setVisible(bool(issues))
+
+    # ------------------------------------------------------------------
+    # Live typing feedback
+    # ------------------------------------------------------------------
+    def _on_typing_contents_change(self, position: int, removed: int, added: int) -> None:
+        """Compare the edited span and restyle only the ranges that changed."""
+        if self._applying_typing_format:
+            return
+
+        document = self.typing_input.document()
+        comparator = self.typing_comparator
+        # characterCount() includes the final paragraph separator
+        document_length = document.characterCount() - 1
+        expected_length = comparator.typed_length - removed + added
+
+        if expected_length == document_length and position + added <= document_length:
+            cursor = QTextCursor(document)
+            cursor.setPosition(position)
+            cursor.setPosition(position + added, QTextCursor.KeepAnchor)
+            inserted = cursor.selectedText().replace("\u2029", "\n")
+            ranges = comparator.apply_change(position, removed, inserted)
+            self._record_keystrokes(position, removed, added)
+        else:
+            # Qt reports whole-document changes (clear, paste over all)
+            # with counts that include the final separator: resync fully
+            comparator.reset(comparator.target, self.typing_input.toPlainText())
+            ranges = comparator.full_ranges()
+
+        self._apply_typing_formats(ranges)
+        self._update_typing_status()
+
+    def _record_keystrokes(self, position: int, removed: int, added: int) -> None:
+        """Record the timing and correctness of the keys behind one edit."""
+        timestamp = time.perf_counter()
+        recorder = self.keystroke_recorder
+        if removed:
+            recorder.record(timestamp, KEY_CORRECTION)
+        is_error = self.typing_comparator.is_error
+        for index in range(position, position + added):
+            recorder.record(timestamp, KEY_ERROR if is_error(index) else KEY_CORRECT)
+
+    def _apply_typing_formats(self, ranges) -> None:
+        """Set the error or normal character format on each range."""
+        if not ranges:
+            return
+        cursor = QTextCursor(self.typing_input.document())
+        self._applying_typing_format = True
+        try:
+            for start, end, is_error in ranges:
+                cursor.setPosition(start)
+                cursor.setPosition(end, QTextCursor.KeepAnchor)
+                cursor.setCharFormat(
+                    self._typing_error_format if is_error else self._typing_ok_format
+                )
+        finally:
+            self._applying_typing_format = False
+
+    def _update_typing_status(self) -> None:
+        """Show how much of the target has been typed and how many errors."""
+        comparator = self.typing_comparator
+        if comparator.is_complete and comparator.target:
+            self.typing_status.setText("✔ Texte complet, vous pouvez vérifier.")
+            return
+        errors = comparator.error_count
+        self.typing_status.setText(
+            f"{comparator.typed_length}/{len(comparator.target)} caractères · "
+            f"{errors} erreur{'s' if errors > 1 else ''}"
+        )
+
     # ------------------------------------------------------------------
     # Validation and Signal Handlers
     # ------------------------------------------------------------------
@@ -542,6 +924,10 @@ class TasksView(QWidget):
         """Handle validate button click - collect input and validate."""
         if not self.tasks or self.current_task_index >= len(self.tasks):
             return
+        if self._grading_task is not None:
+            # The button is disabled while grading; ignore a queued click
+            return
+        self._unlocked_achievements = []
 
         task = self.tasks[self.current_task_index]
         task_id = task["id"]
@@ -549,22 +935,110 @@ class TasksView(QWidget):
 
         # Collect user input based on task type
         user_input = self._collect_user_input(task_type)
+        duration_ms = self._take_attempt_duration()
+        # Item of the task's pool shown to the learner
+        item_id = self.current_task_data.get("item_id")
+
+        # Exercises run in the sandbox: grade them off the GUI thread
+        if task_type == "exercise":
+            self._start_background_grading(task_id, user_input, item_id, duration_ms)
+            return
 
         # Call validation through controller
-        result = self.controller.validate_task(task_id, user_input)
+        result = self.controller.validate_task(task_id, user_input, duration_ms, item_id)
+        if task_type == "typing":
+            result = self._finish_typing_attempt(task_id, result)
 
         # Show result message
         self._show_validation_result(result)
 
         # Refresh task list to update status icons
         if result["success"]:
+            self._discard_draft(task_id)
             self._refresh_after_validation()
 
+    def _take_attempt_duration(self) -> float:
+        """Time spent on the current attempt; the next one starts now."""
+        now = time.perf_counter()
+        duration_ms = (now - self._attempt_started_at) * 1000
+        self._attempt_started_at = now
+        return duration_ms
+
+    def _start_background_grading(self, task_id: int, user_input: str,
+                                  item_id: Optional[int], duration_ms: float) -> None:
+        """Evaluate a submission on the thread pool, keeping the UI responsive."""
+        self.validate_btn.setEnabled(False)
+        self.validate_btn.setText("Exécution…")
+        self._grading_task_id = task_id
+        self._grading_duration_ms = duration_ms
+        self._grading_task = run_in_background(
+            self.controller.evaluate_task, task_id, user_input, item_id,
+            on_finished=self._on_grading_finished,
+            on_failed=self._on_grading_failed,
+        )
+
+    def _end_background_grading(self) -> bool:
+        """Forget the running grading; True if its task is still displayed."""
+        task_id = self._grading_task_id
+        self._grading_task = None
+        self._grading_task_id = None
+        self._grading_duration_ms = None
+
+        if self.current_task_index >= len(self.tasks):
+            return False
+        # Validation was disabled for every task while grading
+        task = self.tasks[self.current_task_index]
+        self.validate_btn.setEnabled(task["is_unlocked"] or task["is_completed"])
+        still_displayed = task["id"] == task_id
+        if still_displayed:
+            self.validate_btn.setText("Soumettre")
+        return still_displayed
+
+    def _on_grading_finished(self, evaluation: dict) -> None:
+        """Record a background evaluation and show its result."""
+        duration_ms = self._grading_duration_ms
+        still_displayed = self._end_background_grading()
+        result = self.controller.apply_evaluation(evaluation, duration_ms)
+        if result["success"]:
+            self._discard_draft(evaluation["task"]["id"])
+        if still_displayed:
+            self._show_test_results(result.get("tests", []))
+        self._show_validation_result(result)
+        if result["success"] and still_displayed:
+            self._refresh_after_validation()
+
+    # Test case status -> icon
+    TEST_STATUS_ICONS = {"passed": "✔", "failed": "✘", "skipped": "⏭"}
+
+    def _show_test_results(self, tests: list) -> None:
+        """List the outcome of each test case under the code editor."""
+        if not tests:
+            self.exercise_results.setVisible(False)
+            return
+        lines = []
+        for test in tests:
+            icon = self.TEST_STATUS_ICONS.get(test["status"], "•")
+            detail = "réussi" if test["status"] == "passed" else test["message"].splitlines()[0]
+            lines.append(f"{icon}  Test {test['number']} : {detail}")
+        self.exercise_results.setText("\n".join(lines))
+        self.exercise_results.setVisible(True)
+
+    def _on_grading_failed(self, error: str) -> None:
+        """Report an unexpected error raised while grading."""
+        self._end_background_grading()
+        self._show_validation_result({
+            "success": False,
+            "message": f"La correction a échoué : {error}",
+        })
+
     def _collect_user_input(self, task_type: str) -> str:
         """Collect user input based on task type."""
         if task_type == "theory":
             return ""  # No input needed for theory
         elif task_type == "quiz":
+            if self.current_task_data.get("options"):
+                option_id = self.quiz_button_group.checkedId()
+                return str(option_id) if option_id != -1 else ""
             return self.quiz_answer_input.toPlainText()
         elif task_type == "typing":
             return self.typing_input.toPlainText()
@@ -572,10 +1046,36 @@ class TasksView(QWidget):
             return self.exercise_input.toPlainText()
         return ""
 
+    def _finish_typing_attempt(self, task_id: int, result: dict) -> dict:
+        """Store the attempt's typing metrics and add them to the result message."""
+        recorder = self.keystroke_recorder
+        if recorder.is_empty:
+            return result
+
+        comparator = self.typing_comparator
+        metrics = recorder.metrics(
+            len(comparator.target), comparator.typed_length - comparator.error_count
+        )
+        self.controller.save_typing_session(
+            task_id, metrics, result["success"], recorder.intervals_ms().tobytes()
+        )
+        recorder.reset()
+
+        summary = (
+            f"\n\nVitesse : {metrics.wpm:.0f} mots/min · "
+            f"Précision : {metrics.accuracy * 100:.0f}%"
+        )
+        return {**result, "message": result.get("message", "") + summary}
+
     def _show_validation_result(self, result: dict) -> None:
         """Show validation result in a message box."""
         success = result.get("success", False)
         message = result.get("message", "")
+        if self._unlocked_achievements:
+            message += "".join(
+                f"\n\n🏆 Succès débloqué : {title}" for title in self._unlocked_achievements
+            )
+            self._unlocked_achievements = []
 
         if success:
             QMessageBox.information(
@@ -593,22 +1093,18 @@ class TasksView(QWidget):
             )
 
     def _refresh_after_validation(self) -> None:
-        """Refresh the view after successful validation."""
-        # Store current position
-        current_row = self.current_task_index
+        """Move on after a successful validation.
 
-        # Reload tasks to get updated status
-        self.load_tasks(self.current_lesson_id, self.current_lesson_name)
+        Row icons and the progress bar have already been patched by the
+        progression events published during validation.
+        """
+        current_row = self.current_task_index
 
         # Move to next task if available and unlocked
         if current_row < len(self.tasks) - 1:
             next_task = self.tasks[current_row + 1]
             if next_task["is_unlocked"]:
-                self.task_list.setCurrentRow(current_row + 1)
-            else:
-                self.task_list.setCurrentRow(current_row)
-        else:
-            self.task_list.setCurrentRow(current_row)
+                self._select_row(current_row + 1)
 
     def validate_from_external(self, task_id: int, user_input: str) -> dict:
         """
@@ -620,4 +1116,33 @@ class TasksView(QWidget):
     def _on_next(self):
         """Handle next button click."""
         if self.current_task_index < len(self.tasks) - 1:
-            self.task_list.setCurrentRow(self.current_task_index + 1)
+            self._select_row(self.current_task_index + 1)
+
+    # ------------------------------------------------------------------
+    # Progression event handlers
+    # ------------------------------------------------------------------
+    def _on_task_completed(self, event: TaskCompleted) -> None:
+        """Mark a task row as completed and update the progress bar."""
+        if event.lesson_id != self.current_lesson_id:
+            return
+        if self.task_model.update_item(
+            event.task_id, is_completed=True, is_unlocked=True, status="completed"
+        ):
+            self._update_progress_display()
+
+    def _on_task_reopened(self, event: TaskReopened) -> None:
+        """Mark a previously completed task row as failed."""
+        if event.lesson_id != self.current_lesson_id:
+            return
+        if self.task_model.update_item(event.task_id, is_completed=False, status="failed"):
+            self._update_progress_display()
+
+    def _on_task_unlocked(self, event: TaskUnlocked) -> None:
+        """Enable a newly unlocked task row."""
+        if event.lesson_id != self.current_lesson_id:
+            return
+        self.task_model.update_item(event.task_id, is_unlocked=True)
+
+    def _on_achievement_unlocked(self, event: AchievementUnlocked) -> None:
+        """Keep the achievement to announce it with the validation result."""
+        self._unlocked_achievements.append(event.title)
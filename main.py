@@ -3,38 +3,47 @@
 
 import os
 import sys
-from PySide6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox
+import time
+
+# Reference point for the startup-time measurement (--startup-time)
+PROCESS_START = time.perf_counter()
+
+# A frozen build has no separate Python interpreter: the exercise sandbox
+# starts the executable itself with this flag to get a worker process
+if __name__ == "__main__" and "--sandbox-worker" in sys.argv:
+    from utils.sandbox_worker import main as sandbox_worker_main
+    sys.exit(sandbox_worker_main())
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox, QWidget
 
 from utils.resource_path import resource_path
 from database.db import Database
-from controllers.module_controller import ModuleController
-from controllers.lesson_controller import LessonController
-from controllers.task_controller import TaskController
-from controllers.progression_manager import ProgressionManager
+from service_container import ServiceContainer
 from navigation_manager import NavigationManager
-from gui.home_view import HomeView
-from gui.modules_view import ModulesView
-from gui.lessons_view import LessonsView
-from gui.tasks_view import TasksView
-from gui.quiz_view import QuizView
-from gui.exercise_view import ExerciseView
-from gui.typing_view import TypingView
-from gui.statistics_view import StatisticsView
+
+# View modules are imported lazily by the MainWindow view factories, so
+# that only the home screen is built before the first paint.
+VIEW_NAMES = (
+    "home", "modules", "lessons", "tasks",
+    "quiz", "exercise", "typing", "statistics",
+)
 
 
 class MainWindow(QMainWindow):
     """Main application window with stacked widget for navigation."""
 
-    def __init__(self) -> None:
+    def __init__(self, services: ServiceContainer, eager_views: bool = False) -> None:
         super().__init__()
         self.setWindowTitle("PyLearn Desktop")
         self.setGeometry(100, 100, 1024, 768)
 
-        # Controllers for fetching data
-        self.module_controller = ModuleController()
-        self.lesson_controller = LessonController()
-        self.task_controller = TaskController()
-        self.progression_manager = ProgressionManager()
+        # Shared controllers, owned by the application service container
+        self.services = services
+        self.module_controller = services.module_controller
+        self.lesson_controller = services.lesson_controller
+        self.task_controller = services.task_controller
+        self.progression_manager = services.progression_manager
 
         # Store current context for navigation
         self.current_module_id = None
@@ -50,128 +59,125 @@ class MainWindow(QMainWindow):
         # Navigation manager to keep track of named views
         self.navigation = NavigationManager()
         self.navigation.set_navigation_callback(self.navigate_to)
+        # Cached views are reused as long as no progression event happened
+        self.navigation.set_token_source(lambda: services.events.revision)
 
-        # Create, register, and wire all views
-        self._create_views()
+        # Register view factories; each view is built on first navigation
         self._register_views()
-        self._connect_navigation_signals()
-
-        # Start on the home view
-        self.navigate_to("home")
-
-    def _create_views(self) -> None:
-        """Instantiate all views used in the application."""
-        self.home_view = HomeView()
-        self.modules_view = ModulesView()
-        self.lessons_view = LessonsView()
-        self.tasks_view = TasksView()
-        self.quiz_view = QuizView()
-        self.exercise_view = ExerciseView()
-        self.typing_view = TypingView()
-        self.statistics_view = StatisticsView()
-
-    def _register_views(self) -> None:
-        """Add views to stacked widget and register them in NavigationManager."""
-        # Add widgets to the stacked widget
-        self.stacked_widget.addWidget(self.home_view)
-        self.stacked_widget.addWidget(self.modules_view)
-        self.stacked_widget.addWidget(self.lessons_view)
-        self.stacked_widget.addWidget(self.tasks_view)
-        self.stacked_widget.addWidget(self.quiz_view)
-        self.stacked_widget.addWidget(self.exercise_view)
-        self.stacked_widget.addWidget(self.typing_view)
-        self.stacked_widget.addWidget(self.statistics_view)
-
-        # Register views by name
-        self.navigation.register_view("home", self.home_view)
-        self.navigation.register_view("modules", self.modules_view)
-        self.navigation.register_view("lessons", self.lessons_view)
-        self.navigation.register_view("tasks", self.tasks_view)
-        self.navigation.register_view("quiz", self.quiz_view)
-        self.navigation.register_view("exercise", self.exercise_view)
-        self.navigation.register_view("typing", self.typing_view)
-        self.navigation.register_view("statistics", self.statistics_view)
-
-    def _connect_navigation_signals(self) -> None:
-        """Connect navigation signals from views to navigation actions."""
-        # Forward navigation signals
-        self.home_view.navigate_to_modules.connect(
-            self._on_navigate_to_modules
-        )
-
-        self.home_view.navigate_to_statistics.connect(
-            self._on_navigate_to_statistics
-        )
-
-        self.modules_view.navigate_to_lessons.connect(
-            self._on_navigate_to_lessons
-        )
-
-        self.lessons_view.navigate_to_tasks.connect(
-            self._on_navigate_to_tasks
-        )
-
-        self.tasks_view.navigate_to_quiz.connect(
-            self._on_navigate_to_quiz
-        )
-
-        self.tasks_view.navigate_to_typing.connect(
-            self._on_navigate_to_typing
-        )
-
-        self.tasks_view.navigate_to_exercise.connect(
-            self._on_navigate_to_exercise
-        )
-
-        # Task selection tracking
-        self.tasks_view.task_selected.connect(
-            self._on_task_selected
-        )
 
-        # Back navigation signals
-        self.modules_view.navigate_back.connect(
-            self._on_back_to_home
-        )
+        # Build everything up front only when asked to (startup comparison)
+        if eager_views:
+            for name in VIEW_NAMES:
+                self.navigation.get_view(name)
 
-        self.lessons_view.navigate_back.connect(
-            self._on_back_to_modules
-        )
+        # Start on the home view, the root of the navigation history
+        self.navigation.reset("home")
 
-        self.tasks_view.navigate_back.connect(
-            self._on_back_to_lessons
-        )
-
-        self.quiz_view.navigate_back.connect(
-            self._on_back_to_tasks
-        )
+    def _register_views(self) -> None:
+        """Register a factory for every view in NavigationManager."""
+        self.navigation.register_factory("home", self._create_home_view)
+        self.navigation.register_factory("modules", self._create_modules_view)
+        self.navigation.register_factory("lessons", self._create_lessons_view)
+        self.navigation.register_factory("tasks", self._create_tasks_view)
+        self.navigation.register_factory("quiz", self._create_quiz_view)
+        self.navigation.register_factory("exercise", self._create_exercise_view)
+        self.navigation.register_factory("typing", self._create_typing_view)
+        self.navigation.register_factory("statistics", self._create_statistics_view)
+
+    def _view(self, name: str) -> QWidget:
+        """Get a view by name, building it if this is its first use."""
+        return self.navigation.get_view(name)
+
+    def _add_view(self, view: QWidget) -> QWidget:
+        """Add a freshly built view to the stacked widget."""
+        self.stacked_widget.addWidget(view)
+        return view
 
-        self.typing_view.navigate_back.connect(
-            self._on_back_to_tasks
-        )
+    # ------------------------------------------------------------------
+    # View factories (import, build and wire one view)
+    # ------------------------------------------------------------------
 
-        self.exercise_view.navigate_back.connect(
-            self._on_back_to_tasks
-        )
+    def _create_home_view(self) -> QWidget:
+        """Build the home view and connect its signals."""
+        from gui.home_view import HomeView
+        view = HomeView(self.services)
+        view.navigate_to_modules.connect(self._on_navigate_to_modules)
+        view.navigate_to_statistics.connect(self._on_navigate_to_statistics)
+        view.navigate_to_review.connect(self._on_navigate_to_review)
+        view.navigate_continue.connect(self._on_navigate_continue)
+        return self._add_view(view)
+
+    def _create_modules_view(self) -> QWidget:
+        """Build the modules view and connect its signals."""
+        from gui.modules_view import ModulesView
+        view = ModulesView(self.services)
+        view.navigate_to_lessons.connect(self._on_navigate_to_lessons)
+        view.navigate_back.connect(self._on_back)
+        return self._add_view(view)
+
+    def _create_lessons_view(self) -> QWidget:
+        """Build the lessons view and connect its signals."""
+        from gui.lessons_view import LessonsView
+        view = LessonsView(self.services)
+        view.navigate_to_tasks.connect(self._on_navigate_to_tasks)
+        view.navigate_back.connect(self._on_back)
+        return self._add_view(view)
+
+    def _create_tasks_view(self) -> QWidget:
+        """Build the tasks view and connect its signals."""
+        from gui.tasks_view import TasksView
+        view = TasksView(self.services)
+        view.navigate_to_quiz.connect(self._on_navigate_to_quiz)
+        view.navigate_to_typing.connect(self._on_navigate_to_typing)
+        view.navigate_to_exercise.connect(self._on_navigate_to_exercise)
+        # Task selection tracking
+        view.task_selected.connect(self._on_task_selected)
+        view.navigate_back.connect(self._on_back)
+        return self._add_view(view)
+
+    def _create_quiz_view(self) -> QWidget:
+        """Build the quiz view and connect its signals."""
+        from gui.quiz_view import QuizView
+        view = QuizView()
+        view.navigate_back.connect(self._on_back)
+        return self._add_view(view)
+
+    def _create_exercise_view(self) -> QWidget:
+        """Build the exercise view and connect its signals."""
+        from gui.exercise_view import ExerciseView
+        view = ExerciseView()
+        view.navigate_back.connect(self._on_back)
+        return self._add_view(view)
+
+    def _create_typing_view(self) -> QWidget:
+        """Build the typing view and connect its signals."""
+        from gui.typing_view import TypingView
+        view = TypingView()
+        view.navigate_back.connect(self._on_back)
+        return self._add_view(view)
+
+    def _create_statistics_view(self) -> QWidget:
+        """Build the statistics view and connect its signals."""
+        from gui.statistics_view import StatisticsView
+        view = StatisticsView(self.services)
+        view.navigate_back.connect(self._on_back)
+        return self._add_view(view)
 
-        # Statistics view back navigation
-        self.statistics_view.navigate_back.connect(
-            self._on_back_to_home
-        )
+    # ------------------------------------------------------------------
+    # Navigation handlers
+    # ------------------------------------------------------------------
 
-    def _on_back_to_home(self) -> None:
-        """Handle back navigation to home view (refresh data)."""
-        self.home_view.refresh_data()
-        self.navigation.navigate("home")
+    def _on_back(self) -> None:
+        """Return to the previous view, reusing its cached state."""
+        self.navigation.back()
 
     def _on_navigate_to_statistics(self) -> None:
         """Handle navigation to statistics view."""
-        self.statistics_view.load_statistics()
-        self.navigation.navigate("statistics")
+        self.navigation.push("statistics")
 
     def _on_navigate_to_modules(self) -> None:
         """Handle navigation to modules view."""
-        self.modules_view.load_modules()
-        self.navigation.navigate("modules")
+        self.navigation.push("modules")
 
     def _on_navigate_to_lessons(self, module_id: int) -> None:
         """Handle navigation to lessons, storing the module context."""
@@ -181,8 +187,10 @@ class MainWindow(QMainWindow):
         module = self.module_controller.get_module_by_id(module_id)
         self.current_module_name = module["name"] if module else ""
         
-        self.lessons_view.load_lessons(module_id, self.current_module_name)
-        self.navigation.navigate("lessons")
+        self.navigation.push("lessons", {
+            "module_id": module_id,
+            "module_name": self.current_module_name,
+        })
 
     def _on_navigate_to_tasks(self, lesson_id: int) -> None:
         """Handle navigation to tasks, storing the lesson context."""
@@ -192,8 +200,49 @@ class MainWindow(QMainWindow):
         lesson = self.lesson_controller.get_lesson_by_id(lesson_id)
         self.current_lesson_name = lesson["name"] if lesson else ""
         
-        self.tasks_view.load_tasks(lesson_id, self.current_lesson_name)
-        self.navigation.navigate("tasks")
+        self.navigation.push("tasks", {
+            "lesson_id": lesson_id,
+            "lesson_name": self.current_lesson_name,
+        })
+
+    def _on_navigate_continue(self) -> None:
+        """Open the task to continue with, skipping the modules and lessons views."""
+        resume = self.progression_manager.get_resume_point()
+        if resume is None:
+            # Everything is completed: let the learner pick something to revisit
+            self.navigation.push("modules")
+            return
+
+        self.current_module_id = resume["module_id"]
+        self.current_module_name = resume["module_name"]
+        self.current_lesson_id = resume["lesson_id"]
+        self.current_lesson_name = resume["lesson_name"]
+        self.navigation.push("tasks", {
+            "lesson_id": resume["lesson_id"],
+            "lesson_name": resume["lesson_name"],
+            "task_id": resume["task_id"],
+        })
+
+    def _on_navigate_to_review(self) -> None:
+        """Open the task that has been due for review the longest."""
+        due = self.services.review_scheduler.get_due_reviews(limit=1)
+        if not due:
+            QMessageBox.information(
+                self,
+                "Révisions",
+                "Aucune révision prévue pour le moment.",
+                QMessageBox.Ok
+            )
+            return
+
+        review = due[0]
+        self.current_lesson_id = review["lesson_id"]
+        self.current_lesson_name = review["lesson_name"]
+        self.navigation.push("tasks", {
+            "lesson_id": review["lesson_id"],
+            "lesson_name": review["lesson_name"],
+            "task_id": review["task_id"],
+        })
 
     def _on_task_selected(self, task_id: int) -> None:
         """Handle task selection - store current task ID."""
@@ -202,34 +251,17 @@ class MainWindow(QMainWindow):
     def _on_navigate_to_quiz(self, task_id: int) -> None:
         """Handle navigation to quiz view."""
         # TODO: Load quiz content based on task_id
-        self.navigation.navigate("quiz")
+        self.navigation.push("quiz", {"task_id": task_id})
 
     def _on_navigate_to_typing(self, task_id: int) -> None:
         """Handle navigation to typing view."""
         # TODO: Load typing content based on task_id
-        self.navigation.navigate("typing")
+        self.navigation.push("typing", {"task_id": task_id})
 
     def _on_navigate_to_exercise(self, task_id: int) -> None:
         """Handle navigation to exercise view."""
         # TODO: Load exercise content based on task_id
-        self.navigation.navigate("exercise")
-
-    def _on_back_to_modules(self) -> None:
-        """Handle back navigation to modules view (reload data)."""
-        self.modules_view.load_modules()
-        self.navigation.navigate("modules")
-
-    def _on_back_to_lessons(self) -> None:
-        """Handle back navigation to lessons view (reload data)."""
-        if self.current_module_id:
-            self.lessons_view.load_lessons(self.current_module_id, self.current_module_name)
-        self.navigation.navigate("lessons")
-
-    def _on_back_to_tasks(self) -> None:
-        """Handle back navigation to tasks view (reload data)."""
-        if self.current_lesson_id:
-            self.tasks_view.load_tasks(self.current_lesson_id, self.current_lesson_name)
-        self.navigation.navigate("tasks")
+        self.navigation.push("exercise", {"task_id": task_id})
 
     # ------------------------------------------------------------------
     # Task Validation Methods
@@ -259,9 +291,8 @@ class MainWindow(QMainWindow):
                 result["message"],
                 QMessageBox.Ok
             )
-            # Refresh tasks view to show updated status
-            if self.current_lesson_id:
-                self.tasks_view.load_tasks(self.current_lesson_id, self.current_lesson_name)
+            # The tasks view is patched by the progression events published
+            # during validation, no reload needed
         else:
             QMessageBox.warning(
                 self,
@@ -272,6 +303,12 @@ class MainWindow(QMainWindow):
 
         return result
 
+    def closeEvent(self, event) -> None:
+        """Write the drafts still waiting for the autosave before closing."""
+        if self.navigation.is_view_created("tasks"):
+            self._view("tasks").save_drafts()
+        super().closeEvent(event)
+
     def navigate_to(self, view_name: str) -> None:
         """Switch the current widget in the stacked widget by view name."""
         widget = self.navigation.get_view(view_name)
@@ -279,10 +316,36 @@ class MainWindow(QMainWindow):
             self.stacked_widget.setCurrentWidget(widget)
 
 
+class FirstPaintTimer(QObject):
+    """Reports the time from process start to the first paint of a widget."""
+
+    def __init__(self, widget: QWidget, quit_after: bool = False) -> None:
+        super().__init__(widget)
+        self.quit_after = quit_after
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            elapsed_ms = (time.perf_counter() - PROCESS_START) * 1000
+            print(f"First paint after {elapsed_ms:.1f} ms", flush=True)
+            if self.quit_after:
+                QTimer.singleShot(0, QApplication.quit)
+        return False
+
+
 if __name__ == "__main__":
+    # --startup-time: print the time to first paint of the home view and exit
+    # --eager-views: build every view before showing the window (comparison)
+    measure_startup = "--startup-time" in sys.argv
+    eager_views = "--eager-views" in sys.argv
+
     # Initialize database
     Database.initialize()
 
+    # Shared controllers and data layer for the whole application
+    services = ServiceContainer()
+
     # Start Qt application
     app = QApplication(sys.argv)
 
@@ -292,6 +355,8 @@ if __name__ == "__main__":
         with open(style_path, "r", encoding="utf-8") as f:
             app.setStyleSheet(f.read())
 
-    window = MainWindow()
+    window = MainWindow(services, eager_views=eager_views)
+    if measure_startup:
+        FirstPaintTimer(window.navigation.get_view("home"), quit_after=True)
     window.show()
     sys.exit(app.exec())
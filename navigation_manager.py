@@ -1,22 +1,58 @@
 # navigation_manager.py
 # Central navigation manager for PyLearn Desktop.
 
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
 from PySide6.QtWidgets import QWidget
 
 
+@dataclass
+class HistoryEntry:
+    """One step of the navigation history.
+
+    Attributes:
+        name: Registered view name
+        params: Parameters the view was opened with (e.g. {"lesson_id": 3})
+        token: Freshness token current when the view was last shown
+        scroll: Scroll position saved when the user navigated away
+    """
+    name: str
+    params: Dict = field(default_factory=dict)
+    token: Optional[int] = None
+    scroll: Optional[int] = None
+
+
 class NavigationManager:
-    """Simple registry-based navigation manager.
+    """Registry-based navigation manager with a history stack.
 
     Responsibilities:
     - Keep a mapping between view names and QWidget instances.
+    - Build views registered as factories the first time they are needed.
     - Provide access to views by name.
+    - Keep a history of (view, parameters, freshness token, scroll position)
+      so that going back restores a cached view instead of rebuilding it.
     - Provide a high-level navigate(name) API that the MainWindow can use.
+
+    Views take part in the history through optional methods:
+    - navigation_params() -> Optional[Dict]: parameters of the content
+      currently shown, or None if nothing is loaded yet.
+    - open_with(params: Dict): load the view for new parameters.
+    - refresh_view(): cheap refresh when the freshness token changed. Views
+      kept current by progression events do not need it.
+    - scroll_position() -> int / set_scroll_position(value: int)
     """
 
     def __init__(self) -> None:
         # Internal mapping of view name -> QWidget instance
         self._views: Dict[str, QWidget] = {}
+        # View name -> factory for views that have not been built yet
+        self._factories: Dict[str, Callable[[], QWidget]] = {}
+        # Navigation history, current view last
+        self._history: List[HistoryEntry] = []
+        # View name -> freshness token the view was last shown with
+        self._view_tokens: Dict[str, int] = {}
+        # Returns the current freshness token (e.g. the progression revision)
+        self._token_source: Callable[[], int] = lambda: 0
         # Optional callback that is invoked when navigate() is called.
         # MainWindow should set this to a function that actually performs
         # the stacked widget switching.
@@ -26,9 +62,21 @@ class NavigationManager:
         """Register a view under a specific name."""
         self._views[name] = widget
 
+    def register_factory(self, name: str, factory: Callable[[], QWidget]) -> None:
+        """Register a view that is only built the first time it is requested."""
+        self._factories[name] = factory
+
     def get_view(self, name: str) -> Optional[QWidget]:
-        """Retrieve a view by its registered name."""
-        return self._views.get(name)
+        """Retrieve a view by its registered name, building it if needed."""
+        widget = self._views.get(name)
+        if widget is None and name in self._factories:
+            widget = self._factories.pop(name)()
+            self._views[name] = widget
+        return widget
+
+    def is_view_created(self, name: str) -> bool:
+        """Whether a view has already been built."""
+        return name in self._views
 
     def navigate(self, name: str) -> None:
         """High-level navigation entry point.
@@ -42,3 +90,76 @@ class NavigationManager:
     def set_navigation_callback(self, callback) -> None:
         """Set the function that is called when navigate(name) is invoked."""
         self._navigation_callback = callback
+
+    def set_token_source(self, source: Callable[[], int]) -> None:
+        """Set the function returning the current freshness token."""
+        self._token_source = source
+
+    # ------------------------------------------------------------------
+    # History
+    # ------------------------------------------------------------------
+
+    def push(self, name: str, params: Optional[Dict] = None) -> None:
+        """Open a view with parameters and record it in the history."""
+        self._save_scroll()
+        entry = HistoryEntry(name, dict(params or {}))
+        self._history.append(entry)
+        self._show(entry)
+
+    def back(self) -> None:
+        """Return to the previous history entry, reusing its cached view."""
+        if len(self._history) < 2:
+            return
+        self._history.pop()
+        self._show(self._history[-1])
+
+    def reset(self, name: str, params: Optional[Dict] = None) -> None:
+        """Clear the history and open a view as its only entry."""
+        self._history.clear()
+        self.push(name, params)
+
+    def current_entry(self) -> Optional[HistoryEntry]:
+        """Return the history entry of the view currently shown."""
+        return self._history[-1] if self._history else None
+
+    def history(self) -> List[HistoryEntry]:
+        """Return a copy of the history, oldest first."""
+        return list(self._history)
+
+    def _save_scroll(self) -> None:
+        """Remember the scroll position of the view being left."""
+        entry = self.current_entry()
+        if entry is None:
+            return
+        view = self._views.get(entry.name)
+        scroll_position = getattr(view, "scroll_position", None)
+        if scroll_position is not None:
+            entry.scroll = scroll_position()
+
+    def _show(self, entry: HistoryEntry) -> None:
+        """Bring a history entry on screen, loading only what is stale.
+
+        - Different parameters (or nothing loaded yet): full open_with().
+        - Same parameters, token changed: refresh_view() if the view has one.
+        - Same parameters, same token: shown as is.
+        """
+        view = self.get_view(entry.name)
+        token = self._token_source()
+
+        navigation_params = getattr(view, "navigation_params", None)
+        shown_params = navigation_params() if navigation_params else entry.params
+        if shown_params != entry.params:
+            view.open_with(entry.params)
+        elif self._view_tokens.get(entry.name) != token:
+            refresh_view = getattr(view, "refresh_view", None)
+            if refresh_view is not None:
+                refresh_view()
+
+        self._view_tokens[entry.name] = token
+        entry.token = token
+
+        set_scroll_position = getattr(view, "set_scroll_position", None)
+        if entry.scroll is not None and set_scroll_position is not None:
+            set_scroll_position(entry.scroll)
+
+        self.navigate(entry.name)
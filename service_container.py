@@ -0,0 +1,52 @@
+# service_container.py
+# Application-level service container for PyLearn Desktop.
+
+from typing import Optional
+
+from database.db import DatabaseConnection
+from controllers.progression_events import ProgressionEventBus
+from controllers.module_controller import ModuleController
+from controllers.lesson_controller import LessonController
+from controllers.task_controller import TaskController
+from controllers.exercise_controller import ExerciseController
+from controllers.grading_cache import GradingCache
+from controllers.review_scheduler import ReviewScheduler
+from controllers.progression_manager import ProgressionManager
+from controllers.progress_snapshot import ProgressSnapshotStore
+from controllers.achievements import AchievementEngine
+from controllers.draft_store import DraftStore
+from utils.sandbox import SandboxPool
+
+
+class ServiceContainer:
+    """Owns the shared data layer and controller instances.
+
+    Created once in main.py and handed to MainWindow and every view, so
+    that the database path is resolved a single time and caches or
+    instrumentation attached to a controller have exactly one owner.
+    """
+
+    def __init__(self, db: Optional[DatabaseConnection] = None) -> None:
+        # Single data-layer instance shared by all controllers
+        self.db = db or DatabaseConnection()
+        # Progression-change notifications for incremental view updates
+        self.events = ProgressionEventBus()
+
+        self.module_controller = ModuleController(self.db)
+        self.lesson_controller = LessonController(self.db)
+        # Exercise sandbox workers, started when an exercise is first shown
+        self.sandbox_pool = SandboxPool()
+        self.exercise_controller = ExerciseController(pool=self.sandbox_pool)
+        self.grading_cache = GradingCache(self.db)
+        self.review_scheduler = ReviewScheduler(self.db)
+        self.task_controller = TaskController(
+            self.db, self.events, self.exercise_controller, self.grading_cache,
+            self.review_scheduler
+        )
+        self.progression_manager = ProgressionManager(self.db)
+        # Last computed summaries, painted before any aggregate query runs
+        self.progress_snapshots = ProgressSnapshotStore(self.db)
+        # Unlocks achievements as progression events are published
+        self.achievements = AchievementEngine(self.db, self.events)
+        # Unsubmitted answers, written by the tasks view's autosave
+        self.drafts = DraftStore(self.db)
@@ -0,0 +1,2 @@
+# tests/__init__.py
+# Test suite for PyLearn Desktop (run with: python -m pytest tests/)
@@ -0,0 +1,17 @@
+# conftest.py
+# Shared fixtures: a freshly initialized database in a temporary directory.
+
+import pytest
+
+from database.db import DatabaseConnection
+from database.init_db import initialize_tables
+
+
+@pytest.fixture
+def db(tmp_path):
+    """DatabaseConnection to a new database with the default content."""
+    path = str(tmp_path / "pylearn.db")
+    initialize_tables(path)
+    connection = DatabaseConnection()
+    connection.db_path = path
+    return connection
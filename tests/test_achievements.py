@@ -0,0 +1,141 @@
+# test_achievements.py
+# Tests of achievements unlocked from progression events.
+
+from datetime import date, timedelta
+
+import pytest
+
+from controllers.achievements import AchievementEngine
+from controllers.progression_events import (
+    AchievementUnlocked,
+    ModuleCompleted,
+    ProgressionEventBus,
+    TaskAttempted,
+    TaskCompleted,
+    TaskReopened,
+    TypingSessionRecorded,
+)
+
+
+@pytest.fixture
+def bus():
+    return ProgressionEventBus()
+
+
+@pytest.fixture
+def unlocked(bus):
+    """Ids of the achievements announced on the bus, in order."""
+    announced = []
+    bus.subscribe(AchievementUnlocked, lambda event: announced.append(event.achievement_id))
+    return announced
+
+
+def completed(task_id):
+    return TaskCompleted(task_id, 1, 1, "theory")
+
+
+def set_today(monkeypatch, day):
+    monkeypatch.setattr(AchievementEngine, "_today", staticmethod(lambda: day))
+
+
+def test_first_completed_task(db, bus, unlocked):
+    AchievementEngine(db, bus)
+    bus.publish(completed(1))
+    assert unlocked == ["tasks_1"]
+
+    # Already unlocked: not announced again
+    bus.publish(TaskReopened(1, 1, 1, "theory"))
+    bus.publish(completed(1))
+    assert unlocked == ["tasks_1"]
+
+
+def test_reopened_tasks_are_not_counted(db, bus, unlocked):
+    engine = AchievementEngine(db, bus)
+    for task_id in range(1, 10):
+        bus.publish(completed(task_id))
+    bus.publish(TaskReopened(9, 1, 1, "theory"))
+    bus.publish(completed(9))
+    assert "tasks_10" not in unlocked
+
+    bus.publish(completed(10))
+    assert "tasks_10" in unlocked
+    progress = {item["achievement_id"]: item for item in engine.get_achievements()}
+    assert progress["tasks_50"]["progress"] == 10
+
+
+def test_module_counted_once(db, bus, unlocked):
+    engine = AchievementEngine(db, bus)
+    bus.publish(ModuleCompleted(1))
+    bus.publish(ModuleCompleted(1))
+    assert unlocked == ["modules_1"]
+    progress = {item["achievement_id"]: item for item in engine.get_achievements()}
+    assert progress["modules_3"]["progress"] == 1
+
+
+def test_streak_of_seven_days(db, bus, unlocked, monkeypatch):
+    AchievementEngine(db, bus)
+    start = date(2024, 3, 1)
+    for offset in range(7):
+        set_today(monkeypatch, start + timedelta(days=offset))
+        # Several attempts on the same day count once
+        bus.publish(TaskAttempted(1, 1, 1, "quiz", False))
+        bus.publish(TaskAttempted(1, 1, 1, "quiz", True))
+    assert unlocked == ["streak_7"]
+
+
+def test_failed_attempts_do_not_extend_streak(db, bus, monkeypatch):
+    engine = AchievementEngine(db, bus)
+    start = date(2024, 3, 1)
+    for offset in range(3):
+        set_today(monkeypatch, start + timedelta(days=offset))
+        bus.publish(TaskAttempted(1, 1, 1, "quiz", offset != 1))
+
+    progress = {item["achievement_id"]: item for item in engine.get_achievements()}
+    assert progress["streak_7"]["progress"] == 1
+
+
+def test_missed_day_ends_streak(db, bus, unlocked, monkeypatch):
+    engine = AchievementEngine(db, bus)
+    start = date(2024, 3, 1)
+    for offset in range(5):
+        set_today(monkeypatch, start + timedelta(days=offset))
+        bus.publish(TaskAttempted(1, 1, 1, "quiz", True))
+
+    # Day 6 without a success: the streak is still alive until the day ends
+    set_today(monkeypatch, start + timedelta(days=5))
+    progress = {item["achievement_id"]: item for item in engine.get_achievements()}
+    assert progress["streak_7"]["progress"] == 5
+
+    set_today(monkeypatch, start + timedelta(days=6))
+    progress = {item["achievement_id"]: item for item in engine.get_achievements()}
+    assert progress["streak_7"]["progress"] == 0
+
+    # Starts over: two more days are not enough for a 7-day streak
+    bus.publish(TaskAttempted(1, 1, 1, "quiz", True))
+    set_today(monkeypatch, start + timedelta(days=7))
+    bus.publish(TaskAttempted(1, 1, 1, "quiz", True))
+    assert "streak_7" not in unlocked
+    progress = {item["achievement_id"]: item for item in engine.get_achievements()}
+    assert progress["streak_7"]["progress"] == 2
+
+
+def test_only_successful_typing_counts(db, bus, unlocked):
+    AchievementEngine(db, bus)
+    bus.publish(TypingSessionRecorded(3, 90.0, 0.5, False))
+    assert unlocked == []
+    bus.publish(TypingSessionRecorded(3, 55.0, 1.0, True))
+    assert unlocked == ["wpm_30", "wpm_50"]
+
+
+def test_counters_persist_across_engines(db, bus, unlocked):
+    AchievementEngine(db, bus)
+    for task_id in range(1, 10):
+        bus.publish(completed(task_id))
+
+    # A new session: counters are read back, not re-seeded or double counted
+    next_bus = ProgressionEventBus()
+    announced = []
+    next_bus.subscribe(AchievementUnlocked, lambda event: announced.append(event.achievement_id))
+    AchievementEngine(db, next_bus)
+    next_bus.publish(completed(10))
+    assert announced == ["tasks_10"]
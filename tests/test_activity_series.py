@@ -0,0 +1,49 @@
+# test_activity_series.py
+# Tests of the daily and weekly activity series and of streaks.
+
+from datetime import date, timedelta
+
+from utils.activity_series import dense_daily, rolling_sum, streaks, weekly_totals
+
+TODAY = date(2024, 3, 15)   # A Friday
+
+
+def days_before(*offsets):
+    return [TODAY - timedelta(days=offset) for offset in sorted(offsets, reverse=True)]
+
+
+def test_streak_including_today():
+    assert streaks(days_before(0, 1, 2), TODAY) == (3, 3)
+
+
+def test_streak_alive_when_yesterday_was_active():
+    assert streaks(days_before(1, 2), TODAY) == (2, 2)
+
+
+def test_streak_broken_after_a_missed_day():
+    assert streaks(days_before(2, 3, 4, 5), TODAY) == (0, 4)
+
+
+def test_longest_streak_in_the_past():
+    assert streaks(days_before(0, 5, 6, 7, 8), TODAY) == (1, 4)
+
+
+def test_no_activity():
+    assert streaks([], TODAY) == (0, 0)
+
+
+def test_dense_daily_fills_idle_days():
+    totals = {TODAY: 3, TODAY - timedelta(days=2): 1, TODAY - timedelta(days=30): 9}
+    assert list(dense_daily(totals, TODAY, 4)) == [0, 1, 0, 3]
+
+
+def test_rolling_sum():
+    assert list(rolling_sum([1, 2, 3, 4, 5], 3)) == [1, 3, 6, 9, 12]
+
+
+def test_weekly_totals():
+    monday = TODAY - timedelta(days=TODAY.weekday())
+    totals = {TODAY: 2, monday: 1, monday - timedelta(days=1): 5}
+    mondays, values = weekly_totals(totals, TODAY, 2)
+    assert mondays == [monday - timedelta(weeks=1), monday]
+    assert list(values) == [5, 3]
@@ -0,0 +1,56 @@
+# test_code_canonical.py
+# Tests of canonical code forms and of the non-determinism check.
+
+from utils.code_canonical import (
+    canonical_dump,
+    canonical_forms,
+    is_equivalent,
+    matches_reference,
+    may_be_nondeterministic,
+)
+
+
+def test_formatting_and_comments_are_ignored():
+    reference = "x = 'a'\nprint(x)"
+    assert is_equivalent('x = "a"  # variable\n\nprint( x )', reference)
+
+
+def test_different_programs_are_not_equivalent():
+    assert not is_equivalent("print(1)", "print(2)")
+
+
+def test_code_that_does_not_parse():
+    assert canonical_dump("print(") is None
+    assert not is_equivalent("print(", "print(")
+
+
+def test_keep_lines_distinguishes_statement_positions():
+    assert canonical_dump("a = 1\nb = 2") == canonical_dump("a = 1\n\nb = 2")
+    assert (canonical_dump("a = 1\nb = 2", keep_lines=True)
+            != canonical_dump("a = 1\n\nb = 2", keep_lines=True))
+
+
+def test_forms_from_one_parse_match_canonical_dump():
+    code = "a = 1\n\nprint(a)"
+    assert canonical_forms(code) == (canonical_dump(code), canonical_dump(code, keep_lines=True))
+    assert canonical_forms("print(") is None
+
+
+def test_matches_reference_on_precomputed_dump():
+    reference = "print('a')"
+    assert matches_reference(canonical_dump('print("a")  # ok'), reference)
+    assert not matches_reference(canonical_dump("print('b')"), reference)
+    assert not matches_reference(None, reference)
+
+
+def test_nondeterministic_imports_and_calls():
+    assert may_be_nondeterministic("import random\nprint(random.randint(1, 6))")
+    assert may_be_nondeterministic("from time import time\nprint(time())")
+    assert may_be_nondeterministic("import os.path")
+    assert may_be_nondeterministic("print(id([]))")
+
+
+def test_deterministic_code():
+    assert not may_be_nondeterministic("nom = input()\nprint('Bonjour', nom)")
+    assert not may_be_nondeterministic("import math\nprint(math.sqrt(2))")
+    assert not may_be_nondeterministic("print(")
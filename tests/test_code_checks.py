@@ -0,0 +1,73 @@
+# test_code_checks.py
+# Tests of the static checks run on exercise code while it is edited.
+
+from utils.code_checks import ERROR, WARNING, check_code
+
+
+def test_valid_code_has_no_issue():
+    assert check_code("nom = input()\nprint('Bonjour', nom)") == []
+    assert check_code("   ") == []
+
+
+def test_syntax_error_is_the_only_issue():
+    issues = check_code("x = inconnu\nprint('a'")
+    assert len(issues) == 1
+    assert issues[0].severity == ERROR
+    assert issues[0].message.startswith("Erreur de syntaxe")
+
+
+def test_code_that_parses_but_does_not_compile():
+    issues = check_code("return 1")
+    assert [issue.severity for issue in issues] == [ERROR]
+
+
+def test_undefined_name_reported_once():
+    issues = check_code("print(mesage)\nprint(mesage)")
+    assert len(issues) == 1
+    issue = issues[0]
+    assert (issue.line, issue.column, issue.length, issue.severity) == (1, 6, 6, WARNING)
+
+
+def test_names_bound_anywhere_are_defined():
+    code = "def f():\n    global total\n    total = 1\nf()\nprint(total, len([]))"
+    assert check_code(code) == []
+
+
+def test_unused_local_variable():
+    issues = check_code("def f():\n    resultat = 1\n    return 2")
+    assert len(issues) == 1
+    assert issues[0].line == 2
+    assert "resultat" in issues[0].message
+
+
+def test_loop_and_unpacking_targets_are_not_reported():
+    code = (
+        "def f(path):\n"
+        "    for i in range(3):\n"
+        "        print('x')\n"
+        "    squares = [0 for n in range(3)]\n"
+        "    a, b = 1, 2\n"
+        "    [c, d] = squares[:2]\n"
+        "    with open(path) as fh:\n"
+        "        pass\n"
+        "    return a, c, squares"
+    )
+    assert check_code(code) == []
+
+
+def test_plain_assignment_still_reported_when_also_unpacked():
+    code = "def f():\n    x, y = 1, 2\n    y = 3\n    return x"
+    issues = check_code(code)
+    assert [(issue.line, issue.message) for issue in issues] == [
+        (3, "Variable « y » affectée mais jamais utilisée")
+    ]
+
+
+def test_variable_used_by_closure_is_not_unused():
+    code = "def f():\n    x = 1\n    def g():\n        return x\n    return g"
+    assert check_code(code) == []
+
+
+def test_columns_count_characters_not_bytes():
+    issues = check_code("é = 1; print(é, inconnu)")
+    assert issues[0].column == len("é = 1; print(é, ")
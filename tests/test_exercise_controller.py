@@ -0,0 +1,46 @@
+# test_exercise_controller.py
+# Tests of exercise grading, with the sandbox replaced by scripted cases.
+
+import time
+
+from controllers.exercise_controller import ExerciseController
+
+
+class ScriptedController(ExerciseController):
+    """Each test case sleeps for its "delay", then ends with its "status"."""
+
+    def _run_case(self, number, test, solution, user_code, grading):
+        time.sleep(test["delay"])
+        return {"number": number, "status": test["status"],
+                "message": f"cas {number}", "deterministic": True}
+
+
+def test_fail_fast_reports_lowest_numbered_failure():
+    tests = [
+        {"delay": 0.0, "status": "passed"},
+        {"delay": 0.2, "status": "failed"},   # Ends last
+        {"delay": 0.0, "status": "failed"},   # Ends first
+        {"delay": 0.0, "status": "passed"},
+    ]
+    success, message, cases = ScriptedController(fail_fast=True).grade("", "", tests)
+
+    assert not success
+    assert message.startswith("Test 2/4")
+    assert [case["status"] for case in cases] == ["passed", "failed", "skipped", "skipped"]
+
+
+def test_without_fail_fast_every_case_is_reported():
+    tests = [{"delay": 0.0, "status": status} for status in ("passed", "failed", "failed")]
+    success, message, cases = ScriptedController(fail_fast=False).grade("", "", tests)
+
+    assert not success
+    assert message.startswith("Test 2/3")
+    assert [case["status"] for case in cases] == ["passed", "failed", "failed"]
+
+
+def test_all_cases_passed():
+    tests = [{"delay": 0.0, "status": "passed"}] * 3
+    success, message, cases = ScriptedController().grade("", "", tests)
+
+    assert success
+    assert "3/3" in message
@@ -0,0 +1,28 @@
+# test_exercise_requirements.py
+# Tests of the source requirements of exercises (e.g. a mandatory comment).
+
+from controllers.task_controller import TaskController
+from utils.code_checks import unmet_requirement
+
+# Exercise task of the seeded lesson "Commentaires en Python"
+COMMENTS_EXERCISE_TASK_ID = 16
+
+
+def test_comment_requirement():
+    assert unmet_requirement("# Affiche un message\nprint('a')", ["comment"]) is None
+    assert unmet_requirement("print('a')  # Affiche un message", ["comment"]) is None
+    assert unmet_requirement("print('# pas un commentaire')", ["comment"]) is not None
+    assert unmet_requirement("print('a')", []) is None
+
+
+def test_comments_exercise_rejects_code_without_comment(db):
+    controller = TaskController(db)
+    result = controller.validate_task(COMMENTS_EXERCISE_TASK_ID, "print('Bienvenue dans PyLearn!')")
+    assert not result["success"]
+    assert "commentaire" in result["message"]
+
+
+def test_comments_exercise_accepts_commented_code(db):
+    controller = TaskController(db)
+    code = "# Souhaite la bienvenue\nprint('Bonjour !')"
+    assert controller.validate_task(COMMENTS_EXERCISE_TASK_ID, code)["success"]
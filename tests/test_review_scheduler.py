@@ -0,0 +1,82 @@
+# test_review_scheduler.py
+# Tests of the SM-2 update and of the review schedule stored in SQLite.
+
+from controllers.review_scheduler import (
+    DEFAULT_EASE,
+    MIN_EASE,
+    QUALITY_FORGOTTEN,
+    QUALITY_PERFECT,
+    SECONDS_PER_DAY,
+    ReviewScheduler,
+    sm2_update,
+)
+
+QUIZ_TASK_ID = 2
+NOW = 1_700_000_000.0
+
+
+def test_sm2_intervals_grow():
+    ease, interval, repetitions = DEFAULT_EASE, 0, 0
+    intervals = []
+    for _ in range(4):
+        ease, interval, repetitions = sm2_update(ease, interval, repetitions, QUALITY_PERFECT)
+        intervals.append(interval)
+    assert intervals[:2] == [1, 6]
+    assert intervals[2] == round(6 * ease)
+    assert intervals[3] > intervals[2]
+    assert ease > DEFAULT_EASE
+
+
+def test_sm2_failure_resets_and_lowers_ease():
+    ease, interval, repetitions = sm2_update(2.5, 15, 3, QUALITY_FORGOTTEN)
+    assert (interval, repetitions) == (0, 0)
+    assert ease < 2.5
+
+
+def test_sm2_ease_floor():
+    ease = MIN_EASE
+    for _ in range(5):
+        ease, _, _ = sm2_update(ease, 0, 0, QUALITY_FORGOTTEN)
+    assert ease == MIN_EASE
+
+
+def test_first_success_enrolls_task(db):
+    scheduler = ReviewScheduler(db)
+    scheduler.record_result(QUIZ_TASK_ID, True, now=NOW)
+
+    assert scheduler.count_due_reviews(now=NOW) == 0
+    due = scheduler.get_due_reviews(now=NOW + SECONDS_PER_DAY)
+    assert [review["task_id"] for review in due] == [QUIZ_TASK_ID]
+    assert due[0]["task_type"] == "quiz"
+
+
+def test_failure_before_enrollment_does_nothing(db):
+    scheduler = ReviewScheduler(db)
+    scheduler.record_result(QUIZ_TASK_ID, False, now=NOW)
+    assert scheduler.count_due_reviews(now=NOW + 100 * SECONDS_PER_DAY) == 0
+
+
+def test_success_ahead_of_schedule_keeps_due_date(db):
+    scheduler = ReviewScheduler(db)
+    scheduler.record_result(QUIZ_TASK_ID, True, now=NOW)
+    scheduler.record_result(QUIZ_TASK_ID, True, now=NOW + 3600)
+    assert scheduler.count_due_reviews(now=NOW + SECONDS_PER_DAY) == 1
+
+
+def test_review_success_pushes_next_review(db):
+    scheduler = ReviewScheduler(db)
+    scheduler.record_result(QUIZ_TASK_ID, True, now=NOW)
+    review_time = NOW + SECONDS_PER_DAY
+    scheduler.record_result(QUIZ_TASK_ID, True, now=review_time)
+
+    due = scheduler.get_due_reviews(now=review_time + 6 * SECONDS_PER_DAY)
+    assert due[0]["interval_days"] == 6
+    assert scheduler.count_due_reviews(now=review_time + 5 * SECONDS_PER_DAY) == 0
+
+
+def test_review_failure_makes_task_due_again(db):
+    scheduler = ReviewScheduler(db)
+    scheduler.record_result(QUIZ_TASK_ID, True, now=NOW)
+    failed_at = NOW + 2 * SECONDS_PER_DAY
+    scheduler.record_result(QUIZ_TASK_ID, False, now=failed_at)
+    assert scheduler.count_due_reviews(now=failed_at) == 1
@@ -0,0 +1,68 @@
+# test_sandbox.py
+# Tests of code execution in the sandbox: results, timeouts and resource limits.
+
+import sys
+
+import pytest
+
+from utils.sandbox import ExecutionLimits, SandboxPool, run_code
+
+# Resource limits are only applied on POSIX systems
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="rlimits POSIX uniquement")
+
+
+def test_output_and_stdin():
+    result = run_code("nom = input()\nprint('Bonjour', nom)", "Alice\n")
+    assert result.ok
+    assert result.stdout == "Bonjour Alice\n"
+
+
+def test_exception_reports_line():
+    result = run_code("x = 1\ny = x / 0")
+    assert result.status == "error"
+    assert result.line == 2
+    assert "ZeroDivisionError" in result.error
+
+
+def test_assertion_runs_in_code_namespace():
+    assert run_code("x = 2", assertion="assert x == 2").ok
+    result = run_code("x = 1", assertion="assert x == 2, 'x vaut 1'")
+    assert result.status == "assertion_failed"
+    assert result.error == "x vaut 1"
+
+
+def test_wall_clock_timeout():
+    limits = ExecutionLimits(wall_seconds=0.5, cpu_seconds=5)
+    result = run_code("while True:\n    pass", limits=limits)
+    assert result.status == "timeout"
+    assert result.duration_ms < 5000
+
+
+@posix_only
+def test_cpu_limit_kills_process():
+    limits = ExecutionLimits(wall_seconds=5.0, cpu_seconds=1)
+    result = run_code("while True:\n    pass", limits=limits)
+    assert result.status == "crashed"
+
+
+@posix_only
+def test_memory_limit():
+    limits = ExecutionLimits(memory_bytes=64 * 1024 * 1024)
+    result = run_code("data = bytearray(512 * 1024 * 1024)", limits=limits)
+    assert not result.ok
+    assert result.status in ("error", "crashed")
+    if result.status == "error":
+        assert "MemoryError" in result.error
+
+
+def test_pool_recovers_after_timeout():
+    pool = SandboxPool(size=1)
+    pool.warm_up()
+    try:
+        limits = ExecutionLimits(wall_seconds=0.5, cpu_seconds=5)
+        assert pool.run("while True:\n    pass", limits=limits).status == "timeout"
+        result = pool.run("print('ok')")
+        assert result.ok
+        assert result.stdout == "ok\n"
+    finally:
+        pool.close()
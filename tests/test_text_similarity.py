@@ -0,0 +1,131 @@
+# test_text_similarity.py
+# Tests of the edit-distance comparison used for typing and exercise feedback.
+
+import random
+import time
+
+from utils.text_similarity import MAX_EDITS, compare_texts, first_mismatch_position
+
+
+def kept(text, spans):
+    """Text without the characters of the mismatch spans."""
+    removed = {index for start, end in spans for index in range(start, end)}
+    return "".join(character for index, character in enumerate(text) if index not in removed)
+
+
+def random_code(rng, lines):
+    """Code-like text of `lines` lines of 20 to 60 characters."""
+    alphabet = "abcdefghijklmnopqrstuvwxyz_=()'+ "
+    return "\n".join(
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(20, 60)))
+        for _ in range(lines)
+    )
+
+
+def test_identical_texts():
+    result = compare_texts("print('Bonjour')", "print('Bonjour')")
+    assert result.ratio == 1.0
+    assert result.distance == 0
+    assert result.target_mismatches == []
+    assert result.typed_mismatches == []
+
+
+def test_empty_texts():
+    assert compare_texts("", "").ratio == 1.0
+    assert compare_texts("abc", "").distance == 3
+
+
+def test_missing_character_only_affects_itself():
+    # A positional comparison would mismatch everything after the "n"
+    result = compare_texts("print('Bonjour')", "prit('Bonjour')")
+    assert result.distance == 1
+    assert result.target_mismatches == [(3, 4)]
+    assert result.typed_mismatches == []
+
+
+def test_extra_and_replaced_characters():
+    result = compare_texts("abcdef", "abXdeff")
+    # "c" replaced by "X" (one deletion, one insertion) and an extra "f"
+    assert result.distance == 3
+    assert result.target_mismatches == [(2, 3)]
+    assert result.typed_mismatches[0] == (2, 3)
+    assert len(result.typed_mismatches) == 2
+    assert abs(result.ratio - 10 / 13) < 1e-9
+
+
+def test_stops_below_min_ratio():
+    result = compare_texts("aaaaaaaaaa", "bbbbbbbbbb", min_ratio=0.8)
+    assert result.exceeded_threshold
+    assert result.ratio <= 0.8
+
+
+def test_single_line_beyond_budget_is_undecided():
+    # Too different to diff within 4 edits, and no lines to align
+    result = compare_texts("abcdefgh" * 10, "hgfedcba" * 10, min_ratio=0.8, max_edits=4)
+    assert result.exceeded_threshold
+
+
+def test_first_mismatch_position():
+    text = "a = 1\nprint(a)"
+    assert first_mismatch_position(text, 0) == (1, 1)
+    assert first_mismatch_position(text, 8) == (2, 3)
+
+
+def test_long_texts_stay_fast():
+    rng = random.Random(1)
+    alphabet = "abcdefghij \n"
+    target = "".join(rng.choice(alphabet) for _ in range(5000))
+    unrelated = "".join(rng.choice(alphabet) for _ in range(5000))
+    rotated = target[2500:] + target[:2500]
+
+    start = time.perf_counter()
+    for typed in (unrelated, rotated):
+        result = compare_texts(target, typed, min_ratio=0.8)
+        assert result.exceeded_threshold
+    # Uncapped, the first comparison alone took over a second
+    assert time.perf_counter() - start < 0.5
+
+
+def test_scattered_typos_in_long_text_are_exact():
+    rng = random.Random(2)
+    target = "".join(rng.choice("abcdefghij \n") for _ in range(5000))
+    typed = list(target)
+    for index in range(0, 5000, 50):
+        typed[index] = "#"
+    result = compare_texts(target, "".join(typed), min_ratio=0.8)
+    assert result.distance == 200 < MAX_EDITS
+    assert result.ratio > 0.95
+
+
+def test_long_almost_correct_text_beyond_budget():
+    # About 5000 characters with a typo every 25: about 400 edits, more
+    # than an exact diff is allowed
+    rng = random.Random(3)
+    target = random_code(rng, 125)
+    typed = list(target)
+    for index in range(0, len(target), 25):
+        if typed[index] != "\n":
+            typed[index] = "#"
+    typed = "".join(typed)
+
+    start = time.perf_counter()
+    result = compare_texts(target, typed, min_ratio=0.8)
+    assert time.perf_counter() - start < 0.5
+
+    assert not result.exceeded_threshold
+    assert result.distance > MAX_EDITS
+    assert result.ratio > 0.9
+    # The mismatches form a valid edit script
+    assert kept(target, result.target_mismatches) == kept(typed, result.typed_mismatches)
+
+
+def test_long_texts_with_moved_lines():
+    rng = random.Random(4)
+    target = random_code(rng, 100)
+    lines = target.split("\n")
+    typed = "\n".join(lines[50:] + lines[:50])
+
+    start = time.perf_counter()
+    result = compare_texts(target, typed, min_ratio=0.8)
+    assert time.perf_counter() - start < 0.5
+    assert result.exceeded_threshold
@@ -0,0 +1,55 @@
+# test_typing_comparator.py
+# Tests of the per-keystroke comparison of typed text with its target.
+
+from utils.typing_comparator import IncrementalTypingComparator
+
+
+def type_text(comparator, text):
+    for character in text:
+        comparator.apply_change(comparator.typed_length, 0, character)
+
+
+def test_correct_typing():
+    comparator = IncrementalTypingComparator("print('a')")
+    type_text(comparator, "print('a')")
+    assert comparator.is_complete
+    assert comparator.error_count == 0
+
+
+def test_wrong_character_is_an_error():
+    comparator = IncrementalTypingComparator("abc")
+    ranges = comparator.apply_change(0, 0, "x")
+    assert ranges == [(0, 1, True)]
+    assert comparator.is_error(0)
+
+
+def test_insertion_realigns_following_characters():
+    comparator = IncrementalTypingComparator("abcd")
+    type_text(comparator, "abd")
+    assert comparator.error_count == 1
+
+    # Insert the missing "c": "d" moves back in place and is restyled
+    ranges = comparator.apply_change(2, 0, "c")
+    assert comparator.error_count == 0
+    assert (2, 3, False) in ranges
+    assert (3, 4, False) in ranges
+
+
+def test_replacement_only_restyles_the_edit():
+    comparator = IncrementalTypingComparator()
+    comparator.reset("abcd", "abXd")
+    assert comparator.apply_change(2, 1, "c") == [(2, 3, False)]
+    assert comparator.is_complete
+
+
+def test_incremental_state_matches_full_comparison():
+    target = "for i in range(3):\n    print(i)"
+    comparator = IncrementalTypingComparator(target)
+    type_text(comparator, "for i in rnge(3):\n    print(i)")
+    comparator.apply_change(10, 0, "a")
+    comparator.apply_change(0, 3, "while")
+
+    fresh = IncrementalTypingComparator()
+    fresh.reset(target, comparator.typed)
+    assert comparator.full_ranges() == fresh.full_ranges()
+    assert comparator.error_count == fresh.error_count
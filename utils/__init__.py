@@ -2,5 +2,12 @@
 # Utilities package for PyLearn Desktop
 
 from utils.resource_path import resource_path, get_base_path, get_user_data_path, get_database_path
+from utils.text_similarity import SimilarityResult, compare_texts, first_mismatch_position
+from utils.typing_comparator import IncrementalTypingComparator
+from utils.typing_metrics import TypingSessionMetrics, KeystrokeRecorder
 
-__all__ = ['resource_path', 'get_base_path', 'get_user_data_path', 'get_database_path']
+__all__ = [
+    'resource_path', 'get_base_path', 'get_user_data_path', 'get_database_path',
+    'SimilarityResult', 'compare_texts', 'first_mismatch_position',
+    'IncrementalTypingComparator', 'TypingSessionMetrics', 'KeystrokeRecorder',
+]
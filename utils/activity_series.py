@@ -0,0 +1,83 @@
+# activity_series.py
+# Daily and weekly activity series and streaks built from per-day totals.
+# Inputs are the rows of a GROUP BY day query, so the work here grows with
+# the number of active days, never with the number of attempts; rolling
+# windows use a running sum over a preallocated array.
+
+from array import array
+from datetime import date, timedelta
+from typing import Dict, List, Sequence, Tuple
+
+
+def dense_daily(day_totals: Dict[date, int], end: date, days: int) -> array:
+    """
+    Totals of the `days` days ending on `end`, oldest first, 0 for idle days.
+
+    Args:
+        day_totals: Total per active day
+        end: Last day of the series (usually today)
+        days: Length of the series
+    """
+    start = end - timedelta(days=days - 1)
+    values = array('i', bytes(4 * days))
+    for day, total in day_totals.items():
+        index = (day - start).days
+        if 0 <= index < days:
+            values[index] = total
+    return values
+
+
+def rolling_sum(values: Sequence[int], window: int) -> array:
+    """Sum of each value and the `window - 1` values before it, in O(n)."""
+    sums = array('i', bytes(4 * len(values)))
+    running = 0
+    for index, value in enumerate(values):
+        running += value
+        if index >= window:
+            running -= values[index - window]
+        sums[index] = running
+    return sums
+
+
+def weekly_totals(day_totals: Dict[date, int], end: date, weeks: int) -> Tuple[List[date], array]:
+    """
+    Totals per week (Monday to Sunday) of the `weeks` weeks ending with `end`'s week.
+
+    Returns:
+        Tuple (Monday of each week, total of each week), oldest first
+    """
+    last_monday = end - timedelta(days=end.weekday())
+    first_monday = last_monday - timedelta(weeks=weeks - 1)
+    values = array('i', bytes(4 * weeks))
+    for day, total in day_totals.items():
+        index = (day - first_monday).days // 7
+        if 0 <= index < weeks:
+            values[index] += total
+    mondays = [first_monday + timedelta(weeks=index) for index in range(weeks)]
+    return mondays, values
+
+
+def streaks(active_days: Sequence[date], today: date) -> Tuple[int, int]:
+    """
+    Current and longest runs of consecutive active days.
+
+    The current streak is still alive when today has no activity yet but
+    yesterday had.
+
+    Args:
+        active_days: Days with activity, in increasing order
+        today: Reference day for the current streak
+
+    Returns:
+        Tuple (current streak, longest streak), in days
+    """
+    longest = run = 0
+    previous = None
+    for day in active_days:
+        run = run + 1 if previous is not None and (day - previous).days == 1 else 1
+        longest = max(longest, run)
+        previous = day
+
+    if previous is None or (today - previous).days > 1:
+        return 0, longest
+    return run, longest
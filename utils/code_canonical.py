@@ -0,0 +1,137 @@
+# code_canonical.py
+# Canonical forms of Python source code, insensitive to formatting,
+# comments and string quoting, used to recognise equivalent submissions.
+# Also tells whether code may behave differently from one run to the next.
+
+import ast
+import hashlib
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Modules whose results depend on chance, the clock or the machine
+NONDETERMINISTIC_MODULES = frozenset({
+    "random", "secrets", "uuid", "time", "datetime", "os", "socket", "threading",
+})
+# Builtins whose results depend on the process or on files outside the test input
+NONDETERMINISTIC_CALLS = frozenset({"id", "hash", "open", "__import__"})
+
+
+def canonical_dump(code: str, keep_lines: bool = False) -> Optional[str]:
+    """
+    Canonical form of Python source, or None if it does not parse.
+
+    The AST dump ignores comments, blank lines, spacing and quote style.
+
+    Args:
+        code: Python source
+        keep_lines: Also record the line of each statement, so that two
+            sources with the same form report errors on the same lines
+
+    Returns:
+        The canonical form as a string, or None on a syntax error
+    """
+    forms = canonical_forms(code)
+    if forms is None:
+        return None
+    return forms[1] if keep_lines else forms[0]
+
+
+def canonical_forms(code: str) -> Optional[Tuple[str, str]]:
+    """
+    Both canonical forms of code from a single parse.
+
+    Returns:
+        Tuple (canonical_dump(code), canonical_dump(code, keep_lines=True)),
+        or None on a syntax error
+    """
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError):
+        return None
+
+    dump = ast.dump(tree)
+    lines = sorted(node.lineno for node in ast.walk(tree) if isinstance(node, ast.stmt))
+    return dump, dump + "|" + ",".join(map(str, lines))
+
+
+def structural_hash(code: str) -> Optional[str]:
+    """SHA-256 of the canonical form of code, or None if it does not parse."""
+    return _hash_dump(canonical_dump(code))
+
+
+def _hash_dump(dump: Optional[str]) -> Optional[str]:
+    """SHA-256 of a canonical form, None for code that does not parse."""
+    if dump is None:
+        return None
+    return hashlib.sha256(dump.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def reference_hash(code: str) -> Optional[str]:
+    """structural_hash() of a stored solution, computed once per solution text."""
+    return structural_hash(code)
+
+
+def is_equivalent(code: str, reference: str) -> bool:
+    """
+    Whether code parses to the same program as a reference solution.
+
+    Equivalent programs behave identically, so a match needs no execution.
+
+    Args:
+        code: Submitted source, parsed on every call
+        reference: Stored solution, whose canonical form is cached
+
+    Returns:
+        True if both parse and have the same canonical form
+    """
+    return matches_reference(canonical_dump(code), reference)
+
+
+def matches_reference(dump: Optional[str], reference: str) -> bool:
+    """
+    is_equivalent() for code whose canonical_dump() is already computed.
+
+    Args:
+        dump: canonical_dump() of the submitted code, None if it does not parse
+        reference: Stored solution, whose canonical form is cached
+
+    Returns:
+        True if both parse and have the same canonical form
+    """
+    expected = reference_hash(reference)
+    return expected is not None and _hash_dump(dump) == expected
+
+
+def may_be_nondeterministic(code: str) -> bool:
+    """
+    Whether running code twice on the same input may give different results.
+
+    True when the code imports a module of NONDETERMINISTIC_MODULES or
+    calls a builtin of NONDETERMINISTIC_CALLS. Code that does not parse
+    always fails the same way, so it is deterministic.
+
+    Args:
+        code: Python source
+
+    Returns:
+        True if the outcome of a run should not be reused
+    """
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError):
+        return False
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules = [node.module or ""]
+        elif (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+              and node.func.id in NONDETERMINISTIC_CALLS):
+            return True
+        else:
+            continue
+        if any(module.split(".")[0] in NONDETERMINISTIC_MODULES for module in modules):
+            return True
+    return False
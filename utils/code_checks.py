@@ -0,0 +1,237 @@
+# code_checks.py
+# Static checks of a learner's code before submission: syntax errors,
+# undefined names and unused local variables, found without running it,
+# and the source requirements an exercise can set (e.g. a comment).
+
+import ast
+import builtins
+import io
+import symtable
+import tokenize
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+ERROR = "error"
+WARNING = "warning"
+
+# Names every module has besides the builtins
+MODULE_NAMES = frozenset({"__name__", "__file__", "__doc__", "__builtins__", "__spec__",
+                          "__loader__", "__package__", "__annotations__"})
+BUILTIN_NAMES = frozenset(dir(builtins)) | MODULE_NAMES
+
+
+@dataclass(frozen=True)
+class CodeIssue:
+    """A problem found in the code, located on one line.
+
+    Attributes:
+        line: Line number, starting at 1
+        column: First character of the problem, starting at 0
+        length: Number of characters to mark (at least 1)
+        severity: ERROR (the code cannot run) or WARNING
+        message: Explanation shown to the learner
+    """
+    line: int
+    column: int
+    length: int
+    severity: str
+    message: str
+
+
+def check_code(source: str) -> List[CodeIssue]:
+    """
+    Check Python source without executing it.
+
+    A syntax error is the only issue reported when there is one, since
+    the code cannot be analysed further.
+
+    Args:
+        source: The learner's code
+
+    Returns:
+        Issues sorted by position
+    """
+    if not source.strip():
+        return []
+    try:
+        # compile() also rejects what parses but cannot compile
+        # (e.g. "return" outside a function)
+        compile(source, "<exercice>", "exec", dont_inherit=True)
+        tree = ast.parse(source)
+        table = symtable.symtable(source, "<exercice>", "exec")
+    except SyntaxError as exc:
+        return [_syntax_issue(source, exc)]
+    except ValueError as exc:
+        # e.g. null bytes in the source
+        return [CodeIssue(1, 0, 1, ERROR, f"Code invalide : {exc}")]
+
+    lines = source.split("\n")
+    issues = _undefined_names(tree, table, lines) + _unused_variables(tree, table, lines)
+    return sorted(issues, key=lambda issue: (issue.line, issue.column))
+
+
+def unmet_requirement(source: str, requirements: Sequence[str]) -> Optional[str]:
+    """
+    Check the source against the requirements of an exercise.
+
+    Some requirements cannot be seen in the output, e.g. a comment, so the
+    source itself is checked. Unknown requirement names are ignored.
+
+    Args:
+        source: The learner's code
+        requirements: Names of SOURCE_REQUIREMENTS
+
+    Returns:
+        Message for the first requirement not met, or None
+    """
+    for name in requirements:
+        check, message = SOURCE_REQUIREMENTS.get(name, (None, ""))
+        if check is not None and not check(source):
+            return message
+    return None
+
+
+def _has_comment(source: str) -> bool:
+    """Whether the source contains a # comment (not a # inside a string)."""
+    try:
+        return any(token.type == tokenize.COMMENT
+                   for token in tokenize.generate_tokens(io.StringIO(source).readline))
+    except (tokenize.TokenError, SyntaxError):
+        # Running the code will report the error; do not mask it
+        return True
+
+
+# Requirement name -> (check of the source, message when it fails)
+SOURCE_REQUIREMENTS: Dict[str, Tuple[Callable[[str], bool], str]] = {
+    "comment": (_has_comment, "Votre code doit contenir au moins un commentaire (# ...)."),
+}
+
+
+def _syntax_issue(source: str, exc: SyntaxError) -> CodeIssue:
+    """Locate a SyntaxError on its line (offset is 1-based, in characters)."""
+    lines = source.split("\n")
+    line = min(max(exc.lineno or 1, 1), len(lines))
+    text = lines[line - 1]
+    column = min(max((exc.offset or 1) - 1, 0), max(len(text) - 1, 0))
+    end_offset = getattr(exc, "end_offset", None)
+    if getattr(exc, "end_lineno", None) == line and end_offset and end_offset - 1 > column:
+        length = end_offset - 1 - column
+    else:
+        length = max(len(text) - column, 1)
+    return CodeIssue(line, column, length, ERROR, f"Erreur de syntaxe : {exc.msg}")
+
+
+# ----------------------------------------------------------------------
+# Name analysis
+# ----------------------------------------------------------------------
+
+def _undefined_names(tree: ast.Module, table: symtable.SymbolTable,
+                     lines: List[str]) -> List[CodeIssue]:
+    """Names read somewhere but bound nowhere: not in any scope, nor builtins."""
+    if any(isinstance(node, ast.ImportFrom) and any(alias.name == "*" for alias in node.names)
+           for node in ast.walk(tree)):
+        # "from module import *" can bind any name
+        return []
+
+    # Module names, including those bound by "global" statements in functions
+    defined: Set[str] = set(BUILTIN_NAMES)
+    undefined: Set[str] = set()
+    for scope in _walk_tables(table):
+        for symbol in scope.get_symbols():
+            name = symbol.get_name()
+            if scope.get_type() == "module" or symbol.is_declared_global():
+                if symbol.is_assigned() or symbol.is_imported() or symbol.is_namespace():
+                    defined.add(name)
+            if symbol.is_referenced() and (scope.get_type() == "module" or symbol.is_global()):
+                undefined.add(name)
+    undefined -= defined
+
+    issues = []
+    reported: Set[str] = set()
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+                and node.id in undefined and node.id not in reported):
+            reported.add(node.id)
+            issues.append(_name_issue(node, lines, WARNING, f"Nom non défini : « {node.id} »"))
+    return issues
+
+
+def _unused_variables(tree: ast.Module, table: symtable.SymbolTable,
+                      lines: List[str]) -> List[CodeIssue]:
+    """Local variables of functions that are assigned but never read.
+
+    Like pyflakes, names only bound as loop or comprehension targets, in
+    tuple unpacking or by "with ... as" are not reported: leaving them
+    unused is normal.
+    """
+    functions: Dict[int, ast.AST] = {
+        node.lineno: node for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+    issues = []
+    for scope in _walk_tables(table):
+        if scope.get_type() != "function":
+            continue
+        function = functions.get(scope.get_lineno())
+        if function is None:
+            continue
+        # Variables read by nested functions (closures) are used
+        free = {
+            symbol.get_name()
+            for child in scope.get_children() for nested in _walk_tables(child)
+            for symbol in nested.get_symbols() if symbol.is_free()
+        }
+        unused = {
+            symbol.get_name() for symbol in scope.get_symbols()
+            if symbol.is_local() and symbol.is_assigned() and not symbol.is_referenced()
+            and not symbol.is_parameter() and not symbol.is_namespace()
+            and not symbol.get_name().startswith("_")
+        } - free
+        loose = _loose_bindings(function)
+        for name in sorted(unused):
+            node = _first_store(function, name, loose)
+            if node is not None:
+                issues.append(_name_issue(
+                    node, lines, WARNING,
+                    f"Variable « {name} » affectée mais jamais utilisée"
+                ))
+    return issues
+
+
+def _walk_tables(table: symtable.SymbolTable) -> Iterator[symtable.SymbolTable]:
+    """A symbol table and all the tables nested in it."""
+    yield table
+    for child in table.get_children():
+        yield from _walk_tables(child)
+
+
+def _loose_bindings(function: ast.AST) -> Set[int]:
+    """ids of the Name nodes bound by loops, comprehensions, unpacking or "with ... as"."""
+    targets: List[ast.AST] = []
+    for node in ast.walk(function):
+        if isinstance(node, (ast.For, ast.AsyncFor, ast.comprehension)):
+            targets.append(node.target)
+        elif isinstance(node, ast.withitem) and node.optional_vars is not None:
+            targets.append(node.optional_vars)
+        elif isinstance(node, (ast.Tuple, ast.List)) and isinstance(node.ctx, ast.Store):
+            targets.append(node)
+    return {id(node) for target in targets for node in ast.walk(target)
+            if isinstance(node, ast.Name)}
+
+
+def _first_store(function: ast.AST, name: str, exclude: Set[int]) -> Optional[ast.Name]:
+    """First assignment of `name` in the body of a function, skipping `exclude` node ids."""
+    stores = [
+        node for node in ast.walk(function)
+        if isinstance(node, ast.Name) and node.id == name and isinstance(node.ctx, ast.Store)
+        and id(node) not in exclude
+    ]
+    return min(stores, key=lambda node: (node.lineno, node.col_offset), default=None)
+
+
+def _name_issue(node: ast.Name, lines: List[str], severity: str, message: str) -> CodeIssue:
+    """Issue covering a name; AST columns count UTF-8 bytes, issues count characters."""
+    text = lines[node.lineno - 1]
+    column = len(text.encode("utf-8")[:node.col_offset].decode("utf-8", errors="ignore"))
+    return CodeIssue(node.lineno, column, len(node.id), severity, message)
@@ -0,0 +1,105 @@
+# python_tokens.py
+# Line-by-line tokenizer of Python source for syntax highlighting.
+# Each line is tokenized from the state left by the previous line (inside
+# a triple-quoted string or not), so an editor only re-tokenizes the lines
+# that changed and the following ones whose starting state changed.
+
+import builtins
+import keyword
+import re
+from typing import List, Tuple
+
+# Line states: where the previous line left off
+STATE_NORMAL = 0
+STATE_TRIPLE_SINGLE = 1   # Inside a ''' string
+STATE_TRIPLE_DOUBLE = 2   # Inside a """ string
+
+TRIPLE_QUOTES = {STATE_TRIPLE_SINGLE: "'''", STATE_TRIPLE_DOUBLE: '"""'}
+
+# Token kinds
+KEYWORD = "keyword"
+BUILTIN = "builtin"
+STRING = "string"
+NUMBER = "number"
+COMMENT = "comment"
+DECORATOR = "decorator"
+DEFINITION = "definition"
+
+# (start, length, kind) of a highlighted token within its line
+Token = Tuple[int, int, str]
+
+KEYWORDS = frozenset(keyword.kwlist) | frozenset(getattr(keyword, "softkwlist", ()))
+BUILTINS = frozenset(name for name in dir(builtins) if not name.startswith("_"))
+
+# Alternatives are tried in order at each position: string prefixes must
+# win over identifiers, and identifiers over numbers (e.g. "x1")
+_TOKEN_PATTERN = re.compile(r"""
+    (?P<comment>\#.*)
+  | (?P<triple>(?i:[rbuf]{0,2})(?:'''|\"\"\"))
+  | (?P<string>(?i:[rbuf]{0,2})(?:'(?:[^'\\\n]|\\.)*'?|"(?:[^"\\\n]|\\.)*"?))
+  | (?P<decorator>@[A-Za-z_][\w.]*)
+  | (?P<name>[A-Za-z_]\w*)
+  | (?P<number>0[xXoObB][\da-fA-F_]+|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?[jJ]?)
+""", re.VERBOSE)
+
+
+def tokenize_line(line: str, state: int = STATE_NORMAL) -> Tuple[List[Token], int]:
+    """
+    Tokenize one line of Python source.
+
+    Args:
+        line: The line, without its line break
+        state: State left by the previous line (STATE_* constant)
+
+    Returns:
+        Tuple (tokens, state at the end of the line). Text outside the
+        tokens is plain code.
+    """
+    tokens: List[Token] = []
+    position = 0
+
+    if state in TRIPLE_QUOTES:
+        end = line.find(TRIPLE_QUOTES[state])
+        if end == -1:
+            return [(0, len(line), STRING)], state
+        position = end + 3
+        tokens.append((0, position, STRING))
+
+    expect_definition = False
+    length = len(line)
+    while position < length:
+        match = _TOKEN_PATTERN.search(line, position)
+        if match is None:
+            break
+        start, position = match.span()
+        kind = match.lastgroup
+
+        if kind == "triple":
+            quotes = match.group()[-3:]
+            end = line.find(quotes, position)
+            if end == -1:
+                tokens.append((start, length - start, STRING))
+                return tokens, (STATE_TRIPLE_SINGLE if quotes == "'''" else STATE_TRIPLE_DOUBLE)
+            position = end + 3
+            tokens.append((start, position - start, STRING))
+        elif kind == "name":
+            word = match.group()
+            if expect_definition:
+                tokens.append((start, position - start, DEFINITION))
+            elif word in KEYWORDS:
+                tokens.append((start, position - start, KEYWORD))
+            elif word in BUILTINS:
+                tokens.append((start, position - start, BUILTIN))
+            expect_definition = word in ("def", "class")
+            continue
+        elif kind == "comment":
+            tokens.append((start, position - start, COMMENT))
+        elif kind == "string":
+            tokens.append((start, position - start, STRING))
+        elif kind == "number":
+            tokens.append((start, position - start, NUMBER))
+        elif kind == "decorator":
+            tokens.append((start, position - start, DECORATOR))
+        expect_definition = False
+
+    return tokens, STATE_NORMAL
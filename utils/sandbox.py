@@ -0,0 +1,283 @@
+# sandbox.py
+# Runs learner code in an isolated child process with resource limits.
+# The child is utils/sandbox_worker.py (or the frozen executable started
+# with SANDBOX_WORKER_FLAG); it receives the job as a JSON line on stdin.
+# SandboxPool keeps workers started in advance so that a submission does
+# not wait for interpreter startup.
+
+import atexit
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Tuple
+
+# Command line flag making a frozen build behave as a sandbox worker
+SANDBOX_WORKER_FLAG = "--sandbox-worker"
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sandbox_worker.py")
+
+# Hide the console window of child processes on Windows
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+
+class SandboxError(Exception):
+    """Raised when the sandbox itself cannot run code (not when the code fails)."""
+
+
+@dataclass(frozen=True)
+class ExecutionLimits:
+    """Resource limits applied to one execution.
+
+    Attributes:
+        wall_seconds: Hard timeout enforced by the parent, on every platform
+        cpu_seconds: CPU time limit (POSIX only)
+        memory_bytes: Address space limit (POSIX only)
+        max_output: Characters of output kept, the rest is dropped
+    """
+    wall_seconds: float = 5.0
+    cpu_seconds: int = 2
+    memory_bytes: int = 256 * 1024 * 1024
+    max_output: int = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ExecutionResult:
+    """Outcome of running code in the sandbox.
+
+    Attributes:
+        status: "ok", "error" (exception in the code), "assertion_failed"
+            (a test's assertion snippet failed), "timeout" or "crashed"
+            (killed, e.g. by the CPU limit)
+        stdout: Everything the code printed
+        error: Last line of the exception, if any
+        line: Line of the learner's code that raised, or 0
+        duration_ms: Wall-clock time including process start
+    """
+    status: str
+    stdout: str = ""
+    error: str = ""
+    line: int = 0
+    duration_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the code ran to completion without an exception."""
+        return self.status == "ok"
+
+
+DEFAULT_LIMITS = ExecutionLimits()
+
+# Enough workers to run the test cases of an exercise side by side
+DEFAULT_POOL_SIZE = min(4, os.cpu_count() or 2)
+
+
+def worker_command() -> List[str]:
+    """Command line starting a sandbox worker process."""
+    if getattr(sys, "frozen", False):
+        return [sys.executable, SANDBOX_WORKER_FLAG]
+    # -I: ignore environment variables and the user site, -S: skip site
+    return [sys.executable, "-I", "-S", WORKER_SCRIPT]
+
+
+def worker_environment() -> dict:
+    """Minimal environment for a worker process."""
+    env = {"PYTHONIOENCODING": "utf-8", "PYTHONDONTWRITEBYTECODE": "1"}
+    # Needed by Python on Windows and by the PyInstaller bootloader
+    for name in ("SYSTEMROOT", "TEMP", "TMP"):
+        if name in os.environ:
+            env[name] = os.environ[name]
+    return env
+
+
+def encode_job(code: str, stdin: str, limits: ExecutionLimits, assertion: str = "") -> str:
+    """Serialize a job as the JSON line read by the worker."""
+    return json.dumps({
+        "code": code,
+        "stdin": stdin,
+        "assertion": assertion,
+        "max_output": limits.max_output,
+        "limits": asdict(limits),
+    }) + "\n"
+
+
+def decode_result(output: str, returncode: Optional[int], duration_ms: float) -> ExecutionResult:
+    """Build an ExecutionResult from the worker's output."""
+    lines = output.strip().splitlines()
+    if not lines:
+        # Killed before reporting (CPU or memory limit)
+        return ExecutionResult("crashed", error=f"code de sortie {returncode}",
+                               duration_ms=duration_ms)
+    try:
+        data = json.loads(lines[-1])
+    except ValueError:
+        raise SandboxError("Réponse illisible du processus d'exécution.")
+    return ExecutionResult(
+        status=data["status"],
+        stdout=data["stdout"],
+        error=data["error"],
+        line=data["line"],
+        duration_ms=duration_ms,
+    )
+
+
+def run_code(code: str, stdin: str = "", limits: ExecutionLimits = DEFAULT_LIMITS,
+             assertion: str = "") -> ExecutionResult:
+    """
+    Run code in a fresh sandbox process and wait for it.
+
+    Blocks for at most limits.wall_seconds; call it from a worker thread.
+
+    Args:
+        code: Python source to run
+        stdin: Text returned line by line by input()
+        limits: Resource limits for this run
+        assertion: Python snippet run after the code, in its namespace
+
+    Returns:
+        ExecutionResult of the run
+
+    Raises:
+        SandboxError: If the worker process could not be started
+    """
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="pylearn-sandbox-") as workdir:
+        try:
+            completed = subprocess.run(
+                worker_command(),
+                input=encode_job(code, stdin, limits, assertion),
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                timeout=limits.wall_seconds,
+                cwd=workdir,
+                env=worker_environment(),
+                creationflags=_CREATION_FLAGS,
+            )
+        except subprocess.TimeoutExpired:
+            # subprocess.run() has already killed the child
+            return ExecutionResult("timeout", duration_ms=(time.perf_counter() - start) * 1000)
+        except OSError as exc:
+            raise SandboxError(f"Impossible de lancer le processus d'exécution : {exc}")
+
+    duration_ms = (time.perf_counter() - start) * 1000
+    return decode_result(completed.stdout, completed.returncode, duration_ms)
+
+
+class SandboxPool:
+    """Workers started ahead of time, each used for a single job.
+
+    A worker has finished starting Python and waits for its job on stdin
+    when it is handed out. After the job (or a crash or timeout) it exits
+    and a replacement is started right away, so no state ever leaks from
+    one submission to the next. Thread-safe: run() is called from pool
+    threads.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, limits: ExecutionLimits = DEFAULT_LIMITS) -> None:
+        self.size = size
+        self.limits = limits
+        self._idle: List[Tuple[subprocess.Popen, tempfile.TemporaryDirectory]] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def warm_up(self) -> None:
+        """Start the idle workers if they are not running yet."""
+        with self._lock:
+            if self._closed:
+                return
+            if not self._started:
+                self._started = True
+                atexit.register(self.close)
+            missing = self.size - len(self._idle)
+        for _ in range(missing):
+            self._add_idle_worker()
+
+    def run(self, code: str, stdin: str = "",
+            limits: Optional[ExecutionLimits] = None, assertion: str = "") -> ExecutionResult:
+        """
+        Run code in a pre-started worker (or a new one if none is idle).
+
+        Same contract as run_code().
+        """
+        limits = limits or self.limits
+        start = time.perf_counter()
+        process, workdir = self._acquire()
+        try:
+            try:
+                output, _ = process.communicate(encode_job(code, stdin, limits, assertion),
+                                                timeout=limits.wall_seconds)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                return ExecutionResult("timeout", duration_ms=(time.perf_counter() - start) * 1000)
+            return decode_result(output, process.returncode, (time.perf_counter() - start) * 1000)
+        finally:
+            workdir.cleanup()
+            # Recycle: this worker is done, start its replacement
+            self._add_idle_worker()
+
+    def close(self) -> None:
+        """Stop the idle workers; later run() calls start workers on demand."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for process, workdir in idle:
+            process.kill()
+            process.communicate()
+            workdir.cleanup()
+
+    def _acquire(self) -> Tuple[subprocess.Popen, tempfile.TemporaryDirectory]:
+        """Take an idle worker that is still alive, or start one."""
+        while True:
+            with self._lock:
+                worker = self._idle.pop(0) if self._idle else None
+            if worker is None:
+                return self._spawn()
+            process, workdir = worker
+            if process.poll() is None:
+                return worker
+            # Died while idle: discard it
+            process.communicate()
+            workdir.cleanup()
+
+    def _add_idle_worker(self) -> None:
+        """Start a worker and keep it idle, unless the pool is full or closed."""
+        with self._lock:
+            if self._closed or len(self._idle) >= self.size:
+                return
+        worker = self._spawn()
+        with self._lock:
+            if not self._closed and len(self._idle) < self.size:
+                self._idle.append(worker)
+                return
+        process, workdir = worker
+        process.kill()
+        process.communicate()
+        workdir.cleanup()
+
+    @staticmethod
+    def _spawn() -> Tuple[subprocess.Popen, tempfile.TemporaryDirectory]:
+        """Start a worker process in its own temporary directory."""
+        workdir = tempfile.TemporaryDirectory(prefix="pylearn-sandbox-")
+        try:
+            process = subprocess.Popen(
+                worker_command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                cwd=workdir.name,
+                env=worker_environment(),
+                creationflags=_CREATION_FLAGS,
+            )
+        except OSError as exc:
+            workdir.cleanup()
+            raise SandboxError(f"Impossible de lancer le processus d'exécution : {exc}")
+        return process, workdir
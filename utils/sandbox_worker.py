@@ -0,0 +1,153 @@
+# sandbox_worker.py
+# Child process side of the exercise sandbox.
+# Reads one job as a JSON line on stdin, runs the learner's code under
+# resource limits and writes the result as one JSON line on stdout.
+# Only the standard library is used, so the worker starts quickly.
+# Workers of a SandboxPool are started ahead of time and block on stdin
+# until they get their job, with PRELOADED_MODULES already imported.
+
+import builtins
+import io
+import json
+import os
+import sys
+import traceback
+
+# Filename given to learner code, used to find its frames in tracebacks
+CODE_FILENAME = "<exercice>"
+# Filename of the assertion snippet run after the code by a test case
+TEST_FILENAME = "<test>"
+
+# Imported before waiting for a job, so exercises importing them start fast
+PRELOADED_MODULES = ("math", "random", "string", "collections", "itertools")
+
+
+class _LimitedOutput(io.StringIO):
+    """StringIO that silently drops output beyond a size limit."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__()
+        self.limit = limit
+        self.truncated = False
+
+    def write(self, text: str) -> int:
+        room = self.limit - self.tell()
+        if len(text) > room:
+            self.truncated = True
+            text = text[:max(room, 0)]
+        return super().write(text)
+
+
+def _apply_limits(limits: dict) -> None:
+    """Lower the CPU, memory, file size and process limits of this process."""
+    try:
+        import resource
+    except ImportError:
+        # Windows: the parent's wall-clock timeout is the only hard limit
+        return
+
+    def set_limit(kind: int, value: int) -> None:
+        _, hard = resource.getrlimit(kind)
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        try:
+            resource.setrlimit(kind, (value, value))
+        except (ValueError, OSError):
+            pass
+
+    set_limit(resource.RLIMIT_CPU, int(limits.get("cpu_seconds", 2)))
+    set_limit(resource.RLIMIT_AS, int(limits.get("memory_bytes", 256 * 1024 * 1024)))
+    # No files written, no child processes
+    set_limit(resource.RLIMIT_FSIZE, 0)
+    if hasattr(resource, "RLIMIT_NPROC"):
+        set_limit(resource.RLIMIT_NPROC, 0)
+
+
+def _error_line(exc: BaseException) -> int:
+    """Line of the learner's code where an exception was raised, or 0."""
+    if isinstance(exc, SyntaxError) and exc.filename == CODE_FILENAME:
+        return exc.lineno or 0
+    frames = [f for f in traceback.extract_tb(exc.__traceback__) if f.filename == CODE_FILENAME]
+    return frames[-1].lineno if frames else 0
+
+
+def run_job(job: dict) -> dict:
+    """
+    Run one job in this process.
+
+    input() reads from the job's stdin fixture and does not echo its
+    prompt, so the output only contains what the program prints. An
+    assertion snippet, if any, runs afterwards in the code's namespace.
+
+    Args:
+        job: Dict with keys code, stdin, assertion and max_output
+
+    Returns:
+        Dict with keys status ("ok", "error" or "assertion_failed"),
+        stdout, error, line, truncated
+    """
+    stdin = io.StringIO(job.get("stdin", ""))
+    output = _LimitedOutput(int(job.get("max_output", 64 * 1024)))
+
+    def sandbox_input(prompt: str = "") -> str:
+        line = stdin.readline()
+        if not line:
+            raise EOFError("EOF when reading a line")
+        return line.rstrip("\n")
+
+    status, error, line = "ok", "", 0
+    saved = sys.stdin, sys.stdout, sys.stderr, builtins.input
+    sys.stdin, sys.stdout, sys.stderr = stdin, output, output
+    builtins.input = sandbox_input
+    namespace = {"__name__": "__main__", "__builtins__": builtins}
+    try:
+        code = compile(job.get("code", ""), CODE_FILENAME, "exec")
+        exec(code, namespace)
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            status, error = "error", f"SystemExit: {exc.code}"
+    except BaseException as exc:
+        status = "error"
+        error = "".join(traceback.format_exception_only(type(exc), exc)).strip().splitlines()[-1]
+        line = _error_line(exc)
+    finally:
+        sys.stdin, sys.stdout, sys.stderr, builtins.input = saved
+
+    assertion = job.get("assertion", "")
+    if status == "ok" and assertion:
+        try:
+            exec(compile(assertion, TEST_FILENAME, "exec"), namespace)
+        except AssertionError as exc:
+            status, error = "assertion_failed", str(exc) or assertion.strip().splitlines()[-1]
+        except Exception as exc:
+            status, error = "assertion_failed", f"{type(exc).__name__}: {exc}"
+
+    return {
+        "status": status,
+        "stdout": output.getvalue(),
+        "error": error,
+        "line": line,
+        "truncated": output.truncated,
+    }
+
+
+def main() -> int:
+    """Read one job from stdin, run it and write its result to stdout."""
+    for name in PRELOADED_MODULES:
+        __import__(name)
+
+    line = sys.stdin.readline()
+    if not line:
+        return 1
+    job = json.loads(line)
+    _apply_limits(job.get("limits", {}))
+    result = run_job(job)
+    sys.stdout.write(json.dumps(result) + "\n")
+    sys.stdout.flush()
+    # The worker is single-use: skip interpreter finalization, which would
+    # otherwise delay the parent waiting for the process to end
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
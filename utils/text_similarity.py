@@ -0,0 +1,265 @@
+# text_similarity.py
+# Edit-distance based text similarity for typing and exercise feedback.
+# Uses Myers' O(ND) diff, so cost grows with the number of differences
+# rather than with the length of the texts. Past a budget of differences,
+# texts are aligned line by line first, so a comparison stays fast enough
+# for the GUI thread however long the texts are.
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+# (start, end) half-open character range
+Span = Tuple[int, int]
+
+# Most edits explored by one character-level diff: Myers costs about
+# D² / 2 steps, so this keeps each diff in the tens of milliseconds.
+# Texts differing more are aligned line by line, then each group of
+# differing lines is diffed within this budget.
+MAX_EDITS = 300
+
+
+@dataclass(frozen=True)
+class SimilarityResult:
+    """Outcome of comparing a typed text against a target text.
+
+    Attributes:
+        ratio: 2 * matching characters / total characters, in [0, 1].
+            When the comparison stopped early this is an upper bound.
+        distance: Number of inserted plus deleted characters, or None if
+            the comparison stopped early because min_ratio could not be
+            met, or could not be decided within the edit budget. Past
+            max_edits differences the diff is aligned line by line, and
+            this is an upper bound (the ratio a lower bound).
+        target_mismatches: Ranges of the target that were not typed.
+        typed_mismatches: Ranges of the typed text that are not in the target.
+    """
+    ratio: float
+    distance: Optional[int]
+    target_mismatches: List[Span] = field(default_factory=list)
+    typed_mismatches: List[Span] = field(default_factory=list)
+
+    @property
+    def exceeded_threshold(self) -> bool:
+        """Whether the comparison stopped before computing an exact diff."""
+        return self.distance is None
+
+
+def compare_texts(target: str, typed: str, min_ratio: float = 0.0,
+                  max_edits: int = MAX_EDITS) -> SimilarityResult:
+    """
+    Compare a typed text with its target.
+
+    A missing or extra character only affects the characters around it,
+    unlike a positional comparison where everything after it mismatches.
+
+    Args:
+        target: The expected text
+        typed: The text entered by the learner
+        min_ratio: Stop early once the similarity is known to be below this
+        max_edits: Edit budget of one character-level diff; beyond it the
+            texts are aligned line by line
+
+    Returns:
+        SimilarityResult with the ratio and the exact mismatch ranges
+    """
+    total = len(target) + len(typed)
+    if total == 0:
+        return SimilarityResult(1.0, 0)
+
+    # Largest edit distance that still reaches min_ratio
+    # (the epsilon absorbs float error, e.g. (1 - 0.8) * 10 == 1.999...)
+    max_distance = int((1.0 - min_ratio) * total + 1e-9)
+
+    # Cheap lower bound: every surplus character must be inserted or deleted
+    target_counts = Counter(target)
+    typed_counts = Counter(typed)
+    lower_bound = sum(((target_counts - typed_counts) + (typed_counts - target_counts)).values())
+    if lower_bound > max_distance:
+        return SimilarityResult(_ratio(lower_bound, total), None)
+
+    # Common prefix and suffix never need diffing
+    prefix = _common_prefix_length(target, typed)
+    suffix = _common_suffix_length(target[prefix:], typed[prefix:])
+    target_core = target[prefix:len(target) - suffix]
+    typed_core = typed[prefix:len(typed) - suffix]
+
+    edits = _myers_edits(target_core, typed_core, min(max_distance, max_edits))
+    if edits is None and max_distance > max_edits:
+        # Too many differences for an exact diff in time: align lines first
+        edits = _line_edits(target_core, typed_core, max_distance, max_edits)
+    if edits is None:
+        return SimilarityResult(_ratio(min(max_distance, max_edits) + 1, total), None)
+
+    deleted, inserted = edits
+    distance = len(deleted) + len(inserted)
+    return SimilarityResult(
+        _ratio(distance, total),
+        distance,
+        _to_spans(deleted, prefix),
+        _to_spans(inserted, prefix),
+    )
+
+
+def first_mismatch_position(text: str, index: int) -> Tuple[int, int]:
+    """Convert a character index into a 1-based (line, column) pair."""
+    line = text.count("\n", 0, index) + 1
+    column = index - (text.rfind("\n", 0, index) + 1) + 1
+    return line, column
+
+
+# ----------------------------------------------------------------------
+# Internals
+# ----------------------------------------------------------------------
+
+def _ratio(distance: int, total: int) -> float:
+    """Similarity ratio for a given edit distance."""
+    return max(0.0, (total - distance) / total)
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Length of the common prefix of two strings."""
+    limit = min(len(a), len(b))
+    i = 0
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix_length(a: str, b: str) -> int:
+    """Length of the common suffix of two strings."""
+    limit = min(len(a), len(b))
+    i = 0
+    while i < limit and a[-1 - i] == b[-1 - i]:
+        i += 1
+    return i
+
+
+def _myers_edits(a: Sequence, b: Sequence, max_d: int) -> Optional[Tuple[List[int], List[int]]]:
+    """
+    Shortest edit script between a and b (Myers, 1986), strings or lists of lines.
+
+    Returns:
+        (indices deleted from a, indices inserted from b), or None if more
+        than max_d edits are needed.
+    """
+    n, m = len(a), len(b)
+    max_d = min(max_d, n + m)
+    offset = max_d + 1
+    # v[k + offset] = furthest x reached on diagonal k = x - y
+    v = [0] * (2 * offset + 1)
+    # trace[d] = v restricted to diagonals -d..d after round d
+    trace = []
+
+    found = None
+    for d in range(max_d + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1 + offset] < v[k + 1 + offset]):
+                x = v[k + 1 + offset]       # step down: insert b[y - 1]
+            else:
+                x = v[k - 1 + offset] + 1   # step right: delete a[x - 1]
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k + offset] = x
+            if x >= n and y >= m:
+                found = d
+                break
+        trace.append(v[offset - d:offset + d + 1])
+        if found is not None:
+            break
+
+    if found is None:
+        return None
+
+    # Walk the trace backwards to recover the edits
+    deleted, inserted = [], []
+    x, y = n, m
+    for d in range(found, 0, -1):
+        previous = trace[d - 1]   # index of diagonal k is k + d - 1
+        k = x - y
+        if k == -d or (k != d and previous[k - 1 + d - 1] < previous[k + 1 + d - 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = previous[prev_k + d - 1]
+        prev_y = prev_x - prev_k
+        if prev_k == k + 1:
+            inserted.append(prev_y)
+        else:
+            deleted.append(prev_x)
+        x, y = prev_x, prev_y
+
+    deleted.reverse()
+    inserted.reverse()
+    return deleted, inserted
+
+
+def _line_edits(a: str, b: str, max_distance: int,
+                max_edits: int) -> Optional[Tuple[List[int], List[int]]]:
+    """
+    Edit script between a and b found line by line, not always the shortest.
+
+    Lines are matched first; each group of differing lines is then diffed
+    character by character within max_edits, or counted as fully replaced
+    when it differs more.
+
+    Returns:
+        (indices deleted from a, indices inserted from b), or None if the
+        script found has more than max_distance edits
+    """
+    a_lines = a.splitlines(keepends=True)
+    b_lines = b.splitlines(keepends=True)
+    line_edits = _myers_edits(a_lines, b_lines, min(max_distance, max_edits))
+    if line_edits is None:
+        return None
+    deleted_lines, inserted_lines = set(line_edits[0]), set(line_edits[1])
+
+    deleted: List[int] = []
+    inserted: List[int] = []
+    i = j = 0               # Current line of a and of b
+    a_start = b_start = 0   # Offset of these lines in a and b
+    while i < len(a_lines) or j < len(b_lines):
+        if i not in deleted_lines and j not in inserted_lines:
+            # Matching lines
+            a_start += len(a_lines[i])
+            b_start += len(b_lines[j])
+            i += 1
+            j += 1
+            continue
+
+        # Group of differing lines, up to the next matching pair
+        a_end, b_end = i, j
+        while a_end in deleted_lines:
+            a_end += 1
+        while b_end in inserted_lines:
+            b_end += 1
+        a_part = "".join(a_lines[i:a_end])
+        b_part = "".join(b_lines[j:b_end])
+
+        budget = max_distance - len(deleted) - len(inserted)
+        edits = _myers_edits(a_part, b_part, min(budget, max_edits))
+        if edits is None:
+            edits = range(len(a_part)), range(len(b_part))
+        deleted.extend(a_start + index for index in edits[0])
+        inserted.extend(b_start + index for index in edits[1])
+        if len(deleted) + len(inserted) > max_distance:
+            return None
+
+        a_start += len(a_part)
+        b_start += len(b_part)
+        i, j = a_end, b_end
+    return deleted, inserted
+
+
+def _to_spans(indices: List[int], shift: int) -> List[Span]:
+    """Merge sorted indices into (start, end) ranges, shifted by `shift`."""
+    spans: List[Span] = []
+    for index in indices:
+        position = index + shift
+        if spans and spans[-1][1] == position:
+            spans[-1] = (spans[-1][0], position + 1)
+        else:
+            spans.append((position, position + 1))
+    return spans
@@ -0,0 +1,125 @@
+# typing_comparator.py
+# Incremental, cursor-aligned comparison of typed text against a target,
+# updated per keystroke from the edited span only.
+
+from typing import List, Tuple
+
+# (start, end, is_error) half-open character range to restyle
+FormatRange = Tuple[int, int, bool]
+
+
+class IncrementalTypingComparator:
+    """Tracks which typed characters differ from the target at the same position.
+
+    apply_change() takes the span reported by the editor for each edit and
+    returns only the ranges whose error state changed, so the caller can
+    restyle those ranges instead of the whole document.
+    """
+
+    def __init__(self, target: str = "") -> None:
+        self.reset(target)
+
+    def reset(self, target: str, typed: str = "") -> None:
+        """Start over with a new target and, optionally, existing typed text."""
+        self.target = target
+        self.typed = typed
+        # One byte per typed character: 1 if it differs from the target
+        self._errors = self._compute_errors(0, len(typed))
+        self.error_count = self._errors.count(1)
+
+    # ------------------------------------------------------------------
+    # State queries
+    # ------------------------------------------------------------------
+
+    @property
+    def typed_length(self) -> int:
+        """Number of characters typed so far."""
+        return len(self.typed)
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the typed text matches the target exactly."""
+        return self.typed == self.target
+
+    def is_error(self, index: int) -> bool:
+        """Whether the typed character at `index` differs from the target."""
+        return bool(self._errors[index])
+
+    def full_ranges(self) -> List[FormatRange]:
+        """Ranges covering the whole typed text, for a full restyle."""
+        return self._runs(0, self._errors)
+
+    # ------------------------------------------------------------------
+    # Incremental update
+    # ------------------------------------------------------------------
+
+    def apply_change(self, position: int, removed: int, inserted: str) -> List[FormatRange]:
+        """
+        Apply one edit and return the ranges that must be restyled.
+
+        Args:
+            position: Index where the edit starts
+            removed: Number of characters removed at position
+            inserted: Text inserted at position
+
+        Returns:
+            List of (start, end, is_error) ranges, in the new text coordinates
+        """
+        added = len(inserted)
+        old_errors = self._errors
+        self.typed = self.typed[:position] + inserted + self.typed[position + removed:]
+
+        if added == removed:
+            # Same length: characters after the edit keep their positions
+            new_span = self._compute_errors(position, position + added)
+            self._errors[position:position + added] = new_span
+            self.error_count = self._errors.count(1)
+            return self._runs(position, new_span)
+
+        # Characters after the edit moved; re-align them with the target
+        new_tail = self._compute_errors(position, len(self.typed))
+        self._errors = old_errors[:position] + new_tail
+        self.error_count = self._errors.count(1)
+
+        # Inserted characters inherit their neighbour's style: always restyle
+        ranges = self._runs(position, new_tail[:added])
+
+        # Moved characters carry their old style: restyle only where it changed
+        old_tail = old_errors[position + removed:]
+        run_start = None
+        for offset in range(len(old_tail)):
+            index = position + added + offset
+            changed = new_tail[added + offset] != old_tail[offset]
+            if changed and run_start is None:
+                run_start = index
+            elif not changed and run_start is not None:
+                ranges.extend(self._runs(run_start, self._errors[run_start:index]))
+                run_start = None
+        if run_start is not None:
+            ranges.extend(self._runs(run_start, self._errors[run_start:]))
+        return ranges
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _compute_errors(self, start: int, end: int) -> bytearray:
+        """Error flags for typed[start:end] against the target."""
+        target = self.target
+        typed = self.typed
+        target_length = len(target)
+        return bytearray(
+            0 if i < target_length and typed[i] == target[i] else 1
+            for i in range(start, end)
+        )
+
+    @staticmethod
+    def _runs(start: int, flags: bytearray) -> List[FormatRange]:
+        """Split flags into runs of equal error state starting at `start`."""
+        runs: List[FormatRange] = []
+        run_start = 0
+        for i in range(1, len(flags) + 1):
+            if i == len(flags) or flags[i] != flags[run_start]:
+                runs.append((start + run_start, start + i, bool(flags[run_start])))
+                run_start = i
+        return runs
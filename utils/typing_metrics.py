@@ -0,0 +1,147 @@
+# typing_metrics.py
+# Keystroke timing capture and session metrics for typing tasks.
+# Keystrokes go into preallocated fixed-size arrays used as a ring buffer,
+# so recording a key is a couple of array stores and never allocates.
+
+from array import array
+from dataclasses import dataclass
+from typing import List
+
+# Flags stored per keystroke
+KEY_CORRECT = 1
+KEY_ERROR = 0
+KEY_CORRECTION = -1
+
+# Standard word length used to convert characters into words
+CHARS_PER_WORD = 5
+
+
+@dataclass(frozen=True)
+class TypingSessionMetrics:
+    """Summary of one typing attempt.
+
+    Attributes:
+        duration_ms: Time between the first and the last keystroke
+        wpm: Correct characters per minute, divided by 5
+        accuracy: Correct character keystrokes / character keystrokes, in [0, 1]
+        error_rate: Erroneous keystrokes per character of the target text
+        mean_latency_ms: Mean time between two keystrokes
+        hesitation_ms: 90th percentile of the time between two keystrokes
+        keystrokes: Character keystrokes (deletions excluded)
+        errors: Character keystrokes that did not match the target
+        corrections: Deletions
+    """
+    duration_ms: float
+    wpm: float
+    accuracy: float
+    error_rate: float
+    mean_latency_ms: float
+    hesitation_ms: float
+    keystrokes: int
+    errors: int
+    corrections: int
+
+
+class KeystrokeRecorder:
+    """Ring buffer of keystroke timestamps and correctness flags.
+
+    Totals (keystrokes, errors, corrections, first and last timestamps) are
+    running counters and stay exact when the buffer wraps; latency
+    statistics cover the last `capacity` keystrokes.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self.capacity = capacity
+        self._times = array('d', bytes(8 * capacity))
+        self._flags = array('b', bytes(capacity))
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all keystrokes; the buffers are reused, not reallocated."""
+        self._next = 0
+        self._count = 0
+        self.keystrokes = 0
+        self.errors = 0
+        self.corrections = 0
+        self._first_time = 0.0
+        self._last_time = 0.0
+
+    def record(self, timestamp: float, flag: int) -> None:
+        """
+        Record one keystroke.
+
+        Args:
+            timestamp: time.perf_counter() value, in seconds
+            flag: KEY_CORRECT, KEY_ERROR or KEY_CORRECTION
+        """
+        index = self._next
+        self._times[index] = timestamp
+        self._flags[index] = flag
+        self._next = index + 1 if index + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+
+        if self.keystrokes == 0 and self.corrections == 0:
+            self._first_time = timestamp
+        self._last_time = timestamp
+
+        if flag == KEY_CORRECTION:
+            self.corrections += 1
+        else:
+            self.keystrokes += 1
+            if flag == KEY_ERROR:
+                self.errors += 1
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether no keystroke has been recorded since the last reset."""
+        return self._count == 0
+
+    def timestamps(self) -> List[float]:
+        """Buffered timestamps, oldest first."""
+        if self._count < self.capacity:
+            return self._times[:self._count].tolist()
+        return self._times[self._next:].tolist() + self._times[:self._next].tolist()
+
+    def intervals_ms(self) -> array:
+        """Time between consecutive buffered keystrokes, in milliseconds."""
+        times = self.timestamps()
+        return array('f', [(b - a) * 1000.0 for a, b in zip(times, times[1:])])
+
+    def metrics(self, target_length: int, correct_chars: int) -> TypingSessionMetrics:
+        """
+        Compute the metrics of the attempt recorded so far.
+
+        Args:
+            target_length: Length of the text to type
+            correct_chars: Characters of the final input matching the target
+
+        Returns:
+            TypingSessionMetrics for the attempt
+        """
+        duration_ms = (self._last_time - self._first_time) * 1000.0
+        minutes = duration_ms / 60000.0
+        wpm = (correct_chars / CHARS_PER_WORD) / minutes if minutes > 0 else 0.0
+
+        keystrokes = self.keystrokes
+        accuracy = (keystrokes - self.errors) / keystrokes if keystrokes else 0.0
+        error_rate = self.errors / target_length if target_length else 0.0
+
+        intervals = sorted(self.intervals_ms())
+        if intervals:
+            mean_latency_ms = sum(intervals) / len(intervals)
+            hesitation_ms = intervals[int(0.9 * (len(intervals) - 1))]
+        else:
+            mean_latency_ms = hesitation_ms = 0.0
+
+        return TypingSessionMetrics(
+            duration_ms=duration_ms,
+            wpm=wpm,
+            accuracy=accuracy,
+            error_rate=error_rate,
+            mean_latency_ms=mean_latency_ms,
+            hesitation_ms=hesitation_ms,
+            keystrokes=keystrokes,
+            errors=self.errors,
+            corrections=self.corrections,
+        )